@@ -0,0 +1,46 @@
+# algorithms/__init__.py
+"""
+Algorithm registry: maps an --algo name to the module and function that
+implement it. Modules are only imported on first use, so a run pays for
+the algorithms it actually needs and nothing else.
+"""
+import importlib
+
+# name -> (module, solver function, options passed after the process list, in order)
+REGISTRY = {
+    'FCFS': ('algorithms.fcfs', 'solve_fcfs', ()),
+    'SJF': ('algorithms.sjf', 'solve_sjf', ()),
+    'SRTF': ('algorithms.srtf', 'solve_srtf', ()),
+    'RR': ('algorithms.rr', 'solve_rr', ('quantum', 'coalesce')),
+    'PRIO_NP': ('algorithms.priority_np', 'solve_priority_np', ()),
+    'PRIO_P': ('algorithms.priority_p', 'solve_priority_p', ('aging',)),
+    'CFS': ('algorithms.cfs', 'solve_cfs', ('target_latency', 'min_granularity')),
+    'MLFQ': ('algorithms.mlfq', 'solve_mlfq', ('mlfq_quanta', 'boost_interval')),
+}
+
+def register(name, module, function, options=()):
+    """
+    Adds an algorithm without importing it. The solver must follow the usual
+    contract: solver(processes, *options, observer=None, record_gantt=True)
+    returning (processes, gantt_log).
+    """
+    REGISTRY[name] = (module, function, tuple(options))
+
+def algorithm_names():
+    return list(REGISTRY)
+
+def get_solver(name):
+    """Imports (once) and returns the solve_* function registered as name."""
+    module, function, _ = REGISTRY[name]
+    return getattr(importlib.import_module(module), function)
+
+def solver_options(name):
+    """Names of the options the solver takes after the process list, e.g. ('quantum', 'coalesce')."""
+    return REGISTRY[name][2]
+
+def solver_defaults(name):
+    """Default values of the solver's options, e.g. {'coalesce': False} (quantum has none)."""
+    import inspect
+    parameters = list(inspect.signature(get_solver(name)).parameters.values())[1:]
+    return {option: p.default for option, p in zip(solver_options(name), parameters)
+            if p.default is not p.empty}
@@ -0,0 +1,270 @@
+# algorithms/batched.py
+"""
+Batched FCFS / SJF for what-if analysis: thousands of small workloads
+(e.g. the same trace with perturbed burst estimates) are evaluated at once
+with NumPy instead of one solve_* call and one Process object per job.
+Workloads are 2-D arrays of shape (workloads, processes); column j is the
+same process in every workload, so the PIDs (used for tie-breaks) are shared.
+The schedules and metrics are the same as solve_fcfs and solve_sjf
+(checked by benchmarks/verify_batched.py).
+"""
+from functools import cached_property
+import numpy as np
+
+class BatchResult:
+    """
+    Result of a batch run. Internally the jobs of every workload are kept in
+    policy order and process-major, shape (processes, workloads); the averages
+    are computed from that directly (a sum does not depend on the order).
+    The per-process columns are put back in input order, shape
+    (workloads, processes), on first access.
+    """
+    def __init__(self, order, arrival, burst, start):
+        self._order = order  # Column of the k-th job in policy order, per workload (or shared)
+        self._arrival = arrival
+        self._burst = burst
+        self._start = start
+
+    def __len__(self):
+        return self._start.shape[1]
+
+    def __repr__(self):
+        return f"BatchResult(workloads={self._start.shape[1]}, processes={self._start.shape[0]})"
+
+    def _column(self, values):
+        # Process-major policy order -> (workloads, processes) input order
+        out = np.empty(values.shape[::-1], dtype=np.int64)
+        if self._order.ndim == 1:
+            out[:, self._order] = values.T
+        else:
+            np.put_along_axis(out, self._order, values.T, axis=1)
+        return out
+
+    @cached_property
+    def start_time(self):
+        return self._column(self._start)
+
+    @cached_property
+    def completion_time(self):
+        return self._column(self._start + self._burst)
+
+    # Same formulas as the solvers
+    @cached_property
+    def turnaround_time(self):
+        return self.completion_time - self._column(self._arrival)
+
+    @cached_property
+    def waiting_time(self):
+        return self.start_time - self._column(self._arrival)
+
+    @cached_property
+    def response_time(self):
+        # Non-preemptive: a job waits exactly until its single dispatch
+        return self.waiting_time.copy()
+
+    def average_metrics(self):
+        """(avg_turnaround, avg_waiting, avg_response), each an array with one value per workload."""
+        n = self._start.shape[0]
+        if n == 0:
+            zeros = np.zeros(self._start.shape[1])
+            return zeros, zeros, zeros
+        avg_waiting = (self._start.sum(axis=0) - self._arrival.sum(axis=0)) / n
+        avg_turnaround = avg_waiting + self._burst.sum(axis=0) / n
+        return avg_turnaround, avg_waiting, avg_waiting.copy()
+
+    def makespan(self):
+        """Completion time of the last process in each workload."""
+        if self._start.shape[0] == 0:
+            return np.zeros(self._start.shape[1], dtype=np.int64)
+        return (self._start + self._burst).max(axis=0).astype(np.int64)
+
+def stack_processes(workloads):
+    """
+    Turns a list of workloads (lists of Process objects with the same PIDs in
+    the same order) into (pids, arrivals, bursts) for batch_fcfs / batch_sjf.
+    """
+    if not workloads:
+        raise ValueError("no workloads given")
+    pids = [p.pid for p in workloads[0]]
+    for processes in workloads:
+        if [p.pid for p in processes] != pids:
+            raise ValueError("every workload must list the same PIDs in the same order")
+    arrivals = np.array([[p.arrival_time for p in processes] for processes in workloads], dtype=np.int64)
+    bursts = np.array([[p.burst_time for p in processes] for processes in workloads], dtype=np.int64)
+    return pids, arrivals, bursts
+
+def _pid_rank(pids, n):
+    """
+    Rank of each column in PID order, the solvers' last tie-break, or None
+    when that is simply the column order. The stable sort keeps duplicate
+    PIDs in column order, like the solvers do.
+    """
+    if pids is None:
+        return None
+    if len(pids) != n:
+        raise ValueError(f"{len(pids)} PIDs for {n} processes")
+    by_pid = np.argsort(np.asarray(pids, dtype=str), kind='stable')
+    if np.array_equal(by_pid, np.arange(n)):
+        return None
+    rank = np.empty(n, dtype=np.int64)
+    rank[by_pid] = np.arange(n)
+    return rank
+
+def _sort_jobs(keys, columns, w, n, dtype):
+    """
+    Ordering pass: sorts the jobs of every workload by keys (most significant
+    first, then column index) and returns (order, columns), where order[i, k]
+    is the column of the k-th job of workload i (1-D when the keys are
+    shared by every workload) and the requested columns are
+    rearranged the same way, process-major: shape (processes, workloads).
+    Keys and columns are bit-packed into one integer per job, the column
+    index below the keys and any other values below it. The column index is
+    unique, so a plain np.sort of the packed values gives the order, and every
+    value is read back with a shift and a mask (much cheaper than argsort and
+    fancy-index gathers on many short rows). Shared 1-D keys are sorted once.
+    """
+    keys = [key for key in keys if key is not None]
+    if n == 0 or w == 0:
+        return np.zeros((w, n), dtype=np.intp), [np.zeros((n, w), dtype=dtype) for _ in columns]
+    if all(key.ndim == 1 for key in keys):
+        order = np.lexsort((np.arange(n), *reversed(keys)))
+        return order, [np.broadcast_to(column, (w, n)).T[order].astype(dtype) for column in columns]
+
+    # Bit fields of a packed value: the keys, the column index (None), then
+    # the columns that are not keys. Sizes are measured in Python ints.
+    fields = keys + [None] + [column for column in columns if not any(column is key for key in keys)]
+    layout = [(field, (n - 1 if field is None else int(field.max())).bit_length()) for field in fields]
+    total_bits = sum(bits for _, bits in layout)
+
+    if min(int(key.min()) for key in keys) < 0 or total_bits > 63:
+        # Negative or too wide to pack: argsort the rows and gather the slow way
+        *keys, index = np.broadcast_arrays(*keys, np.arange(n))
+        order = np.lexsort((index, *reversed(keys)), axis=1)
+        return order, [np.take_along_axis(np.broadcast_to(column, (w, n)), order, axis=1).T.astype(dtype, order='C')
+                       for column in columns]
+
+    packed = np.empty((w, n), dtype=np.int32 if total_bits <= 31 else np.int64)
+    packed[...] = layout[0][0]
+    for field, bits in layout[1:]:
+        packed <<= bits
+        packed |= np.arange(n) if field is None else field
+    packed = np.ascontiguousarray(np.sort(packed, axis=1).T)
+    index_type = np.uint8 if n <= 2**8 else np.int16 if n <= 2**15 else np.intp
+
+    # Read the fields back from the sorted values, straight into process-major arrays
+    unpacked = {}
+    shift = 0
+    for field, bits in reversed(layout):
+        values = np.empty((n, w), dtype=index_type if field is None else dtype)
+        np.right_shift(packed, shift, out=values, casting='unsafe')
+        values &= (1 << bits) - 1
+        unpacked[id(field)] = values
+        shift += bits
+    return unpacked[id(None)].T, [unpacked[id(column)] for column in columns]
+
+def _prepare(arrivals, bursts):
+    """
+    Validates the inputs (1-D ones are shared by every workload, e.g. fixed
+    arrivals and perturbed bursts) and converts them to the integer type of
+    the run: int32 when no time can reach 2**31, which halves the memory traffic.
+    """
+    arrivals = np.asarray(arrivals, dtype=np.int64)
+    bursts = np.asarray(bursts, dtype=np.int64)
+    shape = np.broadcast_shapes(arrivals.shape, bursts.shape)
+    if len(shape) != 2:
+        raise ValueError("workloads must be 2-D arrays of shape (workloads, processes)")
+    dtype = np.int64
+    if arrivals.size and bursts.size and min(int(arrivals.min()), int(bursts.min())) >= 0:
+        if int(arrivals.max()) + shape[1] * int(bursts.max()) < 2**31:
+            dtype = np.int32
+    return arrivals.astype(dtype, copy=False), bursts.astype(dtype, copy=False), shape, dtype
+
+def batch_fcfs(arrivals, bursts, pids=None):
+    """
+    FCFS over a whole batch. In (arrival, PID) order the completion times
+    follow the recurrence
+        completion[k] = max(completion[k-1], arrival[k]) + burst[k]
+    which is evaluated one process position at a time for all workloads
+    together: a few vector operations per position, no per-job Python code.
+    """
+    arrivals, bursts, (w, n), dtype = _prepare(arrivals, bursts)
+
+    # Step 1: Run order (arrival, then PID), like solve_fcfs
+    order, (a, b) = _sort_jobs([arrivals, _pid_rank(pids, n)], [arrivals, bursts], w, n, dtype)
+
+    # Step 2: The recurrence, vectorized over the workloads (the CPU starts at t=0)
+    start = np.empty((n, w), dtype=dtype)
+    clock = np.zeros(w, dtype=dtype)
+    for k in range(n):
+        np.maximum(clock, a[k], out=start[k])
+        np.add(start[k], b[k], out=clock)
+
+    return BatchResult(order, a, b, start)
+
+def batch_nonpreemptive(arrivals, bursts, primary=None, pids=None):
+    """
+    Non-preemptive scheduling with key (primary, arrival, PID), for a batch;
+    primary defaults to the burst times (SJF).
+    After the ordering pass "the best arrived job" is the first not-yet-run
+    one with arrival <= clock, and each step dispatches one job in every
+    workload at the same time: n steps of O(workloads x n) vector work, which
+    suits many small workloads (a single long trace is better off with
+    solve_sjf and its heap). benchmarks/batched.py measures the speedup over
+    a solve_sjf loop.
+    """
+    arrivals, bursts, (w, n), dtype = _prepare(arrivals, bursts)
+
+    # Step 1: Ordering pass by the policy key
+    primary = bursts if primary is None else np.asarray(primary, dtype=np.int64)
+    order, (a, b) = _sort_jobs([primary, arrivals, _pid_rank(pids, n)], [arrivals, bursts], w, n, dtype)
+
+    if w == 0:
+        return BatchResult(order, a, b, np.zeros((n, 0), dtype=dtype))
+
+    # Arrival times, in the narrowest type that holds them (the scan below
+    # reads the whole window every step); done once the job has run. The
+    # clock is compared capped at done - 1, which keeps the comparison exact
+    last = int(a.max()) if a.size else 0
+    pending_type = next(t for t in (np.int8, np.int16, np.int32, np.int64) if last < np.iinfo(t).max)
+    done = np.iinfo(pending_type).max
+    pending = a.astype(pending_type)
+    pending_flat = pending.reshape(-1)
+    cols = np.arange(w)
+    # Weight n - k for the k-th job: the largest weight among the arrived
+    # jobs marks the first one in key order (cheaper than argmax over axis 0)
+    weight_type = np.uint8 if n < 2**8 else np.int16 if n < 2**15 else np.intp
+    weights = np.arange(n, 0, -1, dtype=weight_type)[:, None]
+    clock = np.zeros(w, dtype=dtype)
+    capped = np.empty(w, dtype=pending_type)
+    first = 0  # Jobs before this key position have run in every workload
+
+    # Row s holds the s-th dispatch of every workload: whole rows are written
+    # per step, the start times are scattered to key order once at the end
+    picks = np.empty((n, w), dtype=np.intp)
+    dispatch = np.empty((n, w), dtype=dtype)
+
+    for step in range(n):
+        while pending[first].min() == done:
+            first += 1
+        window = pending[first:]
+
+        # Step 2: An idle CPU jumps to the next arrival; a busy one keeps its clock
+        np.maximum(clock, window.min(axis=0), out=clock)
+
+        # Step 3: The first arrived job in key order runs to completion
+        np.minimum(clock, done - 1, out=capped, casting='unsafe')
+        pick = picks[step]
+        np.subtract(n, ((window <= capped) * weights[first:]).max(axis=0), out=pick)
+        pick *= w
+        pick += cols
+        dispatch[step] = clock
+        clock += b.take(pick, mode='clip')
+        pending_flat[pick] = done
+
+    start = np.empty((n, w), dtype=dtype)
+    start.reshape(-1)[picks.reshape(-1)] = dispatch.reshape(-1)
+    return BatchResult(order, a, b, start)
+
+def batch_sjf(arrivals, bursts, pids=None):
+    """SJF (non-preemptive) for a batch: shortest burst first, then arrival, then PID."""
+    return batch_nonpreemptive(arrivals, bursts, pids=pids)
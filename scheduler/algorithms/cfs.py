@@ -0,0 +1,141 @@
+# algorithms/cfs.py
+import heapq
+from utils.timeline_store import new_timeline
+
+# Linux load weights for nice -20..19 (sched_prio_to_weight); nice 0 = 1024.
+# Each nice level is worth about 10% CPU compared to its neighbour.
+NICE_0_WEIGHT = 1024
+VRUNTIME_SHIFT = 16
+PRIO_TO_WEIGHT = [
+    88761, 71755, 56483, 46273, 36291,
+    29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906,
+    3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423,
+    335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45,
+    36, 29, 23, 18, 15,
+]
+
+def priority_weight(priority):
+    """Maps the priority field to a CFS weight, treating it as a nice value (clamped to -20..19)."""
+    nice = min(max(priority, -20), 19)
+    return PRIO_TO_WEIGHT[nice + 20]
+
+def solve_cfs(processes, target_latency=20, min_granularity=2, observer=None, record_gantt=True):
+    """
+    CFS (Completely Fair Scheduler) style Implementation - Preemptive.
+    Every process accumulates virtual runtime: real CPU time scaled by
+    NICE_0_WEIGHT / weight (in 16-bit fixed point, like the kernel), so
+    processes with a better (lower) priority value age slower and get a bigger
+    share. The runnable process with the smallest vruntime runs next, picked
+    from a heap in O(log n).
+
+    Timeslices split the target latency among the runnable processes in
+    proportion to their weight, but never drop below min_granularity (with many
+    processes the period stretches to runnable * min_granularity instead).
+    A new arrival waits for the current timeslice to end (no wakeup preemption)
+    and starts at the current minimum vruntime, so it cannot monopolize the
+    CPU to "catch up" on time it was not even present for.
+    See utils/observer.py for the observer hooks; record_gantt=False skips the Gantt log.
+    """
+    if target_latency < 1 or min_granularity < 1:
+        raise ValueError("target_latency and min_granularity must be at least 1")
+
+    for p in processes:
+        p.remaining_time = p.burst_time
+
+    current_time = 0
+    completed = 0
+    n = len(processes)
+    timeline = new_timeline(record_gantt) # Gantt segments (pid, start, end), see utils/timeline_store.py
+
+    weights = [priority_weight(p.priority) for p in processes]
+    # vruntime gained per time unit as an integer, so running k units at once
+    # adds exactly the same amount as k single units (no float drift)
+    vrate = [(NICE_0_WEIGHT << VRUNTIME_SHIFT) // w for w in weights]
+    vruntime = [0] * n
+    min_vruntime = 0
+    total_weight = 0 # Sum of the weights of all runnable processes
+
+    # Arrival cursor: indices sorted by arrival time (stable, so ties keep input order)
+    arrival_order = sorted(range(n), key=lambda i: processes[i].arrival_time)
+    next_arrival = 0
+    ready = [] # Heap keyed on (vruntime, arrival, pid, index)
+    running = None # Index of the process that currently holds the CPU
+    counters = getattr(observer, 'counters', None) # Only set when profiling
+
+    while completed < n:
+        # Step 1: Admit every arrived process at the current minimum vruntime
+        # (kept monotonic, so an idle gap does not reset it)
+        if ready:
+            min_vruntime = max(min_vruntime, ready[0][0])
+        while next_arrival < n and processes[arrival_order[next_arrival]].arrival_time <= current_time:
+            idx = arrival_order[next_arrival]
+            p = processes[idx]
+            vruntime[idx] = min_vruntime
+            total_weight += weights[idx]
+            heapq.heappush(ready, (min_vruntime, p.arrival_time, p.pid, idx))
+            if counters is not None: counters.on_push()
+            next_arrival += 1
+
+        if not ready:
+            # CPU is idle: skip directly to the next arrival
+            next_time = processes[arrival_order[next_arrival]].arrival_time
+            if observer: observer.on_idle(current_time, next_time)
+            current_time = next_time
+            continue
+
+        # Step 2: Pick the process with the smallest virtual runtime
+        if counters is not None: counters.on_decision(len(ready))
+        idx = heapq.heappop(ready)[3]
+        p = processes[idx]
+
+        if running != idx:
+            if observer:
+                if running is not None:
+                    observer.on_preempt(processes[running], current_time)
+                observer.on_dispatch(p, current_time)
+            running = idx
+
+        if p.start_time is None:
+            p.start_time = current_time
+
+        # Step 3: Weighted timeslice out of the scheduling period
+        runnable = len(ready) + 1
+        period = max(target_latency, runnable * min_granularity)
+        timeslice = max(min_granularity, period * weights[idx] // total_weight)
+        if ready:
+            run_until = current_time + min(timeslice, p.remaining_time)
+        else:
+            # Alone on the CPU: its timeslices run back to back until one of
+            # them ends at or after the next arrival, so simulate them in one step
+            run_until = current_time + p.remaining_time
+            if next_arrival < n:
+                gap = processes[arrival_order[next_arrival]].arrival_time - current_time
+                run_until = min(run_until, current_time + -(-gap // timeslice) * timeslice)
+
+        # Step 4: Record for Gantt Chart (the same process continuing is one segment)
+        if timeline is not None:
+            timeline.add_merged(p.pid, current_time, run_until)
+
+        delta = run_until - current_time
+        p.remaining_time -= delta
+        vruntime[idx] += delta * vrate[idx]
+        current_time = run_until
+
+        # Step 5: On finish, calculate stats, otherwise go back into the tree
+        if p.remaining_time == 0:
+            completed += 1
+            total_weight -= weights[idx]
+            p.completion_time = current_time
+            p.turnaround_time = p.completion_time - p.arrival_time
+            p.waiting_time = p.turnaround_time - p.burst_time
+            p.response_time = p.start_time - p.arrival_time
+            if observer: observer.on_complete(p, current_time)
+            running = None
+        else:
+            heapq.heappush(ready, (vruntime[idx], p.arrival_time, p.pid, idx))
+            if counters is not None: counters.on_push()
+
+    return processes, timeline
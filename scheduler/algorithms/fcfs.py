@@ -1,9 +1,12 @@
 # algorithms/fcfs.py
+from utils.timeline_store import PACK_SEGMENTS, new_timeline
 
-def solve_fcfs(processes):
+def solve_fcfs(processes, observer=None, record_gantt=True):
     """
     FCFS (First-Come First-Served) Implementation.
     Non-preemptive: Once a process starts, it runs until completion.
+    The optional observer is notified of every dispatch, completion and idle
+    period; with record_gantt=False no Gantt log is kept (None is returned).
     """
     
     # Step 1: Sort processes by arrival time, then by PID for ties.
@@ -11,15 +14,28 @@ def solve_fcfs(processes):
     processes.sort(key=lambda x: (x.arrival_time, x.pid))
     
     current_time = 0
-    gantt_output = [] # Format: (pid, start_time, end_time)
+    gantt_output = new_timeline(record_gantt) # Format: (pid, start_time, end_time)
+    segments = gantt_output.tail if gantt_output is not None else None # Appended to directly, see TimelineStore
+    counters = getattr(observer, 'counters', None) # Only set when profiling
+    arrived = 0 # Processes that have arrived so far (only tracked when profiling)
     
-    for p in processes:
+    for i, p in enumerate(processes):
         # Step 2: Handle Idle Time.
         # If the CPU is free but no process has arrived, skip to the arrival time.
         if current_time < p.arrival_time:
+            if observer: observer.on_idle(current_time, p.arrival_time)
             current_time = p.arrival_time
             
+        # The FCFS "ready queue" is every arrived process that has not started yet
+        if counters is not None:
+            admitted = arrived
+            while arrived < len(processes) and processes[arrived].arrival_time <= current_time:
+                arrived += 1
+            counters.on_push(arrived - admitted)
+            counters.on_decision(arrived - i)
+            
         # Step 3: Set timing metrics.
+        if observer: observer.on_dispatch(p, current_time)
         p.start_time = current_time
         p.completion_time = current_time + p.burst_time
         
@@ -34,9 +50,12 @@ def solve_fcfs(processes):
         p.response_time = p.start_time - p.arrival_time
         
         # Step 5: Save for Gantt chart generation.
-        gantt_output.append((p.pid, p.start_time, p.completion_time))
+        if segments is not None:
+            segments.append((p.pid, p.start_time, p.completion_time))
+            if len(segments) >= PACK_SEGMENTS: gantt_output.pack()
         
         # Advance clock to the end of current process.
         current_time = p.completion_time
+        if observer: observer.on_complete(p, current_time)
         
     return processes, gantt_output
\ No newline at end of file
@@ -0,0 +1,130 @@
+# algorithms/mlfq.py
+from collections import deque
+from utils.timeline_store import PACK_SEGMENTS, new_timeline
+
+def solve_mlfq(processes, quanta=(4, 8, 16), boost_interval=100, observer=None, record_gantt=True):
+    """
+    MLFQ (Multilevel Feedback Queue) Implementation - Preemptive.
+    There is one Round Robin queue per level, level 0 being the highest
+    priority, and quanta[k] is the time a process may use at level k.
+    - New processes enter level 0.
+    - A process that uses up its quantum at a level moves one level down
+      (giving up the CPU early does not reset that count, so it cannot be gamed).
+    - A new arrival preempts a process that runs below level 0.
+    - Every boost_interval time units all processes go back to level 0,
+      so long jobs cannot starve (boost_interval=0 turns this off).
+
+    A bitmap has bit k set while level k is non-empty, so the highest ready
+    level is found with one bit operation instead of scanning the queues.
+    A boost appends the lower queues to level 0 and resets the used time
+    lazily (per boost epoch), without a loop over every waiting process.
+    See utils/observer.py for the observer hooks; record_gantt=False skips the Gantt log.
+    """
+    for p in processes:
+        p.remaining_time = p.burst_time
+
+    current_time = 0
+    completed = 0
+    n = len(processes)
+    levels = len(quanta)
+    gantt_output = new_timeline(record_gantt) # Format: (pid, start, end)
+    segments = gantt_output.tail if gantt_output is not None else None # Appended to directly, see TimelineStore
+
+    queues = [deque() for _ in range(levels)]
+    bitmap = 0 # Bit k is set while queues[k] is non-empty
+
+    # Time used at the current level; only valid if used_epoch matches the boost count
+    used = [0] * n
+    used_epoch = [0] * n
+    boosts = 0
+    next_boost = boost_interval if boost_interval else None
+
+    # Arrival cursor in (arrival, pid) order, like Round Robin
+    arrival_order = sorted(range(n), key=lambda i: (processes[i].arrival_time, processes[i].pid))
+    next_arrival = 0
+    counters = getattr(observer, 'counters', None) # Only set when profiling
+
+    while completed < n:
+        # Step 1: New arrivals join the top level
+        while next_arrival < n and processes[arrival_order[next_arrival]].arrival_time <= current_time:
+            queues[0].append(arrival_order[next_arrival])
+            if counters is not None: counters.on_push()
+            bitmap |= 1
+            next_arrival += 1
+
+        # Step 2: Periodic boost - every waiting process moves back to level 0
+        if next_boost is not None and current_time >= next_boost:
+            for level in range(1, levels):
+                if queues[level]:
+                    # Every moved process leaves one queue and enters another
+                    if counters is not None: counters.on_move(len(queues[level]))
+                    queues[0].extend(queues[level])
+                    queues[level].clear()
+            bitmap = 1 if queues[0] else 0
+            boosts += 1
+            next_boost = (current_time // boost_interval + 1) * boost_interval
+
+        if not bitmap:
+            # CPU is idle: skip directly to the next arrival
+            next_time = processes[arrival_order[next_arrival]].arrival_time
+            if observer: observer.on_idle(current_time, next_time)
+            current_time = next_time
+            continue
+
+        # Step 3: Highest non-empty level = lowest set bit of the bitmap
+        level = (bitmap & -bitmap).bit_length() - 1
+        queue = queues[level]
+        if counters is not None: counters.on_decision(sum(len(q) for q in queues))
+        idx = queue.popleft()
+        if not queue:
+            bitmap &= ~(1 << level)
+        p = processes[idx]
+        if used_epoch[idx] != boosts:
+            used[idx] = 0 # A boost happened since this process last ran
+            used_epoch[idx] = boosts
+
+        if observer: observer.on_dispatch(p, current_time)
+        if p.start_time is None:
+            p.start_time = current_time
+
+        # Step 4: Run for the rest of the quantum of this level; below level 0 a
+        # new arrival or a boost cuts the slice short
+        run_until = current_time + min(quanta[level] - used[idx], p.remaining_time)
+        if level > 0:
+            if next_arrival < n:
+                run_until = min(run_until, processes[arrival_order[next_arrival]].arrival_time)
+            if next_boost is not None:
+                run_until = min(run_until, next_boost)
+
+        if segments is not None:
+            segments.append((p.pid, current_time, run_until))
+            if len(segments) >= PACK_SEGMENTS: gantt_output.pack()
+        p.remaining_time -= run_until - current_time
+        used[idx] += run_until - current_time
+        current_time = run_until
+
+        # Arrivals during the slice enter the queue before the current process is re-added
+        while next_arrival < n and processes[arrival_order[next_arrival]].arrival_time <= current_time:
+            queues[0].append(arrival_order[next_arrival])
+            if counters is not None: counters.on_push()
+            bitmap |= 1
+            next_arrival += 1
+
+        # Step 5: Finish, or go back in at the same level (or one lower if the quantum is used up)
+        if p.remaining_time == 0:
+            completed += 1
+            p.completion_time = current_time
+            p.turnaround_time = p.completion_time - p.arrival_time
+            p.waiting_time = p.turnaround_time - p.burst_time
+            p.response_time = p.start_time - p.arrival_time
+            if observer: observer.on_complete(p, current_time)
+        else:
+            if observer: observer.on_preempt(p, current_time)
+            if used[idx] >= quanta[level]:
+                level = min(level + 1, levels - 1)
+                used[idx] = 0
+            queues[level].append(idx)
+            if counters is not None: counters.on_push()
+            bitmap |= 1 << level
+
+    return processes, gantt_output
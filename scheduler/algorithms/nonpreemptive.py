@@ -0,0 +1,60 @@
+# algorithms/nonpreemptive.py
+import heapq
+from utils.timeline_store import PACK_SEGMENTS, new_timeline
+
+def solve_nonpreemptive(processes, key, observer=None, record_gantt=True):
+    """
+    Shared engine for the non-preemptive schedulers (SJF, Priority NP).
+    Processes enter a ready heap ordered by key(process) as they arrive; the
+    smallest entry runs to completion. Idle periods jump straight to the next arrival.
+    See utils/observer.py for the observer hooks; record_gantt=False skips the Gantt log.
+    """
+    n = len(processes)
+    current_time = 0
+    gantt_output = new_timeline(record_gantt) # Format: (pid, start, end)
+    segments = gantt_output.tail if gantt_output is not None else None # Appended to directly, see TimelineStore
+
+    # Arrival cursor: indices sorted by arrival time (stable, so ties keep input order)
+    arrival_order = sorted(range(n), key=lambda i: processes[i].arrival_time)
+    next_arrival = 0
+
+    # Ready heap of (policy key, index); the index breaks any remaining tie
+    # in input order, just like min() over the process list
+    ready = []
+    counters = getattr(observer, 'counters', None) # Only set when profiling
+
+    while next_arrival < n or ready:
+        # Step 1: Move every process that has arrived into the ready heap
+        while next_arrival < n and processes[arrival_order[next_arrival]].arrival_time <= current_time:
+            idx = arrival_order[next_arrival]
+            heapq.heappush(ready, (key(processes[idx]), idx))
+            if counters is not None: counters.on_push()
+            next_arrival += 1
+
+        if not ready:
+            # CPU is idle; jump to the next arrival time
+            next_time = processes[arrival_order[next_arrival]].arrival_time
+            if observer: observer.on_idle(current_time, next_time)
+            current_time = next_time
+            continue
+
+        # Step 2: Pick the best process according to the policy key
+        if counters is not None: counters.on_decision(len(ready))
+        p = processes[heapq.heappop(ready)[1]]
+
+        # Step 3: Set timing and calculate metrics
+        if observer: observer.on_dispatch(p, current_time)
+        p.start_time = current_time
+        p.completion_time = current_time + p.burst_time
+        p.turnaround_time = p.completion_time - p.arrival_time
+        p.waiting_time = p.turnaround_time - p.burst_time
+        p.response_time = p.start_time - p.arrival_time
+
+        # Step 4: Update Gantt and move time to completion
+        if segments is not None:
+            segments.append((p.pid, p.start_time, p.completion_time))
+            if len(segments) >= PACK_SEGMENTS: gantt_output.pack()
+        current_time = p.completion_time
+        if observer: observer.on_complete(p, current_time)
+
+    return processes, gantt_output
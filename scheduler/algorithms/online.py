@@ -0,0 +1,297 @@
+# algorithms/online.py
+import heapq
+from collections import deque
+from utils.process import Process
+
+def _pack(p):
+    """Process record as a plain list for a checkpoint (static fields, remaining and start time)."""
+    return [p.pid, p.arrival_time, p.burst_time, p.priority, p.remaining_time, p.start_time]
+
+def _unpack(record):
+    p = Process(*record[:4])
+    p.remaining_time, p.start_time = record[4], record[5]
+    return p
+
+def _restore_heap(records, key):
+    # The key is recomputed; seq is unique, so the pop order does not depend on the heap layout
+    ready = []
+    for seq, record in records:
+        p = _unpack(record)
+        ready.append((key(p), seq, p))
+    heapq.heapify(ready)
+    return ready
+
+class OnlineScheduler:
+    """
+    Base class for the online (streaming) engines.
+    The caller pushes processes in arrival order; after each push the engine
+    simulates everything that can no longer change and returns the events that
+    became final:
+        ('segment', pid, start, end)  - a finished Gantt segment
+        ('complete', process)         - a process with its final metrics
+    Memory is bounded by the ready set, not by the length of the trace.
+    The emitted segments and metrics are the same as the batch solve_* functions.
+    """
+    def __init__(self):
+        self.current_time = 0
+        self.pending = deque()   # Pushed processes that have not been admitted yet
+        self.last_arrival = None
+        self.pushed = 0          # Push order, used as the final tie-break
+        self.events = []
+
+    def push(self, process):
+        """Adds the next arrival and returns the events that are now final."""
+        if self.last_arrival is not None and process.arrival_time < self.last_arrival:
+            raise ValueError(f"Arrivals must be pushed in time order: {process.pid} arrives at "
+                             f"{process.arrival_time}, after an arrival at {self.last_arrival}")
+        self.last_arrival = process.arrival_time
+        process.remaining_time = process.burst_time
+        self.pending.append((self.pushed, process))
+        self.pushed += 1
+
+        # Every arrival before this one is now known, so all decisions taken
+        # strictly before its arrival time are final
+        self._advance(process.arrival_time)
+        return self._drain()
+
+    def close(self):
+        """Signals the end of the input and returns the remaining events."""
+        self._advance(None)
+        return self._drain()
+
+    def run(self, arrivals):
+        """Generator form: consumes an iterator of processes and yields events as they become final."""
+        for process in arrivals:
+            yield from self.push(process)
+        yield from self.close()
+
+    def checkpoint(self):
+        """
+        Returns the engine state as plain lists and numbers (see utils/checkpoint.py):
+        clock, pending arrivals, ready queue with remaining times and the open
+        Gantt segment. Finished processes are not part of it, so its size
+        depends on the ready set only. Take it between pushes, before close().
+        """
+        return {
+            'current_time': self.current_time,
+            'last_arrival': self.last_arrival,
+            'pushed': self.pushed,
+            'pending': [[seq, _pack(p)] for seq, p in self.pending],
+            **self._queue_state(),
+        }
+
+    def restore(self, state):
+        """Loads a checkpoint() state; pushing the remaining arrivals then continues the run exactly."""
+        self.current_time = state['current_time']
+        self.last_arrival = state['last_arrival']
+        self.pushed = state['pushed']
+        self.pending = deque((seq, _unpack(record)) for seq, record in state['pending'])
+        self.events = []
+        self._restore_queues(state)
+        return self
+
+    def _queue_state(self):
+        raise NotImplementedError
+
+    def _restore_queues(self, state):
+        raise NotImplementedError
+
+    def _drain(self):
+        events, self.events = self.events, []
+        return events
+
+    def _decidable(self, time, horizon):
+        # A decision at `time` is safe once every arrival at or before it is known
+        return horizon is None or time < horizon
+
+    def _admit(self):
+        """Pops pending arrivals that have arrived by the current time."""
+        admitted = []
+        while self.pending and self.pending[0][1].arrival_time <= self.current_time:
+            admitted.append(self.pending.popleft())
+        return admitted
+
+    def _complete(self, p):
+        p.completion_time = self.current_time
+        p.turnaround_time = p.completion_time - p.arrival_time
+        p.waiting_time = p.turnaround_time - p.burst_time
+        p.response_time = p.start_time - p.arrival_time
+        self.events.append(('complete', p))
+
+    def _advance(self, horizon):
+        raise NotImplementedError
+
+class OnlineNonPreemptive(OnlineScheduler):
+    """Online FCFS / SJF / Priority NP: the ready heap is ordered by key(process)."""
+    def __init__(self, key):
+        super().__init__()
+        self.key = key
+        self.ready = []
+
+    def _queue_state(self):
+        return {'ready': [[seq, _pack(p)] for _, seq, p in self.ready]}
+
+    def _restore_queues(self, state):
+        self.ready = _restore_heap(state['ready'], self.key)
+
+    def _advance(self, horizon):
+        while True:
+            for seq, p in self._admit():
+                heapq.heappush(self.ready, (self.key(p), seq, p))
+
+            if not self.ready:
+                # CPU is idle; jump to the next arrival once it is known to be the next one
+                if not self.pending or not self._decidable(self.pending[0][1].arrival_time, horizon):
+                    return
+                self.current_time = self.pending[0][1].arrival_time
+                continue
+
+            if not self._decidable(self.current_time, horizon):
+                return
+
+            p = heapq.heappop(self.ready)[2]
+            p.start_time = self.current_time
+            self.events.append(('segment', p.pid, self.current_time, self.current_time + p.burst_time))
+            self.current_time += p.burst_time
+            self._complete(p)
+
+class OnlinePreemptive(OnlineScheduler):
+    """
+    Online SRTF / Priority P: the ready heap is ordered by key(process) and the
+    running process is re-evaluated at every arrival.
+    """
+    def __init__(self, key):
+        super().__init__()
+        self.key = key
+        self.ready = []
+        self.segment = None  # Open Gantt segment: [pid, start]
+
+    def _queue_state(self):
+        return {'ready': [[seq, _pack(p)] for _, seq, p in self.ready], 'segment': self.segment}
+
+    def _restore_queues(self, state):
+        self.ready = _restore_heap(state['ready'], self.key)
+        self.segment = state['segment']
+
+    def _close_segment(self):
+        if self.segment is not None:
+            self.events.append(('segment', self.segment[0], self.segment[1], self.current_time))
+            self.segment = None
+
+    def _advance(self, horizon):
+        while True:
+            for seq, p in self._admit():
+                heapq.heappush(self.ready, (self.key(p), seq, p))
+
+            if not self.ready:
+                if not self.pending or not self._decidable(self.pending[0][1].arrival_time, horizon):
+                    return
+                self.current_time = self.pending[0][1].arrival_time
+                continue
+
+            if not self._decidable(self.current_time, horizon):
+                return
+
+            _, seq, p = heapq.heappop(self.ready)
+            if p.start_time is None:
+                p.start_time = self.current_time
+
+            # The segment stays open while the same process keeps the CPU
+            if self.segment is None or self.segment[0] != p.pid:
+                self._close_segment()
+                self.segment = [p.pid, self.current_time]
+
+            # Run until completion or the next (already pushed) arrival
+            run_until = self.current_time + p.remaining_time
+            if self.pending:
+                run_until = min(run_until, self.pending[0][1].arrival_time)
+            p.remaining_time -= run_until - self.current_time
+            self.current_time = run_until
+
+            if p.remaining_time == 0:
+                self._close_segment()
+                self._complete(p)
+            else:
+                heapq.heappush(self.ready, (self.key(p), seq, p))
+
+class OnlineRoundRobin(OnlineScheduler):
+    """Online Round Robin with the same queueing rules as solve_rr."""
+    def __init__(self, quantum):
+        super().__init__()
+        self.quantum = quantum
+        self.queue = deque()
+        self.running = None  # Process whose slice ends at current_time + pending requeue
+
+    def _queue_state(self):
+        running = [_pack(self.running[0]), self.running[1]] if self.running is not None else None
+        return {'queue': [_pack(p) for p in self.queue], 'running': running}
+
+    def _restore_queues(self, state):
+        self.queue = deque(_unpack(record) for record in state['queue'])
+        running = state['running']
+        self.running = (_unpack(running[0]), running[1]) if running is not None else None
+
+    def _enqueue_arrivals(self):
+        # solve_rr orders simultaneous arrivals by PID
+        admitted = self._admit()
+        admitted.sort(key=lambda item: (item[1].arrival_time, item[1].pid))
+        self.queue.extend(p for _, p in admitted)
+
+    def _advance(self, horizon):
+        while True:
+            if self.running is not None:
+                p, end = self.running
+                # New arrivals up to the slice end go in before the process is re-queued
+                if not self._decidable(end, horizon):
+                    return
+                self.current_time = end
+                self._enqueue_arrivals()
+                if p.remaining_time == 0:
+                    self._complete(p)
+                else:
+                    self.queue.append(p)
+                self.running = None
+                continue
+
+            if not self.queue:
+                if not self.pending or not self._decidable(self.pending[0][1].arrival_time, horizon):
+                    return
+                self.current_time = self.pending[0][1].arrival_time
+                self._enqueue_arrivals()
+                continue
+
+            p = self.queue.popleft()
+            if p.start_time is None:
+                p.start_time = self.current_time
+            run_time = min(self.quantum, p.remaining_time)
+            self.events.append(('segment', p.pid, self.current_time, self.current_time + run_time))
+            p.remaining_time -= run_time
+            self.running = (p, self.current_time + run_time)
+
+def online_fcfs():
+    return OnlineNonPreemptive(key=lambda p: (p.arrival_time, p.pid))
+
+def online_sjf():
+    return OnlineNonPreemptive(key=lambda p: (p.burst_time, p.arrival_time, p.pid))
+
+def online_priority_np():
+    return OnlineNonPreemptive(key=lambda p: (p.priority, p.arrival_time, p.pid))
+
+def online_srtf():
+    return OnlinePreemptive(key=lambda p: (p.remaining_time, p.arrival_time, p.pid))
+
+def online_priority_p():
+    return OnlinePreemptive(key=lambda p: (p.priority, p.arrival_time, p.pid))
+
+def online_rr(quantum):
+    return OnlineRoundRobin(quantum)
+
+# Algorithms with an online engine (--stream, checkpoints); RR also needs its quantum
+ONLINE_ENGINES = {'FCFS': online_fcfs, 'SJF': online_sjf, 'SRTF': online_srtf,
+                  'PRIO_NP': online_priority_np, 'PRIO_P': online_priority_p, 'RR': online_rr}
+
+def make_online(algo, quantum=None):
+    """Creates the online engine for algo (a KeyError for algorithms without one)."""
+    if algo == 'RR':
+        return online_rr(quantum)
+    return ONLINE_ENGINES[algo]()
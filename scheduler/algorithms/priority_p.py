@@ -1,9 +1,18 @@
 # algorithms/priority_p.py
+import heapq
+from fractions import Fraction
+from utils.timeline_store import new_timeline
 
-def solve_priority_p(processes):
+def solve_priority_p(processes, aging_rate=0, observer=None, record_gantt=True):
     """
     Priority Scheduling (Preemptive) Implementation.
     If a new process arrives with a higher priority, the current process is preempted.
+
+    The simulation is event-driven and only stops at arrivals, completions and
+    (with aging) priority crossovers. With aging_rate > 0, a waiting process's
+    priority value improves (decreases) by aging_rate per time unit it spends in
+    the ready queue; the counter restarts whenever the process gets the CPU.
+    See utils/observer.py for the observer hooks; record_gantt=False skips the Gantt log.
     """
     # Initialize remaining times
     for p in processes:
@@ -12,45 +21,93 @@ def solve_priority_p(processes):
     current_time = 0
     completed = 0
     n = len(processes)
-    timeline = [] # Store Gantt segments: [pid, start, end]
-    
+    timeline = new_timeline(record_gantt) # Gantt segments (pid, start, end), see utils/timeline_store.py
+
+    # Aging is kept in exact integer arithmetic: with rate = num / den, every
+    # priority is scaled by den so effective priorities never need rounding.
+    rate = Fraction(str(aging_rate))
+    num, den = rate.numerator, rate.denominator
+
+    # All waiting processes age at the same speed, so ordering them by
+    # (priority + rate * ready_since) is the same as ordering them by their
+    # effective priority at any moment. The heap keys never change while a
+    # process waits, so no decrease-key operation is needed.
+    def ready_key(p, idx, ready_since):
+        return (p.priority * den + num * ready_since, p.arrival_time, p.pid, idx)
+
+    # Arrival cursor: indices sorted by arrival time (stable, so ties keep input order)
+    arrival_order = sorted(range(n), key=lambda i: processes[i].arrival_time)
+    next_arrival = 0
+    ready = []
+    running = None # Index of the process that currently holds the CPU
+    counters = getattr(observer, 'counters', None) # Only set when profiling
+
     while completed < n:
-        # Step 1: Get available processes at current time
-        available = [i for i, p in enumerate(processes) 
-                     if p.arrival_time <= current_time and p.remaining_time > 0]
-        
-        if available:
-            # Step 2: Select highest priority (lowest value).
-            # Tie-break: Priority > Arrival > PID.
-            idx = min(available, key=lambda x: (
-                processes[x].priority, 
-                processes[x].arrival_time, 
-                processes[x].pid
-            ))
+        # Step 1: Move every process that has arrived into the ready heap
+        while next_arrival < n and processes[arrival_order[next_arrival]].arrival_time <= current_time:
+            idx = arrival_order[next_arrival]
             p = processes[idx]
-            
-            # Step 3: Track first start for response time 
-            if p.start_time is None: 
-                p.start_time = current_time
-            
-            # Step 4: Record for Gantt Chart (merge segments) 
-            if not timeline or timeline[-1][0] != p.pid:
-                timeline.append([p.pid, current_time, current_time + 1])
+            heapq.heappush(ready, ready_key(p, idx, p.arrival_time))
+            if counters is not None: counters.on_push()
+            next_arrival += 1
+
+        if not ready:
+            # CPU is idle: skip directly to the next arrival
+            next_time = processes[arrival_order[next_arrival]].arrival_time
+            if observer: observer.on_idle(current_time, next_time)
+            current_time = next_time
+            continue
+
+        # Step 2: Select highest priority (lowest value).
+        # Tie-break: Priority > Arrival > PID.
+        if counters is not None: counters.on_decision(len(ready))
+        idx = heapq.heappop(ready)[3]
+        p = processes[idx]
+
+        # A different process taking over preempts the one that was running
+        if running != idx:
+            if observer:
+                if running is not None:
+                    observer.on_preempt(processes[running], current_time)
+                observer.on_dispatch(p, current_time)
+            running = idx
+
+        # Step 3: Track first start for response time
+        if p.start_time is None:
+            p.start_time = current_time
+
+        # Step 4: Run until completion, the next arrival, or the moment the best
+        # waiting process ages past the running one (whichever comes first)
+        run_until = current_time + p.remaining_time
+        if next_arrival < n:
+            run_until = min(run_until, processes[arrival_order[next_arrival]].arrival_time)
+        if num and ready:
+            top = ready[0]
+            gap = top[0] - p.priority * den
+            if top[1:] < (p.arrival_time, p.pid, idx):
+                crossover = -(-gap // num) # The waiting process wins ties
             else:
-                timeline[-1][2] += 1
-            
-            # Step 5: Execute for 1 unit
-            p.remaining_time -= 1
-            current_time += 1
-            
-            # Step 6: On finish, calculate stats 
-            if p.remaining_time == 0:
-                completed += 1
-                p.completion_time = current_time
-                p.turnaround_time = p.completion_time - p.arrival_time  
-                p.waiting_time = p.turnaround_time - p.burst_time
-                p.response_time = p.start_time - p.arrival_time 
+                crossover = gap // num + 1 # It has to be strictly better
+            run_until = min(run_until, max(crossover, current_time + 1))
+
+        # Step 5: Record for Gantt Chart (merge segments)
+        if timeline is not None:
+            timeline.add_merged(p.pid, current_time, run_until)
+
+        p.remaining_time -= run_until - current_time
+        current_time = run_until
+
+        # Step 6: On finish, calculate stats, otherwise compete again
+        if p.remaining_time == 0:
+            completed += 1
+            p.completion_time = current_time
+            p.turnaround_time = p.completion_time - p.arrival_time
+            p.waiting_time = p.turnaround_time - p.burst_time
+            p.response_time = p.start_time - p.arrival_time
+            if observer: observer.on_complete(p, current_time)
+            running = None
         else:
-            current_time += 1
+            heapq.heappush(ready, ready_key(p, idx, current_time))
+            if counters is not None: counters.on_push()
 
-    return processes, timeline
\ No newline at end of file
+    return processes, timeline
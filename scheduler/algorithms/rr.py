@@ -1,78 +1,119 @@
 # algorithms/rr.py
 from collections import deque
+from utils.timeline_store import PACK_SEGMENTS, new_timeline
 
-def solve_rr(processes, quantum):
+def solve_rr(processes, quantum, coalesce=False, observer=None, record_gantt=True):
     """
     Round Robin (RR) Implementation.
     Each process is assigned a fixed time unit (quantum) in a cyclic order.
+
+    When only one process is runnable and the next arrival is several quanta
+    away, those quanta are simulated in a single step. By default the Gantt log
+    still gets one entry per quantum; with coalesce=True consecutive slices of
+    the same process are merged into one entry.
+    See utils/observer.py for the observer hooks; record_gantt=False skips the Gantt log.
     """
     # Initialize remaining times for all processes
     for p in processes:
         p.remaining_time = p.burst_time
-        
+
     current_time = 0
     completed = 0
     n = len(processes)
-    gantt_output = []
-    
+    gantt_output = new_timeline(record_gantt)
+    segments = gantt_output.tail if gantt_output is not None else None # Appended to directly, see TimelineStore
+
+    def record(pid, start, end):
+        if segments is None:
+            return
+        if coalesce:
+            gantt_output.add_merged(pid, start, end)
+        else:
+            segments.append((pid, start, end))
+            if len(segments) >= PACK_SEGMENTS: gantt_output.pack()
+
     # Ready Queue for managing processes
     queue = deque()
-    # Tracking if a process is already in the queue to avoid duplicates
-    in_queue = [False] * n
-    
+
     # Ensure processes are sorted by arrival time for initial entry
     processes.sort(key=lambda x: (x.arrival_time, x.pid))
-    
+
+    # Admission cursor: every process before it has already entered the queue,
+    # so each process is admitted exactly once in O(1)
+    next_arrival = 0
+    counters = getattr(observer, 'counters', None) # Only set when profiling
+
     # Add processes that have arrived at t=0
-    for idx, p in enumerate(processes):
-        if p.arrival_time <= current_time:
-            queue.append(idx)
-            in_queue[idx] = True
+    while next_arrival < n and processes[next_arrival].arrival_time <= current_time:
+        queue.append(next_arrival)
+        if counters is not None: counters.on_push()
+        next_arrival += 1
 
     while completed < n:
         if not queue:
             # If queue is empty but processes remain, jump to next arrival
-            next_arrival = min([p.arrival_time for p in processes if p.remaining_time > 0])
-            current_time = next_arrival
-            for idx, p in enumerate(processes):
-                if p.arrival_time <= current_time and not in_queue[idx]:
-                    queue.append(idx)
-                    in_queue[idx] = True
-                    
+            next_time = processes[next_arrival].arrival_time
+            if observer: observer.on_idle(current_time, next_time)
+            current_time = next_time
+            while next_arrival < n and processes[next_arrival].arrival_time <= current_time:
+                queue.append(next_arrival)
+                if counters is not None: counters.on_push()
+                next_arrival += 1
+
         # Pop the first process from the queue
+        if counters is not None: counters.on_decision(len(queue))
         idx = queue.popleft()
         p = processes[idx]
-        
-        # Record response time on first CPU contact 
+
+        if observer: observer.on_dispatch(p, current_time)
+
+        # Record response time on first CPU contact
         if p.start_time is None:
             p.start_time = current_time
-        
+
+        # Fast-forward: if nobody else is waiting, the process keeps getting
+        # full quanta until one of them ends at or after the next arrival
+        if not queue and p.remaining_time > quantum:
+            full_slices = (p.remaining_time - 1) // quantum
+            if next_arrival < n:
+                full_slices = min(full_slices, (processes[next_arrival].arrival_time - current_time - 1) // quantum)
+            if full_slices > 0:
+                if coalesce:
+                    record(p.pid, current_time, current_time + full_slices * quantum)
+                elif gantt_output is not None:
+                    gantt_output.add_slices(p.pid, current_time, full_slices, quantum)
+                current_time += full_slices * quantum
+                p.remaining_time -= full_slices * quantum
+
         # Determine execution time (either quantum or remaining time)
         run_time = min(quantum, p.remaining_time)
-        
+
         # Update Gantt log
-        gantt_output.append((p.pid, current_time, current_time + run_time))
-        
+        record(p.pid, current_time, current_time + run_time)
+
         # Progress time and reduce remaining burst
         current_time += run_time
         p.remaining_time -= run_time
-        
+
         # IMPORTANT: Check for new arrivals while the process was running
         # These MUST enter the queue before the current process is re-added
-        for i, other_p in enumerate(processes):
-            if other_p.arrival_time <= current_time and not in_queue[i] and other_p.remaining_time > 0:
-                queue.append(i)
-                in_queue[i] = True
-        
-        # If the process is finished, calculate final metrics 
+        while next_arrival < n and processes[next_arrival].arrival_time <= current_time:
+            queue.append(next_arrival)
+            if counters is not None: counters.on_push()
+            next_arrival += 1
+
+        # If the process is finished, calculate final metrics
         if p.remaining_time == 0:
             completed += 1
             p.completion_time = current_time
-            p.turnaround_time = p.completion_time - p.arrival_time 
-            p.waiting_time = p.turnaround_time - p.burst_time 
-            p.response_time = p.start_time - p.arrival_time 
+            p.turnaround_time = p.completion_time - p.arrival_time
+            p.waiting_time = p.turnaround_time - p.burst_time
+            p.response_time = p.start_time - p.arrival_time
+            if observer: observer.on_complete(p, current_time)
         else:
             # If not finished, put it back at the end of the queue
+            if observer: observer.on_preempt(p, current_time)
             queue.append(idx)
+            if counters is not None: counters.on_push()
 
-    return processes, gantt_output
\ No newline at end of file
+    return processes, gantt_output
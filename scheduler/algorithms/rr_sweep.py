@@ -0,0 +1,131 @@
+# algorithms/rr_sweep.py
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# Arrival-sorted columns shared by every quantum in a sweep (set once per worker)
+_shared = None
+
+def prepare_columns(processes):
+    """
+    Builds the arrival index once for the whole sweep: the workload sorted by
+    (arrival, PID) exactly like solve_rr, split into plain integer columns.
+    PIDs become small integers (equal PIDs get the same number), so context
+    switches can be counted by PID like count_context_switches does.
+    Accepts a list of Process objects or a columnar Workload.
+    """
+    if hasattr(processes, 'to_processes'):
+        processes = processes.to_processes()
+    ordered = sorted(processes, key=lambda p: (p.arrival_time, p.pid))
+    pid_ids = {}
+    return ([p.arrival_time for p in ordered], [p.burst_time for p in ordered],
+            [pid_ids.setdefault(p.pid, len(pid_ids)) for p in ordered])
+
+def rr_metrics(arrivals, bursts, pids, quantum):
+    """
+    Metrics-only Round Robin over arrival-sorted columns. Follows the same
+    rules as solve_rr (admission cursor, arrivals before re-queue, single-runner
+    fast-forward) but builds no Process objects and no Gantt log.
+    Returns (avg_turnaround, avg_waiting, avg_response, context_switches).
+    """
+    n = len(arrivals)
+    if n == 0: return 0, 0, 0, 0
+
+    remaining = list(bursts)
+    started = [False] * n
+    queue = deque()
+    next_arrival = 0
+    current_time = 0
+    completed = 0
+    total_turnaround = total_waiting = total_response = 0
+    switches, last_pid = 0, -1
+
+    while next_arrival < n and arrivals[next_arrival] <= current_time:
+        queue.append(next_arrival)
+        next_arrival += 1
+
+    while completed < n:
+        if not queue:
+            current_time = arrivals[next_arrival]
+            while next_arrival < n and arrivals[next_arrival] <= current_time:
+                queue.append(next_arrival)
+                next_arrival += 1
+
+        idx = queue.popleft()
+        if not started[idx]:
+            started[idx] = True
+            total_response += current_time - arrivals[idx]
+
+        # A context switch is a different PID gaining the CPU
+        if pids[idx] != last_pid:
+            if last_pid >= 0:
+                switches += 1
+            last_pid = pids[idx]
+
+        # Fast-forward full quanta while nobody else can be waiting
+        if not queue and remaining[idx] > quantum:
+            full_slices = (remaining[idx] - 1) // quantum
+            if next_arrival < n:
+                full_slices = min(full_slices, (arrivals[next_arrival] - current_time - 1) // quantum)
+            if full_slices > 0:
+                current_time += full_slices * quantum
+                remaining[idx] -= full_slices * quantum
+
+        run_time = min(quantum, remaining[idx])
+        current_time += run_time
+        remaining[idx] -= run_time
+
+        while next_arrival < n and arrivals[next_arrival] <= current_time:
+            queue.append(next_arrival)
+            next_arrival += 1
+
+        if remaining[idx] == 0:
+            completed += 1
+            turnaround = current_time - arrivals[idx]
+            total_turnaround += turnaround
+            total_waiting += turnaround - bursts[idx]
+        else:
+            queue.append(idx)
+
+    return total_turnaround / n, total_waiting / n, total_response / n, switches
+
+def _init_worker(arrivals, bursts, pids):
+    global _shared
+    _shared = (arrivals, bursts, pids)
+
+def _run_quantum(quantum):
+    return rr_metrics(*_shared, quantum)
+
+def sweep_rr(processes, quanta, jobs=1):
+    """
+    Evaluates Round Robin for many quanta in one call.
+    The arrival index is built once and shared by every run (each pool worker
+    receives it once, not once per quantum). Once a quantum reaches the longest
+    burst every process finishes in its first slice, so all larger quanta give
+    the same schedule and reuse that result instead of simulating again.
+    Returns a list of dicts: quantum, avg_turnaround, avg_waiting, avg_response, context_switches.
+    """
+    arrivals, bursts, pids = prepare_columns(processes)
+    quanta = sorted(set(quanta))
+    longest = max(bursts, default=0)
+
+    # Quanta below the longest burst need their own simulation; the first
+    # quantum >= longest burst stands in for all the larger ones
+    distinct = [q for q in quanta if q < longest]
+    saturated = [q for q in quanta if q >= longest]
+    if saturated:
+        distinct.append(saturated[0])
+
+    if jobs <= 1:
+        metrics = [rr_metrics(arrivals, bursts, pids, q) for q in distinct]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=(arrivals, bursts, pids)) as pool:
+            metrics = list(pool.map(_run_quantum, distinct))
+
+    by_quantum = dict(zip(distinct, metrics))
+    rows = []
+    for q in quanta:
+        avg_t, avg_w, avg_r, cs = by_quantum[q] if q in by_quantum else by_quantum[saturated[0]]
+        rows.append({'quantum': q, 'avg_turnaround': avg_t, 'avg_waiting': avg_w,
+                     'avg_response': avg_r, 'context_switches': cs})
+    return rows
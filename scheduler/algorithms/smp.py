@@ -0,0 +1,287 @@
+# algorithms/smp.py
+import heapq
+from collections import deque
+from utils.timeline_store import TimelineStore
+
+# Ready-queue order of every policy; the process index is the final tie-break
+# (same rules as the single-CPU solvers). RR uses a FIFO queue instead.
+SMP_POLICIES = {
+    'FCFS': (lambda p, i: (p.arrival_time, p.pid, i), False),
+    'SJF': (lambda p, i: (p.burst_time, p.arrival_time, p.pid, i), False),
+    'SRTF': (lambda p, i: (p.remaining_time, p.arrival_time, p.pid, i), True),
+    'PRIO_NP': (lambda p, i: (p.priority, p.arrival_time, p.pid, i), False),
+    'PRIO_P': (lambda p, i: (p.priority, p.arrival_time, p.pid, i), True),
+}
+
+class SMPSimulation:
+    """
+    Event-driven simulation of one policy on several CPUs.
+
+    queues='global' keeps one shared ready queue; queues='per-core' gives every
+    core its own queue. New arrivals go to the least loaded core, and cores are
+    balanced either by work stealing (an idle core takes work from the longest
+    queue) or periodically every balance_interval time units.
+
+    The clock only stops at arrivals, completions, quantum expiries and balance
+    ticks, so idle stretches and long bursts cost nothing. With one core the
+    results are the same as the single-CPU solve_* functions.
+    """
+    def __init__(self, processes, algo, cpus, quantum=None, queues='global',
+                 balance='steal', balance_interval=10, record_gantt=True):
+        if cpus < 1:
+            raise ValueError("cpus must be at least 1")
+        if algo == 'RR' and (quantum is None or quantum < 1):
+            raise ValueError("RR needs a quantum of at least 1")
+        if queues not in ('global', 'per-core'):
+            raise ValueError(f"Unknown queue layout: {queues}")
+        if balance not in ('steal', 'periodic', 'none'):
+            raise ValueError(f"Unknown balancing mode: {balance}")
+        if balance == 'periodic' and balance_interval < 1:
+            raise ValueError("balance_interval must be at least 1")
+
+        self.processes = processes
+        self.cpus = cpus
+        self.quantum = quantum
+        self.fifo = algo == 'RR'
+        self.key, self.preemptive = (None, False) if self.fifo else SMP_POLICIES[algo]
+        self.by_remaining = algo == 'SRTF'
+        self.per_core = queues == 'per-core'
+        self.balance = balance if self.per_core else 'none'
+        self.balance_interval = balance_interval
+
+        # One ready queue per core, or a single shared one
+        self.queues = [self._new_queue() for _ in range(cpus if self.per_core else 1)]
+        self.waiting = 0
+        # Per-core load (queued + running), kept up to date so picking the least
+        # or most loaded core is a single min()/max() over a list
+        self.loads = [0] * cpus
+
+        # Per-core state: the running index, when it started, and a sequence
+        # number that invalidates stale entries in the core event heap
+        self.running = [None] * cpus
+        self.started = [0] * cpus
+        self.seq = [0] * cpus
+        self.core_events = []        # (end_time, core, seq)
+        self.last_core = [None] * len(processes)
+        self.last_pid = [None] * cpus
+
+        self.logs = [TimelineStore() for _ in range(cpus)] if record_gantt else None
+        self.busy = [0] * cpus
+        self.context_switches = [0] * cpus
+        self.migrations = 0
+
+    # --- Ready queues ---
+
+    def _new_queue(self):
+        return deque() if self.fifo else []
+
+    def _push(self, qi, idx):
+        q = self.queues[qi]
+        if self.fifo:
+            q.append(idx)
+        else:
+            heapq.heappush(q, self.key(self.processes[idx], idx))
+        self.waiting += 1
+        self.loads[qi] += 1
+
+    def _pop(self, qi):
+        q = self.queues[qi]
+        self.waiting -= 1
+        self.loads[qi] -= 1
+        return q.popleft() if self.fifo else heapq.heappop(q)[-1]
+
+    def _queue_index(self, core):
+        return core if self.per_core else 0
+
+    # --- Cores ---
+
+    def _dispatch(self, core, idx, t):
+        p = self.processes[idx]
+        if p.start_time is None:
+            p.start_time = t
+        if self.last_core[idx] is not None and self.last_core[idx] != core:
+            self.migrations += 1
+        self.last_core[idx] = core
+        if self.last_pid[core] is not None and self.last_pid[core] != p.pid:
+            self.context_switches[core] += 1
+        self.last_pid[core] = p.pid
+
+        self.running[core] = idx
+        self.loads[core] += 1
+        self.started[core] = t
+        run = min(self.quantum, p.remaining_time) if self.fifo else p.remaining_time
+        self.seq[core] += 1
+        heapq.heappush(self.core_events, (t + run, core, self.seq[core]))
+
+    def _stop(self, core, t):
+        """Takes the running process off the core and returns its index."""
+        idx = self.running[core]
+        p = self.processes[idx]
+        start = self.started[core]
+        if t > start:
+            p.remaining_time -= t - start
+            self.busy[core] += t - start
+            if self.logs is not None:
+                self.logs[core].add(p.pid, start, t)
+        self.running[core] = None
+        self.loads[core] -= 1
+        self.seq[core] += 1
+        return idx
+
+    def _running_key(self, core, t):
+        idx = self.running[core]
+        p = self.processes[idx]
+        key = self.key(p, idx)
+        # SRTF compares the remaining time as of now, not as of the dispatch
+        if self.by_remaining:
+            key = (p.remaining_time - (t - self.started[core]),) + key[1:]
+        return key
+
+    def _least_loaded(self):
+        return min(range(self.cpus), key=self.loads.__getitem__)
+
+    def _most_loaded(self):
+        return max(range(self.cpus), key=self.loads.__getitem__)
+
+    def _rebalance(self, touched):
+        """Periodic balancing: move queued work from the busiest to the least loaded core."""
+        while True:
+            src = self._most_loaded()
+            dst = self._least_loaded()
+            if self.loads[src] - self.loads[dst] <= 1 or not self.queues[src]:
+                return
+            self._push(dst, self._pop(src))
+            touched.add(dst)
+
+    # --- Main loop ---
+
+    def run(self):
+        processes = self.processes
+        n = len(processes)
+        for p in processes:
+            p.remaining_time = p.burst_time
+
+        # Arrival cursor in (arrival, pid) order, like the RR admission order
+        order = sorted(range(n), key=lambda i: (processes[i].arrival_time, processes[i].pid))
+        next_arrival = 0
+        next_balance = self.balance_interval
+        completed = 0
+        t = 0
+        idle = list(range(self.cpus))  # Global queue: min-heap of idle cores (lowest id first)
+
+        while completed < n:
+            # Step 1: Jump to the next event (arrival, core event or balance tick)
+            while self.core_events and self.core_events[0][2] != self.seq[self.core_events[0][1]]:
+                heapq.heappop(self.core_events)
+            candidates = []
+            if next_arrival < n:
+                candidates.append(processes[order[next_arrival]].arrival_time)
+            if self.core_events:
+                candidates.append(self.core_events[0][0])
+            if self.balance == 'periodic' and self.waiting:
+                candidates.append(max(next_balance, t))
+            t = min(candidates)
+
+            # Step 2: Finish every run that ends now (completion or quantum expiry)
+            touched = set()
+            expired = []
+            while self.core_events and self.core_events[0][0] == t:
+                _, core, seq = heapq.heappop(self.core_events)
+                if seq != self.seq[core]:
+                    continue
+                idx = self._stop(core, t)
+                p = processes[idx]
+                if p.remaining_time == 0:
+                    completed += 1
+                    p.completion_time = t
+                    p.turnaround_time = p.completion_time - p.arrival_time
+                    p.waiting_time = p.turnaround_time - p.burst_time
+                    p.response_time = p.start_time - p.arrival_time
+                else:
+                    expired.append((core, idx))
+                    self.loads[core] += 1 # Still counts for placement until it is requeued
+                if not self.per_core:
+                    heapq.heappush(idle, core)
+                touched.add(core)
+
+            # Step 3: Admit arrivals; they enter the queue before expired RR slices
+            while next_arrival < n and processes[order[next_arrival]].arrival_time <= t:
+                idx = order[next_arrival]
+                core = self._least_loaded() if self.per_core else 0
+                self._push(core, idx)
+                touched.add(core)
+                next_arrival += 1
+            for core, idx in sorted(expired):
+                self.loads[core] -= 1
+                self._push(self._queue_index(core), idx)
+
+            # Step 4: Periodic load balancing
+            if self.balance == 'periodic' and t >= next_balance:
+                self._rebalance(touched)
+                next_balance = (t // self.balance_interval + 1) * self.balance_interval
+
+            # Step 5: Give work to idle cores
+            if self.per_core:
+                for core in sorted(touched):
+                    if self.running[core] is not None:
+                        continue
+                    qi = core
+                    if not self.queues[qi] and self.balance == 'steal' and self.waiting:
+                        qi = self._most_loaded()
+                    if self.queues[qi]:
+                        self._dispatch(core, self._pop(qi), t)
+            else:
+                while idle and self.queues[0]:
+                    self._dispatch(heapq.heappop(idle), self._pop(0), t)
+
+            # Step 6: Preemption - a better waiting process takes over a running one.
+            # With a global queue the victim is the worst running process, so the
+            # preempted process can never in turn preempt another core.
+            if self.preemptive and self.waiting:
+                if self.per_core:
+                    for core in sorted(touched):
+                        q = self.queues[core]
+                        if q and self.running[core] is not None and q[0] < self._running_key(core, t):
+                            preempted = self._stop(core, t)
+                            self._dispatch(core, self._pop(core), t)
+                            self._push(core, preempted)
+                else:
+                    q = self.queues[0]
+                    while q and not idle:
+                        victim = max(range(self.cpus), key=lambda c: self._running_key(c, t))
+                        if not q[0] < self._running_key(victim, t):
+                            break
+                        preempted = self._stop(victim, t)
+                        self._dispatch(victim, self._pop(0), t)
+                        self._push(0, preempted)
+
+        return processes, self.logs, {
+            'busy': self.busy,
+            'context_switches': self.context_switches,
+            'migrations': self.migrations,
+            'end_time': t,
+        }
+
+def solve_smp(processes, algo, cpus, quantum=None, queues='global', balance='steal',
+              balance_interval=10, record_gantt=True):
+    """
+    Runs one of the six policies on `cpus` cores (see SMPSimulation).
+    Returns (processes, core_logs, stats): core_logs holds one Gantt log per
+    core (None with record_gantt=False) and stats has the per-core busy time
+    and context switches, the number of migrations and the end time.
+    A migration is a process resuming on a different core than it last ran on.
+    """
+    sim = SMPSimulation(processes, algo, cpus, quantum, queues, balance,
+                        balance_interval, record_gantt)
+    return sim.run()
+
+def core_utilization(stats):
+    """Busy fraction of every core from t=0 to the last completion."""
+    end = stats['end_time']
+    return [busy / end if end else 0.0 for busy in stats['busy']]
+
+def load_imbalance(stats):
+    """(max - mean) / mean of the per-core busy time; 0 means perfectly balanced."""
+    busy = stats['busy']
+    mean = sum(busy) / len(busy)
+    return (max(busy) - mean) / mean if mean else 0.0
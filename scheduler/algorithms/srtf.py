@@ -1,61 +1,97 @@
 # algorithms/srtf.py
+import heapq
+from utils.timeline_store import new_timeline
 
-def solve_srtf(processes):
+def solve_srtf(processes, observer=None, record_gantt=True):
     """
     SRTF (Shortest Remaining Time First) Implementation - Preemptive.
     The process with the shortest remaining time is executed at each step.
+
+    The simulation is event-driven: the running process can only be preempted
+    when a new process arrives, so the clock jumps straight from one arrival or
+    completion to the next instead of ticking one time unit at a time.
+    See utils/observer.py for the observer hooks; record_gantt=False skips the Gantt log.
     """
-    # Initialize remaining times for all processes 
+    # Initialize remaining times for all processes
     for p in processes:
         p.remaining_time = p.burst_time
 
     current_time = 0
     completed = 0
     n = len(processes)
-    timeline = [] # To store Gantt segments: [pid, start, end]
-    
+    timeline = new_timeline(record_gantt) # Gantt segments (pid, start, end), see utils/timeline_store.py
+
+    # Arrival cursor: indices sorted by arrival time (stable, so ties keep input order)
+    arrival_order = sorted(range(n), key=lambda i: processes[i].arrival_time)
+    next_arrival = 0
+
+    # Ready heap keyed on the tie-break rule: remaining time > arrival > PID.
+    # The index is the final tie-break, matching min() over the input order.
+    ready = []
+    running = None # Index of the process that currently holds the CPU
+    counters = getattr(observer, 'counters', None) # Only set when profiling
+
     while completed < n:
-        # Step 1: Filter processes that have arrived and still need CPU time
-        available = [i for i, p in enumerate(processes) 
-                     if p.arrival_time <= current_time and p.remaining_time > 0]
-        
-        if available:
-            # Step 2: Pick process with minimum remaining time.
-            # Tie-break logic: smallest remaining time > earliest arrival > PID.
-            idx = min(available, key=lambda x: (
-                processes[x].remaining_time, 
-                processes[x].arrival_time, 
-                processes[x].pid
-            ))
+        # Step 1: Move every process that has arrived into the ready heap
+        while next_arrival < n and processes[arrival_order[next_arrival]].arrival_time <= current_time:
+            idx = arrival_order[next_arrival]
             p = processes[idx]
-            
-            # Step 3: Handle First Start for Response Time 
-            if p.start_time is None: 
-                p.start_time = current_time
-            
-            # Step 4: Record for Gantt Chart 
-            # Merge segments if the same process continues to run
-            if not timeline or timeline[-1][0] != p.pid:
-                timeline.append([p.pid, current_time, current_time + 1])
-            else:
-                timeline[-1][2] += 1
-            
-            # Step 5: Execute for 1 unit of time
-            p.remaining_time -= 1
-            current_time += 1
-            
-            # Step 6: If finished, calculate final stats 
-            if p.remaining_time == 0:
-                completed += 1
-                p.completion_time = current_time
-                # Turnaround Time = Completion - Arrival 
-                p.turnaround_time = p.completion_time - p.arrival_time
-                # Waiting Time = Turnaround - Burst 
-                p.waiting_time = p.turnaround_time - p.burst_time
-                # Response Time = First Start - Arrival 
-                p.response_time = p.start_time - p.arrival_time
+            heapq.heappush(ready, (p.remaining_time, p.arrival_time, p.pid, idx))
+            if counters is not None: counters.on_push()
+            next_arrival += 1
+
+        if not ready:
+            # CPU is idle: skip directly to the next arrival
+            next_time = processes[arrival_order[next_arrival]].arrival_time
+            if observer: observer.on_idle(current_time, next_time)
+            current_time = next_time
+            continue
+
+        # Step 2: Pick process with minimum remaining time.
+        # Tie-break logic: smallest remaining time > earliest arrival > PID.
+        if counters is not None: counters.on_decision(len(ready))
+        idx = heapq.heappop(ready)[3]
+        p = processes[idx]
+
+        # A different process taking over preempts the one that was running
+        if running != idx:
+            if observer:
+                if running is not None:
+                    observer.on_preempt(processes[running], current_time)
+                observer.on_dispatch(p, current_time)
+            running = idx
+
+        # Step 3: Handle First Start for Response Time
+        if p.start_time is None:
+            p.start_time = current_time
+
+        # Step 4: Run until the process finishes or the next arrival may preempt it
+        run_until = current_time + p.remaining_time
+        if next_arrival < n:
+            run_until = min(run_until, processes[arrival_order[next_arrival]].arrival_time)
+
+        # Step 5: Record for Gantt Chart
+        # Merge segments if the same process continues to run
+        if timeline is not None:
+            timeline.add_merged(p.pid, current_time, run_until)
+
+        p.remaining_time -= run_until - current_time
+        current_time = run_until
+
+        # Step 6: If finished, calculate final stats, otherwise compete again
+        if p.remaining_time == 0:
+            completed += 1
+            p.completion_time = current_time
+            # Turnaround Time = Completion - Arrival
+            p.turnaround_time = p.completion_time - p.arrival_time
+            # Waiting Time = Turnaround - Burst
+            p.waiting_time = p.turnaround_time - p.burst_time
+            # Response Time = First Start - Arrival
+            p.response_time = p.start_time - p.arrival_time
+            if observer: observer.on_complete(p, current_time)
+            running = None
         else:
-            # CPU is idle if no process is ready
-            current_time += 1
+            heapq.heappush(ready, (p.remaining_time, p.arrival_time, p.pid, idx))
+            if counters is not None: counters.on_push()
 
-    return processes, timeline
\ No newline at end of file
+    return processes, timeline
@@ -0,0 +1,74 @@
+# benchmarks/batched.py
+"""
+Speedup of the batched FCFS / SJF over a loop of solver calls.
+
+For every workload size a batch of random workloads is generated (arrivals
+spread over 5 time units per process, bursts 1-9). The loop builds the
+Process objects of each workload and calls solve_fcfs / solve_sjf on it,
+which is what batch_fcfs / batch_sjf replace; the batch times include the
+averages. Both sides are timed best-of-N, and sizes where the speedup is
+below --target are listed at the end.
+
+Run from the scheduler/ directory:
+    python -m benchmarks.batched --workloads 2000 --sizes 10,20,50,100
+"""
+import argparse
+import time
+
+import numpy as np
+
+from utils.process import Process
+from algorithms.fcfs import solve_fcfs
+from algorithms.sjf import solve_sjf
+from algorithms.batched import batch_fcfs, batch_sjf
+
+ALGORITHMS = {'FCFS': (batch_fcfs, solve_fcfs), 'SJF': (batch_sjf, solve_sjf)}
+
+def best_time(run, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def run_loop(solve, pids, arrivals, bursts):
+    for row_arrivals, row_bursts in zip(arrivals, bursts):
+        solve([Process(pid, a, b, 0) for pid, a, b in zip(pids, row_arrivals, row_bursts)])
+
+def main():
+    parser = argparse.ArgumentParser(description="Time batch_fcfs / batch_sjf against a loop of solve_fcfs / solve_sjf")
+    parser.add_argument('--workloads', type=int, default=2000, help="Workloads per batch (default: 2000)")
+    parser.add_argument('--sizes', type=str, default='10,20,50,100', help="Comma-separated processes per workload")
+    parser.add_argument('--repeat', type=int, default=5, help="Timing runs per measurement, best is kept (default: 5)")
+    parser.add_argument('--target', type=float, default=50.0, help="Speedup to report shortfalls against (default: 50)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    shortfalls = []
+    print(f"\n{'Algorithm':<10} {'N':<6} {'Loop (ms)':<12} {'Batch (ms)':<12} {'Speedup':<8}")
+    print("-" * 50)
+    for n in (int(size) for size in args.sizes.split(',')):
+        arrivals = rng.integers(0, 5 * n, (args.workloads, n))
+        bursts = rng.integers(1, 10, (args.workloads, n))
+        pids = [f"P{j}" for j in range(n)]
+        # The loop gets plain ints, like processes read from a trace
+        arrival_rows, burst_rows = arrivals.tolist(), bursts.tolist()
+        for name, (batch, solve) in ALGORITHMS.items():
+            batched = best_time(lambda: batch(arrivals, bursts, pids).average_metrics(), args.repeat)
+            looped = best_time(lambda: run_loop(solve, pids, arrival_rows, burst_rows), max(1, args.repeat // 2))
+            speedup = looped / batched
+            print(f"{name:<10} {n:<6} {looped * 1000:<12.1f} {batched * 1000:<12.2f} {speedup:<8.1f}")
+            if speedup < args.target:
+                shortfalls.append(f"{name} at {n} processes: {speedup:.1f}x")
+
+    if shortfalls:
+        print(f"\nBelow the {args.target:g}x target:")
+        for line in shortfalls:
+            print(f"  {line}")
+    else:
+        print(f"\nEvery size reaches the {args.target:g}x target.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+# benchmarks/memory.py
+"""
+Peak-memory and throughput benchmark for the process representation.
+
+Compares the original approach (dict-based process objects, one deepcopy of
+the workload per algorithm) with the low-allocation mode (__slots__ records
+shared between runs via fresh_run) and the columnar mode (a Workload whose
+arrays the solvers read and write through Workload.run, no per-process
+objects). Each mode runs in its own subprocess so the peak RSS numbers do
+not influence each other.
+
+Run from the scheduler/ directory:
+    python -m benchmarks.memory --n 1000000
+"""
+import argparse
+import copy
+import json
+import random
+import resource
+import subprocess
+import sys
+import time
+import numpy as np
+
+from utils.process import Process, fresh_run
+from utils.workload import Workload
+from algorithms.fcfs import solve_fcfs
+from algorithms.sjf import solve_sjf
+from algorithms.srtf import solve_srtf
+from algorithms.rr import solve_rr
+from algorithms.priority_np import solve_priority_np
+from algorithms.priority_p import solve_priority_p
+
+ALGORITHMS = {
+    'FCFS': (solve_fcfs, None),
+    'SJF': (solve_sjf, None),
+    'SRTF': (solve_srtf, None),
+    'RR': (solve_rr, 4),
+    'PRIO_NP': (solve_priority_np, None),
+    'PRIO_P': (solve_priority_p, None),
+}
+
+MODES = ('legacy', 'compact', 'columnar')
+
+class LegacyProcess:
+    """The original dict-based Process layout, kept here only as the baseline."""
+    def __init__(self, pid, arrival_time, burst_time, priority):
+        self.pid = pid
+        self.arrival_time = arrival_time
+        self.burst_time = burst_time
+        self.priority = priority
+        self.remaining_time = burst_time
+        self.start_time = None
+        self.completion_time = 0
+        self.waiting_time = 0
+        self.turnaround_time = 0
+        self.response_time = 0
+
+def build_workload(cls, n, seed):
+    rng = random.Random(seed)
+    # Poisson-like arrivals keep the CPU busy most of the time
+    arrivals = sorted(rng.randint(0, n * 5) for _ in range(n))
+    return [cls(f"P{i}", arrivals[i], rng.randint(1, 10), rng.randint(0, 9)) for i in range(n)]
+
+def build_columns(n, seed):
+    """The same workload as build_workload, generated straight into a columnar Workload."""
+    rng = random.Random(seed)
+    arrivals = np.array(sorted(rng.randint(0, n * 5) for _ in range(n)), dtype=np.int64)
+    bursts = np.empty(n, dtype=np.int64)
+    priorities = np.empty(n, dtype=np.int64)
+    for i in range(n):
+        bursts[i] = rng.randint(1, 10)
+        priorities[i] = rng.randint(0, 9)
+    pids = np.char.add('P', np.arange(n).astype(f'U{len(str(n))}'))
+    return Workload(pids, arrivals, bursts, priorities)
+
+def peak_rss_mb():
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def run_mode(mode, n, seed, algos):
+    """Runs every selected algorithm once in the given mode and returns the measurements."""
+    started = time.perf_counter()
+    if mode == 'legacy':
+        original = build_workload(LegacyProcess, n, seed)
+    elif mode == 'columnar':
+        original = build_columns(n, seed)
+    else:
+        original = build_workload(Process, n, seed)
+    build_seconds = time.perf_counter() - started
+
+    timings = {}
+    for name in algos:
+        func, q = ALGORITHMS[name]
+        t0 = time.perf_counter()
+        if mode == 'columnar':
+            original.run(func, q) if q else original.run(func)
+        else:
+            procs = copy.deepcopy(original) if mode == 'legacy' else fresh_run(original)
+            func(procs, q) if q else func(procs)
+        timings[name] = time.perf_counter() - t0
+
+    total = sum(timings.values())
+    return {
+        'mode': mode,
+        'n': n,
+        'build_seconds': round(build_seconds, 3),
+        'run_seconds': {name: round(t, 3) for name, t in timings.items()},
+        'throughput_procs_per_sec': round(n * len(algos) / total) if total else 0,
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Process representation memory/throughput benchmark")
+    parser.add_argument('--n', type=int, default=1_000_000, help="Number of processes (default: 1M)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--algos', type=str, default=','.join(ALGORITHMS),
+                        help="Comma-separated algorithms to run (default: all six)")
+    parser.add_argument('--mode', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    algos = args.algos.split(',')
+
+    if args.mode:
+        # Child process: measure a single mode and report it as JSON
+        print(json.dumps(run_mode(args.mode, args.n, args.seed, algos)))
+        return
+
+    results = []
+    for mode in MODES:
+        out = subprocess.run([sys.executable, '-m', 'benchmarks.memory', '--mode', mode,
+                              '--n', str(args.n), '--seed', str(args.seed), '--algos', args.algos],
+                             capture_output=True, text=True, check=True)
+        results.append(json.loads(out.stdout))
+
+    print(f"\n{'Mode':<10} {'Peak RSS (MB)':<15} {'Procs/sec':<12} {'Build (s)':<10}")
+    print("-" * 50)
+    for r in results:
+        print(f"{r['mode']:<10} {r['peak_rss_mb']:<15} {r['throughput_procs_per_sec']:<12} {r['build_seconds']:<10}")
+    legacy = results[0]
+    print()
+    for r in results[1:]:
+        print(f"{r['mode']}: peak RSS reduced {legacy['peak_rss_mb'] / r['peak_rss_mb']:.2f}x, "
+              f"throughput {r['throughput_procs_per_sec'] / max(legacy['throughput_procs_per_sec'], 1):.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# benchmarks/scaling.py
+"""
+Scaling benchmark for all six schedulers.
+
+For every workload size a synthetic trace is generated once. Each
+(algorithm, size) pair then runs in its own subprocess, so wall time and peak
+RSS are measured in isolation. Results go to a JSON file and can be checked
+against a saved baseline.
+
+Run from the scheduler/ directory:
+    python -m benchmarks.scaling --sizes 100,1000,10000,100000,1000000 --output bench.json
+    python -m benchmarks.scaling --output new.json --baseline bench.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.memory import ALGORITHMS, peak_rss_mb
+from utils.generator import generate_processes, write_processes
+
+DEFAULT_SIZES = '100,1000,10000,100000,1000000'
+
+def measure(filename, algorithm):
+    """Runs one algorithm on one trace (inside the child process) and returns its measurements."""
+    from utils.binary_cache import load_workload
+    processes = load_workload(filename).to_processes()
+    func, q = ALGORITHMS[algorithm]
+
+    started = time.perf_counter()
+    finished, log = func(processes, q) if q else func(processes)
+    wall = time.perf_counter() - started
+
+    # Simulated events: every Gantt segment plus every completion
+    events = len(log) + len(finished)
+    return {
+        'algorithm': algorithm,
+        'n': len(finished),
+        'wall_seconds': round(wall, 6),
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+        'events': events,
+        'events_per_sec': round(events / wall) if wall else None,
+    }
+
+def find_regressions(results, baseline, threshold):
+    """Returns readable descriptions of measurements that got worse than threshold x baseline."""
+    previous = {(r['algorithm'], r['n']): r for r in baseline['results']}
+    regressions = []
+    for r in results:
+        old = previous.get((r['algorithm'], r['n']))
+        if old is None:
+            continue
+        for metric in ('wall_seconds', 'peak_rss_mb'):
+            if old[metric] and r[metric] > old[metric] * threshold:
+                regressions.append(f"{r['algorithm']} n={r['n']}: {metric} {old[metric]} -> {r[metric]} "
+                                   f"({r[metric] / old[metric]:.2f}x)")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Scheduler scaling benchmark")
+    parser.add_argument('--sizes', type=str, default=DEFAULT_SIZES, help=f"Comma-separated sizes (default: {DEFAULT_SIZES})")
+    parser.add_argument('--algos', type=str, default=','.join(ALGORITHMS), help="Comma-separated algorithms (default: all six)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--arrival', type=str, default='poisson')
+    parser.add_argument('--burst', type=str, default='exponential')
+    parser.add_argument('--output', type=str, default='bench.json', help="JSON results file (default: bench.json)")
+    parser.add_argument('--baseline', type=str, help="Previous JSON results to check for regressions")
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help="Flag results slower/larger than threshold x baseline (default: 1.25)")
+    parser.add_argument('--measure', nargs=2, metavar=('FILE', 'ALGO'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        # Child process: one isolated measurement, reported as JSON
+        print(json.dumps(measure(*args.measure)))
+        return
+
+    sizes = [int(s) for s in args.sizes.split(',')]
+    algos = args.algos.split(',')
+    results = []
+
+    print(f"\n{'Algorithm':<10} {'N':<10} {'Wall (s)':<12} {'Peak RSS (MB)':<15} {'Events/sec':<12}")
+    print("-" * 62)
+    with tempfile.TemporaryDirectory() as workdir:
+        for n in sizes:
+            trace = os.path.join(workdir, f"trace_{n}.txt")
+            write_processes(trace, generate_processes(n, args.seed, args.arrival, args.burst))
+            for algo in algos:
+                out = subprocess.run([sys.executable, '-m', 'benchmarks.scaling', '--measure', trace, algo],
+                                     capture_output=True, text=True, check=True)
+                r = json.loads(out.stdout)
+                results.append(r)
+                print(f"{algo:<10} {n:<10} {r['wall_seconds']:<12.4f} {r['peak_rss_mb']:<15} {r['events_per_sec']:<12}")
+
+    report = {
+        'meta': {'python': platform.python_version(), 'machine': platform.machine(),
+                 'seed': args.seed, 'arrival': args.arrival, 'burst': args.burst},
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to '{args.output}'.")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = find_regressions(results, json.load(f), args.threshold)
+        if regressions:
+            print("\nREGRESSIONS:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\nNo regressions against the baseline.")
+
+if __name__ == "__main__":
+    main()
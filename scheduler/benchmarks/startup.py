@@ -0,0 +1,93 @@
+# benchmarks/startup.py
+"""
+Startup regression check for scheduler.py.
+
+Job scripts start scheduler.py once per simulation, so the plain run paths
+must not pull in heavy modules. Each scenario below runs scheduler.main() in
+a fresh child process (inside an empty working directory, so it starts with
+an empty result cache) and fails if numpy or matplotlib got imported.
+Wall times are printed next to a bare interpreter start for reference.
+
+Run from the scheduler/ directory:
+    python -m benchmarks.startup
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from utils.generator import generate_processes, write_processes
+
+HEAVY_MODULES = ('numpy', 'matplotlib')
+SCHEDULER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# A trace big enough to go through the result cache (see utils/result_cache.py)
+CACHED_SIZE = 6000
+
+def scenarios(small, large):
+    return [
+        ('FCFS, default options', ['--input', small, '--algo', 'FCFS']),
+        ('RR, --no-gantt', ['--input', small, '--algo', 'RR', '--quantum', '4', '--no-gantt']),
+        ('FCFS, cache miss', ['--input', large, '--algo', 'FCFS', '--no-gantt']),
+        ('FCFS, cache hit', ['--input', large, '--algo', 'FCFS', '--no-gantt']),
+        ('--batch', ['--batch', '-']),
+    ]
+
+def run_child(argv):
+    """Child process: runs scheduler.py with argv and reports the heavy modules it imported."""
+    sys.path.insert(0, SCHEDULER_DIR)
+    sys.argv = ['scheduler.py'] + argv
+    import scheduler
+    stdout = sys.stdout
+    with open(os.devnull, 'w') as sys.stdout:
+        scheduler.main()
+    sys.stdout = stdout
+    print(json.dumps([name for name in HEAVY_MODULES if name in sys.modules]))
+
+def timed(command, workdir, stdin=None):
+    started = time.perf_counter()
+    out = subprocess.run(command, cwd=workdir, input=stdin, capture_output=True, text=True,
+                         env={**os.environ, 'PYTHONPATH': SCHEDULER_DIR})
+    return out, time.perf_counter() - started
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that plain scheduler.py runs do not import heavy modules")
+    parser.add_argument('--child', nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        run_child(args.child)
+        return
+
+    failed = False
+    with tempfile.TemporaryDirectory() as workdir:
+        small = os.path.join(SCHEDULER_DIR, 'processes.txt')
+        large = os.path.join(workdir, 'large.txt')
+        write_processes(large, generate_processes(CACHED_SIZE, seed=1))
+        jobs = json.dumps({'input': small, 'algo': 'SJF'}) + '\n'
+
+        _, bare = timed([sys.executable, '-c', 'pass'], workdir)
+        print(f"\n{'Scenario':<24} {'Wall (ms)':<12} Heavy modules")
+        print("-" * 52)
+        print(f"{'python -c pass':<24} {bare * 1000:<12.0f}")
+        for name, argv in scenarios(small, large):
+            out, wall = timed([sys.executable, '-m', 'benchmarks.startup', '--child'] + argv, workdir,
+                              jobs if '--batch' in argv else None)
+            if out.returncode != 0:
+                print(f"{name:<24} failed:\n{out.stderr}")
+                failed = True
+                continue
+            heavy = json.loads(out.stdout.strip().splitlines()[-1])
+            print(f"{name:<24} {wall * 1000:<12.0f} {', '.join(heavy) or '-'}")
+            failed = failed or bool(heavy)
+
+    if failed:
+        print("\nStartup regression: a plain run imported a heavy module (or failed).")
+        sys.exit(1)
+    print("\nNo plain run imported " + " or ".join(HEAVY_MODULES) + ".")
+
+if __name__ == "__main__":
+    main()
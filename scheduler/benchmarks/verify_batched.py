@@ -0,0 +1,76 @@
+# benchmarks/verify_batched.py
+"""
+Differential check of the batched FCFS / SJF.
+
+batch_fcfs and batch_sjf evaluate many workloads at once with NumPy and
+promise the same schedules as solve_fcfs and solve_sjf. This script runs
+both on random batches (shared or per-workload arrivals, duplicate PIDs,
+ties, idle gaps) and reports the first process whose times differ.
+
+Run from the scheduler/ directory:
+    python -m benchmarks.verify_batched --cases 500
+"""
+import argparse
+import random
+import sys
+
+import numpy as np
+
+from utils.process import Process
+from algorithms.fcfs import solve_fcfs
+from algorithms.sjf import solve_sjf
+from algorithms.batched import batch_fcfs, batch_sjf
+
+FIELDS = ('start_time', 'completion_time', 'turnaround_time', 'waiting_time', 'response_time')
+
+def random_batch(rng):
+    """Returns (pids, arrivals, bursts); arrivals is 1-D (shared) or 2-D."""
+    w, n = rng.randint(1, 12), rng.randint(1, 10)
+    # PIDs sorted like the column order when pids=None is tested
+    pids = [f"P{rng.randint(1, 6)}" for _ in range(n)] if rng.random() < 0.5 else [f"P{j:02d}" for j in range(n)]
+    spread = rng.choice([0, 3, 15, 40])
+    if rng.random() < 0.3:
+        arrivals = np.array([rng.randint(0, spread) for _ in range(n)], dtype=np.int64)
+    else:
+        arrivals = np.array([[rng.randint(0, spread) for _ in range(n)] for _ in range(w)], dtype=np.int64)
+    bursts = np.array([[rng.randint(1, 8) for _ in range(n)] for _ in range(w)], dtype=np.int64)
+    return pids, arrivals, bursts
+
+def main():
+    parser = argparse.ArgumentParser(description="Check batch_fcfs / batch_sjf against solve_fcfs / solve_sjf")
+    parser.add_argument('--cases', type=int, default=500, help="Number of random batches (default: 500)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    workloads = 0
+    for case in range(args.cases):
+        pids, arrivals, bursts = random_batch(rng)
+        sorted_pids = pids == sorted(pids)
+        for name, batch, solve in (('FCFS', batch_fcfs, solve_fcfs), ('SJF', batch_sjf, solve_sjf)):
+            # Unique, column-ordered PIDs also exercise the pids=None path
+            result = batch(arrivals, bursts, None if sorted_pids and rng.random() < 0.5 else pids)
+            expected_avg = []
+            for i in range(len(bursts)):
+                row = arrivals if arrivals.ndim == 1 else arrivals[i]
+                processes = [Process(pid, int(a), int(b), 0) for pid, a, b in zip(pids, row, bursts[i])]
+                solve(list(processes)) # The solvers sort their list in place
+                for j, p in enumerate(processes):
+                    for field in FIELDS:
+                        if getattr(result, field)[i, j] != getattr(p, field):
+                            print(f"Mismatch in case {case} ({name}), workload {i}, process {p.pid} (column {j}): "
+                                  f"{field} {getattr(result, field)[i, j]} != {getattr(p, field)}")
+                            print(f"  {processes}")
+                            sys.exit(1)
+                expected_avg.append([sum(getattr(p, f) for p in processes) / len(processes)
+                                     for f in ('turnaround_time', 'waiting_time', 'response_time')])
+            if not np.allclose(np.array(result.average_metrics()).T, expected_avg):
+                print(f"Mismatch in case {case} ({name}): averages differ")
+                sys.exit(1)
+        workloads += len(bursts)
+
+    print(f"{args.cases} random batches ({workloads} workloads): batch_fcfs and batch_sjf "
+          f"match solve_fcfs and solve_sjf.")
+
+if __name__ == "__main__":
+    main()
@@ -1,69 +1,350 @@
 # compare.py
-import matplotlib.pyplot as plt
-import copy
+import argparse
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from utils.parser import parse_file
-from utils.statistics import calculate_metrics, count_context_switches
-
-# Import algorithms
-from algorithms.fcfs import solve_fcfs
-from algorithms.sjf import solve_sjf
-from algorithms.srtf import solve_srtf
-from algorithms.rr import solve_rr
-from algorithms.priority_np import solve_priority_np
-from algorithms.priority_p import solve_priority_p
-
-def main():
-    filename = 'processes.txt'
-    original_procs = parse_file(filename)
-    if not original_procs: return
-
-    # Define algorithms to test 
-    # Format: (Display Name, Function, Quantum or None)
-    test_suite = [
-        ('FCFS', solve_fcfs, None),
-        ('SJF', solve_sjf, None),
-        ('SRTF', solve_srtf, None),
-        ('RR (q=4)', solve_rr, 4),
-        ('PRIO_NP', solve_priority_np, None),
-        ('PRIO_P', solve_priority_p, None)
-    ]
+from utils.process import fresh_run
+from utils.observer import MetricsSink
+from utils.profiler import Profiler, ProfilingSink, print_profile, write_profile_json
+from utils.replication import RunningStats, build_replica
+from utils.quantiles import TAIL_METRICS, make_quantiles, summarize, print_tail_table
 
-    names, waits, turns, responses, cs_counts = [], [], [], [], []
+# Algorithms come from the registry and are imported on first use; matplotlib
+# and numpy (binary cache) are also only imported when needed
+from algorithms import get_solver, solver_defaults
+
+# Define algorithms to test
+# Format: (Display Name, Algorithm name in the registry, Quantum or None)
+TEST_SUITE = [
+    ('FCFS', 'FCFS', None),
+    ('SJF', 'SJF', None),
+    ('SRTF', 'SRTF', None),
+    ('RR (q=4)', 'RR', 4),
+    ('PRIO_NP', 'PRIO_NP', None),
+    ('PRIO_P', 'PRIO_P', None),
+    ('CFS', 'CFS', None),
+    ('MLFQ', 'MLFQ', None)
+]
+
+def run_algorithm(procs, algo, q, profile=False, cache=None, key=None, percentiles=None):
+    """
+    Runs the registered algorithm algo and returns (avg_t, avg_w, avg_r, cs, wall_seconds, profile, tails).
+    The results are also written into procs, which the suite reuses for the
+    next algorithm (see fresh_run): everything the caller needs is in the tuple.
+    profile is None unless profiling was requested (see utils/profiler.py).
+    tails is None unless percentiles ('sketch' or 'exact') was given; otherwise it
+    maps each metric to its quantile estimator (see utils/quantiles.py).
+    With a ResultCache and key, a stored result is returned without simulating.
+    """
+    started = time.perf_counter()
+    profiler = Profiler()
+
+    if cache is not None:
+        hit = cache.get(key)
+        if hit is not None:
+            sink = hit.sink()
+            avg_t, avg_w, avg_r = sink.averages()
+            tails = hit.tails(percentiles) if percentiles else None
+            return avg_t, avg_w, avg_r, sink.context_switches, time.perf_counter() - started, None, tails
+        inputs = list(procs) # Input order, before a solver sorts the list in place
+
+    # Collect stats in the same pass as the simulation; the table does not
+    # need the timeline, so it is not stored at all
+    sink = ProfilingSink(percentiles) if profile else MetricsSink(percentiles)
+    hooks = {'observer': sink, 'record_gantt': False}
+    func = get_solver(algo)
+    with profiler.phase('simulate'):
+        result_procs, _ = func(procs, q, **hooks) if q else func(procs, **hooks)
+    if cache is not None:
+        cache.put(key, inputs, result_procs, None, sink)
+
+    with profiler.phase('metrics'):
+        avg_t, avg_w, avg_r = sink.averages()
+    report = profiler.report(sink) if profile else None
+    return avg_t, avg_w, avg_r, sink.context_switches, time.perf_counter() - started, report, sink.tails
+
+def result_key(cache, digest, algo, q):
+    """
+    Result cache key of a suite entry: the solver's default options plus the
+    quantum, the same key scheduler.py uses for that run.
+    """
+    options = solver_defaults(algo)
+    if q:
+        options['quantum'] = q
+    return cache.run_key(digest, algo, options)
+
+def run_in_worker(task):
+    """
+    Process-pool entry point. Workers receive only (filename, suite index) and
+    memory-map the workload from its binary cache, so no Process lists are pickled.
+    """
+    filename, index, profile, use_cache, percentiles = task
+    from utils.binary_cache import load_workload
+    from utils.result_cache import ResultCache, workload_digest, worth_caching
+    _, algo, q = TEST_SUITE[index]
+    procs = load_workload(filename, errors=[]).to_processes() # The parent already reported bad lines
+    cache = ResultCache() if use_cache and worth_caching(procs) else None
+    key = result_key(cache, workload_digest(procs), algo, q) if cache else None
+    return run_algorithm(procs, algo, q, profile, cache, key, percentiles)
+
+def run_suite(filename, jobs, profile=False, use_cache=True, percentiles=None):
+    """
+    Returns one result tuple per TEST_SUITE entry, always in table order.
+    Results are looked up in the on-disk result cache first (never when profiling,
+    since cached runs have no engine counters).
+    """
+    use_cache = use_cache and not profile
+    if jobs <= 1:
+        parse_started = time.perf_counter()
+        original_procs = parse_file(filename)
+        parse_seconds = time.perf_counter() - parse_started
+        if not original_procs: return None
+        cache = None
+        if use_cache:
+            from utils.result_cache import ResultCache, workload_digest, worth_caching
+            use_cache = worth_caching(original_procs)
+        if use_cache:
+            cache = ResultCache()
+            digest = workload_digest(original_procs)
+        # Reuse the same records for every run: the input fields are never
+        # written and only the result fields are reset (no deepcopy per
+        # algorithm). Each run overwrites the previous run's per-process
+        # results, so only the tuple run_algorithm returns is kept.
+        results = [run_algorithm(fresh_run(original_procs), algo, q, profile,
+                                 cache, result_key(cache, digest, algo, q) if cache else None, percentiles)
+                   for _, algo, q in TEST_SUITE]
+        # The workload is parsed once for the whole suite; every profile shows that cost
+        for result in results:
+            if result[5] is not None:
+                result[5]['phases'] = {'parse': round(parse_seconds, 6), **result[5]['phases']}
+        return results
+
+    # Build (or validate) the binary cache once before the workers map it.
+    # Bad input gets the same treatment as with --jobs 1: parse_file prints
+    # the error and exits (lines with too few fields are skipped by both)
+    from utils.binary_cache import load_workload
+    errors = []
+    try:
+        workload = load_workload(filename, errors=errors)
+    except FileNotFoundError:
+        parse_file(filename)
+    if errors:
+        parse_file(filename)
+    if len(workload) == 0: return None
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        # map() yields results in submission order, keeping the table deterministic
+        tasks = [(filename, i, profile, use_cache, percentiles) for i in range(len(TEST_SUITE))]
+        return list(pool.map(run_in_worker, tasks))
+
+# Workload the replication workers resample from (set once per worker by the pool initializer)
+_replica_source = None
+
+def init_replica_worker(source):
+    global _replica_source
+    _replica_source = source
+
+def run_replica(task):
+    """
+    Builds one replication workload and returns ((avg_t, avg_w, avg_r, cs), tails)
+    for every suite entry; tails is None unless percentiles was requested.
+    """
+    mode, n, seed, percentiles = task
+    procs = build_replica(mode, n, seed, _replica_source)
+    # Every algorithm reuses the same records (see fresh_run); only the aggregates are kept
+    rows = []
+    for _, algo, q in TEST_SUITE:
+        result = run_algorithm(fresh_run(procs), algo, q, percentiles=percentiles)
+        rows.append((result[:4], result[6]))
+    return rows
+
+def run_replications(filename, replications, seed, jobs, mode, size, ci_width, batch=10, percentiles=None):
+    """
+    Monte Carlo mode: runs the suite on many generated or resampled workloads
+    and prints the mean and 95% confidence interval of every metric.
+    Results are folded into Welford accumulators as they arrive, so memory does
+    not grow with the number of replications. With ci_width, it stops as soon as
+    every interval's half-width is within ci_width of its mean (checked after
+    each batch, so the stopping point does not depend on --jobs).
+    With percentiles, the quantile estimators of every replication are merged
+    into one per algorithm and metric (pooled over all processes of all runs).
+    """
+    source = parse_file(filename)
+    if not source: return
+    n = size or len(source)
+
+    # stats[algorithm][metric] for metric in (turnaround, waiting, response, context switches)
+    stats = [[RunningStats() for _ in range(4)] for _ in TEST_SUITE]
+    pooled = [{metric: make_quantiles(percentiles) for metric in TAIL_METRICS} for _ in TEST_SUITE] if percentiles else None
+    resample_from = source if mode == 'resample' else None
+    pool = None
+    if jobs > 1:
+        pool = ProcessPoolExecutor(max_workers=jobs, initializer=init_replica_worker, initargs=(resample_from,))
+    else:
+        init_replica_worker(resample_from)
+
+    done = 0
+    converged = False
+    try:
+        while done < replications and not converged:
+            tasks = [(mode, n, seed + i, percentiles) for i in range(done, min(replications, done + batch))]
+            for row in (pool.map(run_replica, tasks) if pool else map(run_replica, tasks)):
+                for algo, (metrics, tails) in enumerate(row):
+                    for acc, value in zip(stats[algo], metrics):
+                        acc.add(value)
+                    if pooled:
+                        for metric, estimator in tails.items():
+                            pooled[algo][metric].merge(estimator)
+            done += len(tasks)
+            if ci_width is not None:
+                converged = all(acc.ci95() <= ci_width * abs(acc.mean)
+                                for algo_stats in stats for acc in algo_stats)
+    finally:
+        if pool: pool.shutdown()
+
+    print(f"\n{done} replications ({mode}, {n} processes each, seed {seed})"
+          + (", stopped early: every interval is within the requested width" if converged and done < replications else ""))
+    print("=" * 110)
+    print(f"{'Algorithm':<15} {'Avg Turn':<24} {'Avg Wait':<24} {'Avg Resp':<24} {'CS':<24}")
+    print("-" * 110)
+    for (name, _, _), algo_stats in zip(TEST_SUITE, stats):
+        cells = [f"{acc.mean:.2f} ± {acc.ci95():.2f}" for acc in algo_stats]
+        print(f"{name:<15} " + " ".join(f"{cell:<24}" for cell in cells))
+    print("=" * 110)
+
+    if pooled:
+        print_tail_tables(percentiles, {name: {metric: summarize(est) for metric, est in tails.items()}
+                                        for (name, _, _), tails in zip(TEST_SUITE, pooled)},
+                          "pooled over all replications")
+
+def print_tail_tables(mode, summaries, note=None):
+    """One p50/p95/p99/max table per metric, with a row per algorithm; summaries[algo][metric]."""
+    for metric in TAIL_METRICS:
+        title = f"{metric.upper()} TIME PERCENTILES ({mode}" + (f", {note})" if note else ")")
+        print_tail_table(title, {name: algo[metric] for name, algo in summaries.items()})
+
+def parse_range(spec):
+    """Parses 'start:end' or 'start:end:step' (inclusive) into a range of quanta."""
+    parts = [int(x) for x in spec.split(':')]
+    if len(parts) not in (2, 3) or parts[0] < 1:
+        raise argparse.ArgumentTypeError("expected start:end or start:end:step with start >= 1")
+    step = parts[2] if len(parts) == 3 else 1
+    return range(parts[0], parts[1] + 1, step)
+
+def run_rr_sweep(filename, quanta, jobs):
+    """Prints the RR quantum sweep table and saves the metric curves."""
+    from algorithms.rr_sweep import sweep_rr
+    procs = parse_file(filename)
+    if not procs: return
+
+    rows = sweep_rr(procs, quanta, jobs)
 
     print("\n" + "="*80)
-    print(f"{'Algorithm':<15} {'Avg Turn':<15} {'Avg Wait':<15} {'Avg Resp':<15} {'CS':<5}")
+    print(f"{'Quantum':<10} {'Avg Turn':<15} {'Avg Wait':<15} {'Avg Resp':<15} {'CS':<8}")
     print("-" * 80)
+    for row in rows:
+        print(f"{row['quantum']:<10} {row['avg_turnaround']:<15.2f} {row['avg_waiting']:<15.2f} "
+              f"{row['avg_response']:<15.2f} {row['context_switches']:<8}")
+
+    import matplotlib.pyplot as plt
+    if not os.path.exists('graphs'): os.makedirs('graphs')
+
+    qs = [row['quantum'] for row in rows]
+    fig, ax = plt.subplots(figsize=(10, 5))
+    ax.plot(qs, [row['avg_waiting'] for row in rows], label='Avg Waiting')
+    ax.plot(qs, [row['avg_turnaround'] for row in rows], label='Avg Turnaround')
+    ax.plot(qs, [row['avg_response'] for row in rows], label='Avg Response')
+    ax.set_xlabel('Quantum')
+    ax.set_ylabel('Time (units)')
+    cs_axis = ax.twinx()
+    cs_axis.plot(qs, [row['context_switches'] for row in rows], color='gray', linestyle='--', label='Context Switches')
+    cs_axis.set_ylabel('Context Switches')
+    fig.legend(loc='upper right')
+    ax.set_title('Round Robin Metrics vs Quantum')
+    fig.savefig('graphs/rr_sweep.png')
+
+    print("\n Graph saved as 'graphs/rr_sweep.png'.")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare all scheduling algorithms on one workload")
+    parser.add_argument('--input', type=str, default='processes.txt', help="Path to input file (default: processes.txt)")
+    parser.add_argument('--jobs', type=int, default=1, help="Number of algorithms to run in parallel (default: 1)")
+    parser.add_argument('--rr-sweep', type=parse_range, metavar='START:END[:STEP]',
+                        help="Evaluate Round Robin over a range of quanta instead of the algorithm table")
+    parser.add_argument('--profile', action='store_true',
+                        help="Print time per phase and engine counters for every algorithm")
+    parser.add_argument('--profile-json', type=str, metavar='PATH',
+                        help="Write the per-algorithm profiles as JSON to PATH (implies --profile)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Re-simulate everything instead of reusing results from the result cache")
+    parser.add_argument('--replications', type=int, metavar='K',
+                        help="Monte Carlo mode: run the suite on K workloads and report 95%% confidence intervals")
+    parser.add_argument('--seed', type=int, default=0, help="First replication seed (default: 0)")
+    parser.add_argument('--resample', action='store_true',
+                        help="Bootstrap the replications from --input instead of generating synthetic workloads")
+    parser.add_argument('--size', type=int, help="Processes per replication (default: same as --input)")
+    parser.add_argument('--ci-width', type=float, metavar='FRACTION',
+                        help="Stop early once every interval is within this fraction of its mean (e.g. 0.05)")
+    parser.add_argument('--percentiles', choices=['sketch', 'exact'],
+                        help="Also report p50/p95/p99/max per algorithm: 'sketch' (bounded memory) or 'exact'")
+    parser.add_argument('--no-graphs', action='store_true',
+                        help="Only print the table (skips matplotlib, which is most of the startup time)")
+    args = parser.parse_args(argv)
+
+    if args.rr_sweep:
+        run_rr_sweep(args.input, args.rr_sweep, args.jobs)
+        return
+
+    if args.replications:
+        run_replications(args.input, args.replications, args.seed, args.jobs,
+                         'resample' if args.resample else 'generate', args.size, args.ci_width,
+                         percentiles=args.percentiles)
+        return
+
+    profile = args.profile or args.profile_json is not None
+    results = run_suite(args.input, args.jobs, profile, not args.no_cache, args.percentiles)
+    if not results: return
+
+    names, waits, turns, responses, cs_counts = [], [], [], [], []
+
+    print("\n" + "="*90)
+    print(f"{'Algorithm':<15} {'Avg Turn':<15} {'Avg Wait':<15} {'Avg Resp':<15} {'CS':<8} {'Wall (s)':<10}")
+    print("-" * 90)
+
+    for (name, _, _), (avg_t, avg_w, avg_r, cs, wall, _, _) in zip(TEST_SUITE, results):
+        print(f"{name:<15} {avg_t:<15.2f} {avg_w:<15.2f} {avg_r:<15.2f} {cs:<8} {wall:<10.3f}")
 
-    for name, func, q in test_suite:
-        # Use deepcopy to ensure each algorithm starts with fresh process data
-        procs_copy = copy.deepcopy(original_procs)
-        
-        # Run algorithm
-        finished, log = func(procs_copy, q) if q else func(procs_copy)
-        
-        # Collect stats 
-        avg_t, avg_w, avg_r = calculate_metrics(finished)
-        cs = count_context_switches(log)
-        
-        print(f"{name:<15} {avg_t:<15.2f} {avg_w:<15.2f} {avg_r:<15.2f} {cs:<5}")
-        
         # Store for graphs
         names.append(name)
         waits.append(avg_w)
         turns.append(avg_t)
 
+    if args.percentiles:
+        print_tail_tables(args.percentiles, {name: {metric: summarize(est) for metric, est in result[6].items()}
+                                             for (name, _, _), result in zip(TEST_SUITE, results)})
+
+    if profile:
+        reports = {name: result[5] for (name, _, _), result in zip(TEST_SUITE, results)}
+        for name, report in reports.items():
+            print_profile(name, report)
+        if args.profile_json:
+            write_profile_json(args.profile_json, reports)
+            print(f"Profile written to '{args.profile_json}'.")
+
+    if args.no_graphs: return
+
     # --- Generate Required Graphs  ---
+    import matplotlib.pyplot as plt
     if not os.path.exists('graphs'): os.makedirs('graphs')
 
-    # Graph 1: Avg Waiting Time 
+    # Graph 1: Avg Waiting Time
     plt.figure(figsize=(10, 5))
     plt.bar(names, waits, color='skyblue')
     plt.title('Average Waiting Time vs Algorithm')
     plt.ylabel('Time (units)')
-    plt.savefig('graphs/waiting.png') 
+    plt.savefig('graphs/waiting.png')
 
-    # Graph 2: Avg Turnaround Time 
+    # Graph 2: Avg Turnaround Time
     plt.figure(figsize=(10, 5))
     plt.bar(names, turns, color='salmon')
     plt.title('Average Turnaround Time vs Algorithm')
@@ -73,4 +354,4 @@ def main():
     print("\n Graphs saved in 'graphs/' directory.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
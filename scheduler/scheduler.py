@@ -1,17 +1,115 @@
 # scheduler.py
 import argparse
+import itertools
+import json
 import sys
-from utils.parser import parse_file
-from utils.gantt import render_gantt_chart
-from utils.statistics import calculate_metrics, count_context_switches
-
-# Import algorithms
-from algorithms.fcfs import solve_fcfs
-from algorithms.sjf import solve_sjf
-from algorithms.srtf import solve_srtf
-from algorithms.rr import solve_rr
-from algorithms.priority_np import solve_priority_np
-from algorithms.priority_p import solve_priority_p
+import time
+from utils.parser import parse_file, read_processes, iter_records
+from utils.process import Process, fresh_run
+from utils.gantt import render_gantt_chart, export_gantt_svg
+from utils.timeline_index import index_timeline
+from utils.timeline_store import TimelineStore
+from utils.statistics import calculate_metrics, calculate_percentiles
+from utils.quantiles import summarize, print_tail_table
+from utils.observer import MetricsSink
+from utils.profiler import Profiler, ProfilingSink, print_profile, write_profile_json
+
+# Algorithms are looked up in the registry and imported on first use; the
+# multi-CPU, streaming and result-cache modules (and numpy) are imported by
+# the code paths that need them, so a plain run starts quickly
+from algorithms import algorithm_names, get_solver, solver_options
+
+def parse_window(spec):
+    """Parses a 'start:end' time window for the Gantt chart options."""
+    try:
+        start, end = (int(x) for x in spec.split(':'))
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected start:end")
+    if end <= start:
+        raise argparse.ArgumentTypeError("window end must be greater than its start")
+    return start, end
+
+def positive_int(value):
+    """argparse type for counts and intervals that must be at least 1, e.g. --cpus."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an integer, got '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
+
+def non_negative_int(value):
+    """argparse type for intervals where 0 means off, e.g. --boost-interval."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an integer, got '{value}'")
+    if number < 0:
+        raise argparse.ArgumentTypeError("must be 0 or greater")
+    return number
+
+def non_negative_float(value):
+    """argparse type for rates that must not be negative, e.g. --aging."""
+    try:
+        rate = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a number, got '{value}'")
+    if not 0 <= rate < float('inf'): # Also rejects nan
+        raise argparse.ArgumentTypeError("must be a finite number, 0 or greater")
+    return rate
+
+def parse_quanta(spec):
+    """Parses the comma-separated MLFQ quanta, e.g. '4,8,16'."""
+    try:
+        quanta = tuple(int(x) for x in spec.split(','))
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected comma-separated integers")
+    if not quanta or min(quanta) < 1:
+        raise argparse.ArgumentTypeError("every quantum must be at least 1")
+    return quanta
+
+def json_option(kinds, convert=None, nullable=False):
+    """
+    Builds the check for one --batch job option: the JSON value must have one
+    of the given types (bool never counts as a number) and then goes through
+    the same argparse type as the command-line option.
+    """
+    def check(value):
+        if value is None and nullable:
+            return None
+        if isinstance(value, bool) != (bool in kinds) or not isinstance(value, kinds):
+            labels = {int: "an integer", float: "a number", bool: "true or false", str: "a string", list: "a list"}
+            names = " or ".join(labels[kind] for kind in kinds if not (kind is int and float in kinds))
+            raise argparse.ArgumentTypeError(f"expected {names}, got {json.dumps(value)}")
+        return convert(value) if convert else value
+    return check
+
+def job_quanta(value):
+    """Batch counterpart of --mlfq-quanta: either '4,8,16' or [4, 8, 16]."""
+    if isinstance(value, list):
+        if not all(isinstance(q, int) and not isinstance(q, bool) for q in value):
+            raise argparse.ArgumentTypeError("expected a list of integers")
+        value = ",".join(map(str, value))
+    return parse_quanta(value)
+
+def percentile_mode(value):
+    """Batch counterpart of the --percentiles choices."""
+    if value not in ('sketch', 'exact'):
+        raise argparse.ArgumentTypeError("expected 'sketch' or 'exact'")
+    return value
+
+# Options a --batch job may set besides input and algo, with the check for each value
+BATCH_OPTIONS = {
+    'quantum': json_option((int,), positive_int, nullable=True),
+    'coalesce': json_option((bool,)),
+    'aging': json_option((int, float), non_negative_float),
+    'target_latency': json_option((int,), positive_int),
+    'min_granularity': json_option((int,), positive_int),
+    'mlfq_quanta': json_option((str, list), job_quanta),
+    'boost_interval': json_option((int,), non_negative_int),
+    'percentiles': json_option((str,), percentile_mode, nullable=True),
+}
 
 def print_execution_log(gantt_log):
     """Prints a detailed timeline log of scheduling events."""
@@ -34,57 +132,475 @@ def print_results_table(processes):
               f"{p.turnaround_time:<12} {p.waiting_time:<10} {p.response_time:<10}")
     print("="*85)
 
+def run_stream(args):
+    """
+    Streaming mode: reads the input line by line, feeds the online engine and
+    prints every segment and finished process as soon as it is final.
+    Only running totals are kept, so memory does not grow with the trace.
+    With --checkpoint the run stops after the last arrival (or the last one at
+    or before --checkpoint-at) and saves the engine state; --resume continues
+    from such a file with only the new arrivals in --input.
+    """
+    from algorithms.online import ONLINE_ENGINES, make_online
+    from utils.checkpoint import StreamMetrics, save_checkpoint, load_checkpoint
+
+    if args.resume:
+        try:
+            algo, quantum, engine, metrics = load_checkpoint(args.resume)
+        except (FileNotFoundError, ValueError) as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        if algo != args.algo or (args.quantum is not None and args.quantum != quantum):
+            print(f"Error: the checkpoint was written by {algo}" + (f" with quantum {quantum}" if quantum else "") + ".")
+            return
+        if args.percentiles and args.percentiles != metrics.percentiles:
+            print(f"Error: the checkpoint collects percentiles in mode '{metrics.percentiles}'.")
+            return
+    else:
+        if args.algo == 'RR' and args.quantum is None:
+            print("Error: --quantum is required for RR algorithm.")
+            return
+        if args.algo == 'PRIO_P' and args.aging:
+            print("Error: --aging is not supported with --stream.")
+            return
+        if args.algo not in ONLINE_ENGINES:
+            print(f"Error: {args.algo} is not supported with --stream.")
+            return
+        engine = make_online(args.algo, args.quantum)
+        metrics = StreamMetrics(args.percentiles)
+
+    def report(event):
+        if event[0] == 'segment':
+            _, pid, start, end = event
+            print(f"t={start}-{end}: {pid} running")
+        else:
+            p = event[1]
+            print(f"t={p.completion_time}: {p.pid} completed "
+                  f"(Turn={p.turnaround_time}, Wait={p.waiting_time}, Resp={p.response_time})")
+        metrics.add(event)
+
+    print("\n--- STREAMING EXECUTION LOG ---")
+    arrivals = (Process(*fields) for fields in iter_records(args.input))
+    if args.checkpoint_at is not None:
+        arrivals = itertools.takewhile(lambda p: p.arrival_time <= args.checkpoint_at, arrivals)
+    try:
+        for process in arrivals:
+            for event in engine.push(process):
+                report(event)
+        if args.checkpoint:
+            save_checkpoint(args.checkpoint, args.algo, getattr(engine, 'quantum', None), engine, metrics)
+            print(f"Checkpoint written to '{args.checkpoint}' at t={engine.current_time} "
+                  f"({metrics.completed} processes completed so far).")
+            return
+        for event in engine.close():
+            report(event)
+    except FileNotFoundError:
+        print(f"Error: Input file '{args.input}' not found.")
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    if metrics.completed:
+        avg_t, avg_w, avg_r = metrics.averages()
+        print(f"Average Turnaround Time: {avg_t:.2f}")
+        print(f"Average Waiting Time: {avg_w:.2f}")
+        print(f"Average Response Time: {avg_r:.2f}")
+        print(f"Total Context Switches: {metrics.context_switches}")
+        if metrics.tails is not None:
+            print_tails(metrics.percentiles, {metric: summarize(est) for metric, est in metrics.tails.items()})
+
+def print_tails(mode, summary):
+    """Prints the p50/p95/p99/max table of turnaround, waiting and response times."""
+    print_tail_table(f"TAIL LATENCY ({mode})", {metric.capitalize(): values for metric, values in summary.items()})
+
+def print_summary(sink):
+    """Prints the averages and system-level metrics accumulated during the run."""
+    avg_t, avg_w, avg_r = sink.averages()
+    print(f"Average Turnaround Time: {avg_t:.2f}")
+    print(f"Average Waiting Time: {avg_w:.2f}")
+    print(f"Average Response Time: {avg_r:.2f}")
+    print(f"Total Context Switches: {sink.context_switches}")
+    print(f"CPU Utilization: {sink.cpu_utilization() * 100:.2f}%")
+    print(f"Total Idle Time: {sink.idle_time}")
+    print(f"Throughput: {sink.throughput():.4f} processes/unit")
+
+def tail_summary(sink, result_procs, mode):
+    """Percentiles collected by the sink during the run, or from the processes for a cached result."""
+    if sink.tails is not None:
+        return sink.tail_summary()
+    return calculate_percentiles(result_procs, mode)
+
+def run_smp(args, processes):
+    """Multi-CPU mode: runs the algorithm on --cpus cores and prints per-core results."""
+    from algorithms.smp import SMP_POLICIES, solve_smp, core_utilization, load_imbalance
+
+    if args.algo == 'RR' and args.quantum is None:
+        print("Error: --quantum is required for RR algorithm.")
+        return
+    if args.aging:
+        print("Error: --aging is not supported with --cpus.")
+        return
+    if args.algo != 'RR' and args.algo not in SMP_POLICIES:
+        print(f"Error: {args.algo} is not supported with --cpus.")
+        return
+
+    result_procs, core_logs, stats = solve_smp(processes, args.algo, args.cpus, args.quantum,
+                                               args.queues, args.balance, args.balance_interval,
+                                               record_gantt=not args.no_gantt)
+
+    if not args.no_gantt:
+        print_results_table(result_procs)
+    avg_t, avg_w, avg_r = calculate_metrics(result_procs)
+    print(f"Average Turnaround Time: {avg_t:.2f}")
+    print(f"Average Waiting Time: {avg_w:.2f}")
+    print(f"Average Response Time: {avg_r:.2f}")
+    print(f"Total Context Switches: {sum(stats['context_switches'])}")
+    print(f"Migrations: {stats['migrations']}")
+    if args.percentiles:
+        print_tails(args.percentiles, calculate_percentiles(result_procs, args.percentiles))
+
+    print("\n" + "="*50)
+    print(f"{'CPU':<6} {'Busy':<12} {'Util':<10} {'CS':<8}")
+    print("-" * 50)
+    for core, util in enumerate(core_utilization(stats)):
+        print(f"{core:<6} {stats['busy'][core]:<12} {util * 100:<10.2f} {stats['context_switches'][core]:<8}")
+    print("="*50)
+    print(f"Load Imbalance: {load_imbalance(stats) * 100:.2f}%")
+
+    if not args.no_gantt:
+        for core, log in enumerate(core_logs):
+            print(f"\n--- CPU {core} ---")
+            if log:
+                render_gantt_chart(log, window=args.gantt_window, width=args.gantt_width)
+            else:
+                print("(idle)")
+
+def simulate(args, processes, hooks):
+    """Runs args.algo from the registry, passing it the command-line options it takes."""
+    solver = get_solver(args.algo)
+    options = [getattr(args, name) for name in solver_options(args.algo)]
+    return solver(processes, *options, **hooks)
+
+def result_key(cache, args, processes):
+    """Result cache key: the workload plus the algorithm and the options it runs with."""
+    from utils.result_cache import workload_digest
+    return cache.run_key(workload_digest(processes), args.algo,
+                         {name: getattr(args, name) for name in solver_options(args.algo)})
+
+def run_job(job, defaults, processes, cache):
+    """Runs one --batch job and returns its JSON result (an 'error' field if it cannot run)."""
+    args = argparse.Namespace(**vars(defaults))
+    for name, value in job.items():
+        if name in BATCH_OPTIONS:
+            try:
+                value = BATCH_OPTIONS[name](value)
+            except argparse.ArgumentTypeError as e:
+                return {'error': f"{name}: {e}"}
+        setattr(args, name, value)
+    if args.algo == 'RR' and args.quantum is None:
+        return {'error': "quantum is required for RR"}
+
+    started = time.perf_counter()
+    if cache is not None:
+        from utils.result_cache import worth_caching
+        if not worth_caching(processes):
+            cache = None
+    cached = None
+    if cache is not None:
+        key = result_key(cache, args, processes)
+        cached = cache.get(key)
+    if cached is not None:
+        result_procs, _, sink = cached.restore(processes)
+    else:
+        inputs = list(processes)
+        sink = MetricsSink(args.percentiles)
+        result_procs, _ = simulate(args, processes, {'observer': sink, 'record_gantt': False})
+        if cache is not None:
+            cache.put(key, inputs, result_procs, None, sink)
+
+    avg_t, avg_w, avg_r = sink.averages()
+    result = {
+        'processes': sink.completed,
+        'avg_turnaround': avg_t,
+        'avg_waiting': avg_w,
+        'avg_response': avg_r,
+        'context_switches': sink.context_switches,
+        'cpu_utilization': sink.cpu_utilization(),
+        'idle_time': sink.idle_time,
+        'throughput': sink.throughput(),
+        'cached': cached is not None,
+        'wall_seconds': round(time.perf_counter() - started, 6),
+    }
+    if args.percentiles:
+        summary = tail_summary(sink, result_procs, args.percentiles)
+        result['tails'] = {metric: dict(zip(('p50', 'p95', 'p99', 'max'), values))
+                                 for metric, values in summary.items()}
+    return result
+
+def run_batch(args):
+    """
+    Batch mode: runs every job of a JSON-lines file ('-' reads stdin) in this
+    one process and prints one JSON line per job, so interpreter startup and
+    imports are paid once. A job is an object with "input" and "algo"; any
+    other key sets the option of the same name for that job only, e.g.
+        {"input": "day1.txt", "algo": "RR", "quantum": 4}
+    Options given on the command line are the defaults for every job.
+    Consecutive jobs on the same input share one parse.
+    """
+    cache = None
+    if not args.no_cache:
+        from utils.result_cache import ResultCache
+        cache = ResultCache()
+    try:
+        jobs = sys.stdin if args.batch == '-' else open(args.batch, 'r')
+    except OSError as e:
+        print(f"Error: cannot read jobs file '{args.batch}': {e.strerror}")
+        sys.exit(1)
+    loaded_path, processes = None, None
+    try:
+        for number, line in enumerate(jobs, 1):
+            if not line.strip():
+                continue
+            try:
+                job = json.loads(line)
+            except json.JSONDecodeError as e:
+                job = {'error': f"invalid JSON: {e}"}
+            if not isinstance(job, dict):
+                job = {'error': "a job must be a JSON object"}
+            unknown = set(job) - {'input', 'algo'} - set(BATCH_OPTIONS)
+
+            if 'error' in job:
+                result = {}
+            elif not isinstance(job.get('input'), str) or job.get('algo') not in algorithm_names():
+                result = {'error': f"a job needs an input file and one of: {', '.join(algorithm_names())}"}
+            elif unknown:
+                result = {'error': f"unknown options: {', '.join(sorted(unknown))}"}
+            else:
+                try:
+                    if job['input'] != loaded_path:
+                        processes = read_processes(job['input'])
+                        loaded_path = job['input']
+                    result = run_job(job, args, fresh_run(processes), cache)
+                except FileNotFoundError:
+                    result = {'error': f"input file '{job['input']}' not found"}
+                except (ValueError, argparse.ArgumentTypeError) as e:
+                    result = {'error': str(e)}
+                except Exception as e: # One broken job must not stop the rest of the batch
+                    result = {'error': f"{type(e).__name__}: {e}"}
+            print(json.dumps({'job': number, **job, **result}), flush=True)
+    finally:
+        if jobs is not sys.stdin:
+            jobs.close()
+
+def run_query(args, index):
+    """Prints the answer to a 'query' subcommand using the timeline index."""
+    if args.query == 'at':
+        pid = index.running_at(args.time)
+        print(f"t={args.time}: {pid if pid is not None else 'IDLE'}")
+    elif args.query == 'window':
+        start, end = args.window
+        print(f"Window [{start}, {end}):")
+        print(f"  CPU Utilization: {index.utilization(start, end) * 100:.2f}%")
+        print(f"  Busy Time: {index.busy_time(start, end)}")
+        print(f"  Context Switches: {index.context_switches(start, end)} "
+              f"({index.switch_rate(start, end):.4f} per time unit)")
+    elif args.query == 'pid':
+        intervals = index.intervals_for(args.pid)
+        if not intervals:
+            print(f"{args.pid} never ran.")
+        for start, end in intervals:
+            print(f"{args.pid} running from t={start} to t={end}")
+
 def main():
+    # One entry point: "scheduler.py compare ..." runs the comparison tool
+    if sys.argv[1:2] == ['compare']:
+        import compare
+        compare.main(sys.argv[2:])
+        return
+
     # CLI argument configuration
     parser = argparse.ArgumentParser(description="CENG 301 CPU Scheduling Simulator")
-    parser.add_argument('--input', type=str, required=True, help="Path to input file (e.g., processes.txt)")
-    parser.add_argument('--algo', type=str, required=True, 
-                        choices=['FCFS', 'SJF', 'SRTF', 'RR', 'PRIO_NP', 'PRIO_P'],
+    parser.add_argument('--input', type=str, help="Path to input file (e.g., processes.txt)")
+    parser.add_argument('--algo', type=str, choices=algorithm_names(),
                         help="Scheduling algorithm to use")
-    parser.add_argument('--quantum', type=int, help="Time quantum (Required for RR)")
+    parser.add_argument('--batch', type=str, metavar='JOBS',
+                        help="Run every job of a JSON-lines file ('-' = stdin) and print one JSON result per job")
+    parser.add_argument('--quantum', type=positive_int, help="Time quantum (Required for RR)")
+    parser.add_argument('--coalesce', action='store_true',
+                        help="Merge consecutive RR slices of the same process into one Gantt entry")
+    parser.add_argument('--aging', type=non_negative_float, default=0,
+                        help="Priority aging rate per waiting time unit (PRIO_P only, default: off)")
+    parser.add_argument('--target-latency', type=positive_int, default=20,
+                        help="CFS: period in which every runnable process runs once (default: 20)")
+    parser.add_argument('--min-granularity', type=positive_int, default=2,
+                        help="CFS: shortest timeslice a process gets (default: 2)")
+    parser.add_argument('--mlfq-quanta', type=parse_quanta, default=(4, 8, 16), metavar='Q0,Q1,...',
+                        help="MLFQ: quantum of every level, highest priority first (default: 4,8,16)")
+    parser.add_argument('--boost-interval', type=non_negative_int, default=100,
+                        help="MLFQ: move every process back to the top level this often, 0 = never (default: 100)")
+    parser.add_argument('--gantt-window', type=parse_window, metavar='START:END',
+                        help="Only draw the Gantt chart for this time range")
+    parser.add_argument('--gantt-width', type=positive_int, metavar='N',
+                        help="Downsample the Gantt chart into N columns (dominant PID per column)")
+    parser.add_argument('--gantt-svg', type=str, metavar='PATH',
+                        help="Also export the Gantt chart as SVG (or HTML if PATH ends in .html)")
+    parser.add_argument('--gantt-file', type=str, metavar='PATH',
+                        help="Write the timeline to a compact binary file while simulating and read it back "
+                             "memory-mapped (for timelines too large to keep in memory)")
+    parser.add_argument('--no-gantt', action='store_true',
+                        help="Do not store the timeline; only print the aggregate metrics")
+    parser.add_argument('--stream', action='store_true',
+                        help="Print results progressively (input must be sorted by arrival time)")
+    parser.add_argument('--checkpoint', type=str, metavar='PATH',
+                        help="Streaming: stop at the end of the input and save the engine state to PATH")
+    parser.add_argument('--checkpoint-at', type=int, metavar='T',
+                        help="With --checkpoint: only read the arrivals at or before time T")
+    parser.add_argument('--resume', type=str, metavar='PATH',
+                        help="Streaming: continue from a checkpoint; --input holds only the new arrivals")
+    parser.add_argument('--percentiles', choices=['sketch', 'exact'],
+                        help="Also report p50/p95/p99/max turnaround, waiting and response "
+                             "(sketch = bounded-memory KLL estimate, exact = every value kept)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Always re-simulate instead of reusing a stored result (see utils/result_cache.py)")
+    parser.add_argument('--profile', action='store_true',
+                        help="Print time per phase and engine counters (decisions, queue ops, ...)")
+    parser.add_argument('--profile-json', type=str, metavar='PATH',
+                        help="Write the profile as JSON to PATH (implies --profile)")
+    parser.add_argument('--cpus', type=positive_int, default=1,
+                        help="Number of CPU cores to simulate (default: 1)")
+    parser.add_argument('--queues', choices=['global', 'per-core'], default='global',
+                        help="With --cpus: one shared ready queue or one queue per core (default: global)")
+    parser.add_argument('--balance', choices=['steal', 'periodic', 'none'], default='steal',
+                        help="Load balancing for per-core queues (default: steal)")
+    parser.add_argument('--balance-interval', type=positive_int, default=10,
+                        help="Time units between periodic balancing passes (default: 10)")
+
+    # Post-mortem queries over the finished timeline, e.g. "query at 12"
+    subparsers = parser.add_subparsers(dest='command')
+    query = subparsers.add_parser('query', help="Answer questions about the timeline instead of printing the full report")
+    query_types = query.add_subparsers(dest='query', required=True)
+    query_at = query_types.add_parser('at', help="Which process was running at time T")
+    query_at.add_argument('time', type=int)
+    query_window = query_types.add_parser('window', help="CPU utilization and context switches in START:END")
+    query_window.add_argument('window', type=parse_window)
+    query_pid = query_types.add_parser('pid', help="When a given process was running")
+    query_pid.add_argument('pid', type=str)
 
     args = parser.parse_args()
 
+    if args.batch:
+        run_batch(args)
+        return
+    if not args.input or not args.algo:
+        parser.error("--input and --algo are required (or use --batch JOBS)")
+
+    if args.checkpoint_at is not None and not args.checkpoint:
+        print("Error: --checkpoint-at needs --checkpoint PATH.")
+        return
+
+    if args.stream or args.checkpoint or args.resume:
+        if args.cpus > 1:
+            print("Error: --stream only supports a single CPU.")
+            return
+        run_stream(args)
+        return
+
+    # Phases are always timed (a handful of clock reads); the engine counters
+    # are only attached to the sink when profiling, so the hot loops stay cheap
+    profile = args.profile or args.profile_json is not None
+    profiler = Profiler()
+
     # Step 1: Parse the input file
-    processes = parse_file(args.input)
+    with profiler.phase('parse'):
+        processes = parse_file(args.input)
     if not processes:
         return
 
+    if args.no_gantt and args.command == 'query':
+        print("Error: queries need the timeline; remove --no-gantt.")
+        return
+
+    if args.gantt_file and args.no_gantt:
+        print("Error: --gantt-file and --no-gantt cannot be combined.")
+        return
+
+    if args.cpus > 1:
+        if args.gantt_file:
+            print("Error: --gantt-file only supports a single CPU.")
+            return
+        if args.command == 'query':
+            print("Error: queries only support a single CPU.")
+            return
+        run_smp(args, processes)
+        return
+
     # Step 2: Select and run the algorithm
-    # Each algorithm must return the modified process list and a Gantt log
+    # Each algorithm must return the modified process list and a Gantt log.
+    # The metrics sink collects every aggregate while the algorithm runs.
     result_procs, gantt_log = None, None
+    sink = ProfilingSink(args.percentiles) if profile else MetricsSink(args.percentiles)
+    # With --gantt-file the solver appends to a store that spills to disk as it grows
+    record_gantt = TimelineStore(spill_path=args.gantt_file) if args.gantt_file else not args.no_gantt
+    hooks = {'observer': sink, 'record_gantt': record_gantt}
 
-    if args.algo == 'FCFS':
-        result_procs, gantt_log = solve_fcfs(processes)
-    elif args.algo == 'SJF':
-        result_procs, gantt_log = solve_sjf(processes)
-    elif args.algo == 'SRTF':
-        result_procs, gantt_log = solve_srtf(processes)
-    elif args.algo == 'RR':
-        if args.quantum is None:
-            print("Error: --quantum is required for RR algorithm.")
-            return
-        result_procs, gantt_log = solve_rr(processes, args.quantum)
-    elif args.algo == 'PRIO_NP':
-        result_procs, gantt_log = solve_priority_np(processes)
-    elif args.algo == 'PRIO_P':
-        result_procs, gantt_log = solve_priority_p(processes)
+    if args.algo == 'RR' and args.quantum is None:
+        print("Error: --quantum is required for RR algorithm.")
+        return
+
+    # Reuse a stored result for the same workload, algorithm and parameters.
+    # Profiling always simulates, since a cached run has no engine counters,
+    # and so does --gantt-file, which writes the timeline while simulating.
+    # Small workloads are simply simulated again (see utils/result_cache.py).
+    cache = None
+    if not args.no_cache and not profile and not args.gantt_file:
+        from utils.result_cache import ResultCache, worth_caching
+        if worth_caching(processes):
+            cache = ResultCache()
+    cached = None
+    if cache is not None:
+        key = result_key(cache, args, processes)
+        cached = cache.get(key, need_gantt=not args.no_gantt)
+
+    if cached is not None:
+        result_procs, gantt_log, sink = cached.restore(processes)
+    else:
+        inputs = list(processes) # Input order, before a solver sorts the list in place
+        with profiler.phase('simulate'):
+            result_procs, gantt_log = simulate(args, processes, hooks)
+            if args.gantt_file:
+                gantt_log = gantt_log.finish() # Memory-mapped reader over the file
+        if cache is not None:
+            cache.put(key, inputs, result_procs, gantt_log, sink)
 
+    if args.command == 'query':
+        run_query(args, index_timeline(gantt_log))
     # Step 3: Generate Outputs
-    if result_procs and gantt_log:
-        print_results_table(result_procs)
-        
-        # Calculate and print averages and context switches
-        avg_t, avg_w, avg_r = calculate_metrics(result_procs)
-        cs = count_context_switches(gantt_log)
-        
-        print(f"Average Turnaround Time: {avg_t:.2f}")
-        print(f"Average Waiting Time: {avg_w:.2f}")
-        print(f"Average Response Time: {avg_r:.2f}")
-        print(f"Total Context Switches: {cs}")
-        
-        print_execution_log(gantt_log)
-        render_gantt_chart(gantt_log)
+    elif args.no_gantt:
+        with profiler.phase('metrics'):
+            print_summary(sink)
+            if args.percentiles:
+                print_tails(args.percentiles, tail_summary(sink, result_procs, args.percentiles))
+    elif result_procs and gantt_log:
+        with profiler.phase('metrics'):
+            print_results_table(result_procs)
+            print_summary(sink)
+            if args.percentiles:
+                print_tails(args.percentiles, tail_summary(sink, result_procs, args.percentiles))
+
+        with profiler.phase('render'):
+            print_execution_log(gantt_log)
+            render_gantt_chart(gantt_log, window=args.gantt_window, width=args.gantt_width)
+            if args.gantt_svg:
+                export_gantt_svg(gantt_log, args.gantt_svg, window=args.gantt_window)
+                print(f"Gantt chart exported to '{args.gantt_svg}'.")
+
+    if profile:
+        report = profiler.report(sink)
+        print_profile(args.algo, report)
+        if args.profile_json:
+            write_profile_json(args.profile_json, {args.algo: report})
+            print(f"Profile written to '{args.profile_json}'.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,161 @@
+# utils/binary_cache.py
+import hashlib
+import os
+import struct
+import sys
+import numpy as np
+from utils.parser import iter_records
+from utils.workload import Workload
+
+# File layout: fixed header followed by fixed-width little-endian records.
+# magic, format version, record count, source mtime (ns), source size, source sha256,
+# number of malformed source lines that were skipped
+HEADER = struct.Struct('<8sIQqQ32sQ')
+MAGIC = b'SCHEDBIN'
+VERSION = 2
+PID_BYTES = 16
+RECORD_DTYPE = np.dtype([('pid', f'S{PID_BYTES}'), ('arrival', '<i8'), ('burst', '<i8'), ('priority', '<i8')])
+
+CHUNK_RECORDS = 65536
+
+def cache_path_for(filename):
+    """The binary cache lives next to the text trace: processes.txt -> processes.txt.bin"""
+    return filename + '.bin'
+
+def file_sha256(filename):
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.digest()
+
+def read_header(path):
+    with open(path, 'rb') as f:
+        raw = f.read(HEADER.size)
+    if len(raw) != HEADER.size:
+        return None
+    magic, version, count, mtime_ns, size, sha, skipped = HEADER.unpack(raw)
+    if magic != MAGIC or version != VERSION:
+        return None
+    return {'count': count, 'mtime_ns': mtime_ns, 'size': size, 'sha256': sha, 'skipped': skipped}
+
+def write_cache(source, path, errors=None):
+    """
+    Converts a text trace into the binary format in one streaming pass.
+    Records are written in chunks, so memory use does not depend on the file size.
+    Malformed lines are skipped like iter_records does, and their number is
+    stored so later cache hits still know the source had them.
+    Raises ValueError if a PID does not fit in the fixed-width field.
+    """
+    stat = os.stat(source)
+    sha = file_sha256(source)
+    tmp_path = path + '.tmp'
+    count = 0
+    skipped = []
+    try:
+        with open(tmp_path, 'wb') as out:
+            out.write(HEADER.pack(MAGIC, VERSION, 0, stat.st_mtime_ns, stat.st_size, sha, 0))
+            buffer = np.empty(CHUNK_RECORDS, dtype=RECORD_DTYPE)
+            filled = 0
+            for pid, arrival, burst, priority in iter_records(source, skipped):
+                encoded = pid.encode('utf-8')
+                if len(encoded) > PID_BYTES:
+                    raise ValueError(f"PID {pid!r} is longer than {PID_BYTES} bytes")
+                buffer[filled] = (encoded, arrival, burst, priority)
+                filled += 1
+                if filled == CHUNK_RECORDS:
+                    out.write(buffer.tobytes())
+                    count += filled
+                    filled = 0
+            out.write(buffer[:filled].tobytes())
+            count += filled
+
+            # Patch the record and skipped line counts now that they are known
+            out.seek(0)
+            out.write(HEADER.pack(MAGIC, VERSION, count, stat.st_mtime_ns, stat.st_size, sha, len(skipped)))
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        report_skipped(skipped, errors)
+    return count
+
+def report_skipped(skipped, errors):
+    """Hands skipped lines to the caller's errors list, or warns on stderr like iter_records."""
+    if errors is not None:
+        errors.extend(skipped)
+    else:
+        for error in skipped:
+            print(f"Warning: skipping {error}", file=sys.stderr)
+
+def map_records(path):
+    """Memory-maps the record array of a cache file (nothing is read up front)."""
+    header = read_header(path)
+    if header is None:
+        raise ValueError(f"'{path}' is not a valid workload cache")
+    if header['count'] == 0:
+        return np.empty(0, dtype=RECORD_DTYPE)
+    return np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=HEADER.size, shape=(header['count'],))
+
+def is_fresh(source, path):
+    """
+    True if the cache still matches the text source. The mtime/size check is
+    free; only when the mtime changed is the source re-hashed, and if the
+    content is identical the stored mtime is refreshed instead of re-parsing.
+    """
+    header = read_header(path) if os.path.exists(path) else None
+    if header is None:
+        return False
+    stat = os.stat(source)
+    if header['mtime_ns'] == stat.st_mtime_ns and header['size'] == stat.st_size:
+        return True
+    if header['size'] != stat.st_size or file_sha256(source) != header['sha256']:
+        return False
+    try:
+        with open(path, 'r+b') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, header['count'], stat.st_mtime_ns, stat.st_size,
+                                header['sha256'], header['skipped']))
+    except OSError:
+        pass # Read-only cache: it is still valid, the next run just hashes the source again
+    return True
+
+def parse_workload(filename, errors=None):
+    """Streams a text trace straight into a columnar Workload without the cache."""
+    pids, arrivals, bursts, priorities = [], [], [], []
+    for pid, arrival, burst, priority in iter_records(filename, errors):
+        pids.append(pid)
+        arrivals.append(arrival)
+        bursts.append(burst)
+        priorities.append(priority)
+    return Workload(pids, arrivals, bursts, priorities)
+
+def load_workload(filename, use_cache=True, errors=None):
+    """
+    Loads a trace as a columnar Workload. On first use the text file is parsed
+    once and written to the binary cache; later runs memory-map the cache and
+    skip text parsing entirely until the source changes.
+    Malformed lines are skipped. When an errors list is given they are always
+    reported in it, also on a cache hit (the source is then scanned again, but
+    only if the cache recorded skipped lines).
+    """
+    if not use_cache:
+        return parse_workload(filename, errors)
+
+    path = cache_path_for(filename)
+    if not is_fresh(filename, path):
+        reported = len(errors) if errors is not None else 0
+        try:
+            write_cache(filename, path, errors)
+        except (ValueError, OSError):
+            # PIDs too long for the fixed-width format or an unwritable
+            # directory: fall back to plain streaming parsing
+            if errors is not None:
+                del errors[reported:]
+            return parse_workload(filename, errors)
+    elif errors is not None and read_header(path)['skipped']:
+        for _ in iter_records(filename, errors):
+            pass
+
+    records = map_records(path)
+    return Workload(np.char.decode(records['pid'], 'utf-8'),
+                    records['arrival'], records['burst'], records['priority'])
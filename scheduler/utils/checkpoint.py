@@ -0,0 +1,102 @@
+# utils/checkpoint.py
+"""
+Checkpoints of the streaming mode (scheduler.py --checkpoint / --resume).
+A checkpoint holds the online engine state (clock, pending arrivals, ready
+queue with remaining times, open Gantt segment) and the running metrics, as
+gzip-compressed JSON. Resuming from it and pushing only the new arrivals
+gives exactly the same events and totals as re-running the whole trace.
+"""
+import gzip
+import json
+import os
+from algorithms.online import make_online
+from utils.quantiles import TAIL_METRICS, make_quantiles, quantiles_from_state
+
+# Bump whenever the engine state or the file layout changes
+CHECKPOINT_VERSION = 1
+
+class StreamMetrics:
+    """Running totals of a streaming run, fed with the engine events."""
+    def __init__(self, percentiles=None):
+        self.completed = 0
+        self.total_turnaround = 0
+        self.total_waiting = 0
+        self.total_response = 0
+        self.context_switches = 0
+        self.last_pid = None
+        self.percentiles = percentiles
+        self.tails = None
+        if percentiles:
+            self.tails = {metric: make_quantiles(percentiles) for metric in TAIL_METRICS}
+
+    def add(self, event):
+        if event[0] == 'segment':
+            pid = event[1]
+            # Same rule as count_context_switches: a new PID gains the CPU
+            if self.last_pid is not None and pid != self.last_pid:
+                self.context_switches += 1
+            self.last_pid = pid
+            return
+        p = event[1]
+        self.completed += 1
+        self.total_turnaround += p.turnaround_time
+        self.total_waiting += p.waiting_time
+        self.total_response += p.response_time
+        if self.tails is not None:
+            self.tails['turnaround'].add(p.turnaround_time)
+            self.tails['waiting'].add(p.waiting_time)
+            self.tails['response'].add(p.response_time)
+
+    def averages(self):
+        """(avg_turnaround, avg_waiting, avg_response) of the processes completed so far."""
+        n = self.completed
+        if n == 0: return 0, 0, 0
+        return self.total_turnaround / n, self.total_waiting / n, self.total_response / n
+
+    def state(self):
+        state = {field: getattr(self, field) for field in
+                 ('completed', 'total_turnaround', 'total_waiting', 'total_response',
+                  'context_switches', 'last_pid', 'percentiles')}
+        if self.tails is not None:
+            state['tails'] = {metric: estimator.state() for metric, estimator in self.tails.items()}
+        return state
+
+    @classmethod
+    def from_state(cls, state):
+        metrics = cls()
+        for field in ('completed', 'total_turnaround', 'total_waiting', 'total_response',
+                      'context_switches', 'last_pid', 'percentiles'):
+            setattr(metrics, field, state[field])
+        if 'tails' in state:
+            metrics.tails = {metric: quantiles_from_state(s) for metric, s in state['tails'].items()}
+        return metrics
+
+def save_checkpoint(path, algo, quantum, engine, metrics):
+    """Writes the engine and metrics state to path (atomically, so a crash never leaves half a file)."""
+    data = {
+        'version': CHECKPOINT_VERSION,
+        'algo': algo,
+        'quantum': quantum,
+        'engine': engine.checkpoint(),
+        'metrics': metrics.state(),
+    }
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def load_checkpoint(path):
+    """Returns (algo, quantum, engine, metrics) restored from path; ValueError if it is not a valid checkpoint."""
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, EOFError, json.JSONDecodeError) as e:
+        raise ValueError(f"Cannot read checkpoint '{path}': {e}")
+    if data.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(f"Checkpoint '{path}' has version {data.get('version')}, expected {CHECKPOINT_VERSION}")
+    engine = make_online(data['algo'], data['quantum']).restore(data['engine'])
+    return data['algo'], data['quantum'], engine, StreamMetrics.from_state(data['metrics'])
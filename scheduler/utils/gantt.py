@@ -1,45 +1,191 @@
 # utils/gantt.py
+import sys
+import html
+import itertools
+import zlib
 
-def render_gantt_chart(gantt_log):
+LINE_WIDTH = 120      # Charts wider than this are wrapped into several bands
+MAX_BLOCK_WIDTH = 60  # Very long bursts are capped so one block cannot fill a whole band
+SYMBOLS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+
+def coalesce_segments(gantt_log):
+    """Yields (pid, start, end) segments with adjacent runs of the same PID merged."""
+    current = None
+    for pid, start, end in gantt_log:
+        if current is not None and current[0] == pid and current[2] == start:
+            current[2] = end
+            continue
+        if current is not None:
+            yield tuple(current)
+        current = [pid, start, end]
+    if current is not None:
+        yield tuple(current)
+
+def clip_segments(gantt_log, window):
+    """Yields the segments overlapping window = (start, end), cut to the window."""
+    if window is None:
+        yield from gantt_log
+        return
+    # Memory-mapped timelines binary-search the first segment instead of scanning
+    if hasattr(gantt_log, 'iter_window'):
+        yield from gantt_log.iter_window(window)
+        return
+    w_start, w_end = window
+    for pid, start, end in gantt_log:
+        if start >= w_end:
+            break
+        if end > w_start:
+            yield pid, max(start, w_start), min(end, w_end)
+
+def render_gantt_chart(gantt_log, stream=None, window=None, width=None):
     """
     Generates a professional ASCII Gantt chart showing time progression,
     running processes, and idle periods.
+
+    The chart is written band by band to `stream` (stdout by default), so long
+    timelines are wrapped instead of producing one enormous line. Adjacent
+    segments of the same PID are merged. `window=(start, end)` limits the view
+    to a time range and `width=N` switches to a downsampled N-column view.
     """
+    out = stream or sys.stdout
     if not gantt_log:
-        print("No execution data available.")
+        out.write("No execution data available.\n")
         return
 
-    print("\n--- CPU SCHEDULING GANTT CHART ---")
-    
-    # We will build the chart in three rows: top border, middle (PID), and time axis
-    top_row = " "
-    mid_row = "|"
-    time_row = "0"
-    
-    current_time = 0
-    for pid, start, end in gantt_log:
+    if width:
+        render_downsampled(gantt_log, width, out, window)
+        return
+
+    out.write("\n--- CPU SCHEDULING GANTT CHART ---\n")
+
+    # We will build the chart in three rows: top border, middle (PID), and time axis.
+    # Pieces are collected in lists and joined once per band (no repeated string +=).
+    current_time = window[0] if window else 0
+    top_row, mid_row, time_row = [" "], ["|"], [str(current_time)]
+    band_width = 1
+
+    def flush():
+        out.write("".join(top_row) + "\n")
+        out.write("".join(mid_row) + "\n")
+        out.write("".join(time_row) + "\n")
+
+    def add_block(label, block_width, end, border):
+        nonlocal top_row, mid_row, time_row, band_width
+        # Start a new band when this block would overflow the current one
+        if band_width > 1 and band_width + block_width + 1 > LINE_WIDTH:
+            flush()
+            top_row, mid_row, time_row = [" "], ["|"], [str(current_time)]
+            band_width = 1
+        top_row.append(border * block_width + " ")
+        mid_row.append(label.center(block_width) + "|")
+        time_row.append(str(end).rjust(block_width + 1))
+        band_width += block_width + 1
+
+    for pid, start, end in coalesce_segments(clip_segments(gantt_log, window)):
         # Step 1: Handle CPU Idle Time (Gap between processes)
         if start > current_time:
-            idle_width = (start - current_time) * 3
-            top_row += " " * idle_width + " "
-            mid_row += "IDLE".center(idle_width) + "|"
-            time_row += str(start).rjust(idle_width + 1)
-        
-        # Step 2: Calculate block width based on duration 
+            add_block("IDLE", min((start - current_time) * 3, MAX_BLOCK_WIDTH), start, " ")
+            current_time = start
+
+        # Step 2: Calculate block width based on duration
         # We use a multiplier (3) to make short processes visible
         duration = end - start
-        block_width = max(len(pid) + 2, duration * 3)
-        
+        block_width = max(len(pid) + 2, min(duration * 3, MAX_BLOCK_WIDTH))
+
         # Step 3: Build the visual components
-        # Python's .center() and .rjust() handle all the manual spacing you did!
-        top_row += "_" * block_width + " "
-        mid_row += pid.center(block_width) + "|"
-        time_row += str(end).rjust(block_width + 1)
-        
+        add_block(pid, block_width, end, "_")
         current_time = end
 
     # Final Output
-    print(top_row)
-    print(mid_row)
-    print(time_row)
-    print("----------------------------------\n")
\ No newline at end of file
+    flush()
+    out.write("----------------------------------\n\n")
+
+def timeline_end(gantt_log):
+    """End of the last segment; array-backed timelines know it without a scan."""
+    if hasattr(gantt_log, 'end_time'):
+        return gantt_log.end_time()
+    return max(end for _, _, end in gantt_log)
+
+def downsample(gantt_log, buckets, window=None):
+    """
+    Splits [start, end) into `buckets` equal time buckets and returns
+    (bucket_pids, start, end), where each entry is the PID that held the CPU
+    longest inside that bucket (None if the bucket was entirely idle).
+    Runs in one pass: O(segments + buckets).
+    """
+    t0, t1 = window if window else (0, timeline_end(gantt_log))
+    span = max(t1 - t0, 1)
+    size = span / buckets
+    usage = [None] * buckets  # Per-bucket {pid: busy time}, created lazily
+
+    for pid, start, end in clip_segments(gantt_log, window):
+        first = int((start - t0) / size)
+        last = min(int((end - t0) / size), buckets - 1)
+        for b in range(first, last + 1):
+            overlap = min(end, t0 + (b + 1) * size) - max(start, t0 + b * size)
+            if overlap > 0:
+                if usage[b] is None:
+                    usage[b] = {}
+                usage[b][pid] = usage[b].get(pid, 0) + overlap
+
+    bucket_pids = [max(u.items(), key=lambda item: item[1])[0] if u else None for u in usage]
+    return bucket_pids, t0, t1
+
+def render_downsampled(gantt_log, width, out, window=None):
+    """Prints a fixed-width chart: one character per bucket showing the dominant PID."""
+    bucket_pids, t0, t1 = downsample(gantt_log, width, window)
+
+    symbols = {}
+    for pid in bucket_pids:
+        if pid is not None and pid not in symbols:
+            symbols[pid] = SYMBOLS[len(symbols)] if len(symbols) < len(SYMBOLS) else "#"
+
+    out.write(f"\n--- CPU SCHEDULING GANTT CHART ({width} buckets of {(t1 - t0) / width:g} time units) ---\n")
+    out.write("|" + "".join("." if pid is None else symbols[pid] for pid in bucket_pids) + "|\n")
+    out.write(str(t0) + str(t1).rjust(width + 2 - len(str(t0))) + "\n")
+    legend = ", ".join(f"{symbol}={pid}" for pid, symbol in symbols.items())
+    out.write(f"Legend: {legend}, .=IDLE" if legend else "Legend: .=IDLE")
+    out.write("\n----------------------------------\n\n")
+
+def pid_color(pid):
+    """Stable color per PID (same color on every export)."""
+    return f"hsl({zlib.crc32(pid.encode()) % 360}, 65%, 60%)"
+
+def export_gantt_svg(gantt_log, path, pixel_width=1600, window=None):
+    """
+    Writes the timeline as SVG (or as an HTML page if path ends in .html).
+    When there are more segments than pixels the timeline is downsampled to one
+    column per pixel first, so even 1M-segment logs produce a small, responsive file.
+    The log is only streamed: at most pixel_width + 1 segments are held, and
+    more than that switches to a second, downsampling pass, so memory-mapped
+    timelines are never loaded.
+    """
+    head = list(itertools.islice(coalesce_segments(clip_segments(gantt_log, window)), pixel_width + 1))
+    if not head:
+        return
+    t0, t1 = window if window else (0, timeline_end(gantt_log))
+    scale = pixel_width / max(t1 - t0, 1)
+    height, bar_top, bar_height = 80, 10, 40
+
+    if len(head) > pixel_width:
+        bucket_pids, _, _ = downsample(gantt_log, pixel_width, (t0, t1))
+        # Runs of equal bucket PIDs become one rectangle
+        columns = coalesce_segments((pid, b, b + 1) for b, pid in enumerate(bucket_pids) if pid is not None)
+        rects = [(pid, start, end - start) for pid, start, end in columns]
+    else:
+        rects = [(pid, (start - t0) * scale, (end - start) * scale) for pid, start, end in head]
+
+    as_html = path.endswith('.html')
+    with open(path, 'w') as f:
+        if as_html:
+            f.write("<!DOCTYPE html>\n<html><head><meta charset='utf-8'><title>Gantt chart</title></head><body>\n")
+        f.write(f"<svg xmlns='http://www.w3.org/2000/svg' width='{pixel_width}' height='{height}' "
+                f"viewBox='0 0 {pixel_width} {height}'>\n")
+        for pid, x, w in rects:
+            f.write(f"<rect x='{x:.2f}' y='{bar_top}' width='{max(w, 0.5):.2f}' height='{bar_height}' "
+                    f"fill='{pid_color(pid)}'><title>{html.escape(pid)}</title></rect>\n")
+        f.write(f"<text x='0' y='{height - 10}' font-size='12'>{t0}</text>\n")
+        f.write(f"<text x='{pixel_width}' y='{height - 10}' font-size='12' text-anchor='end'>{t1}</text>\n")
+        f.write("</svg>\n")
+        if as_html:
+            f.write("</body></html>\n")
@@ -0,0 +1,117 @@
+# utils/generator.py
+"""
+Synthetic workload generator.
+
+Example (from the scheduler/ directory):
+    python -m utils.generator --n 100000 --arrival poisson --burst pareto --output big.txt
+"""
+import argparse
+import random
+from utils.process import Process
+
+ARRIVAL_PROCESSES = ('poisson', 'bursty', 'zero')
+BURST_DISTRIBUTIONS = ('uniform', 'exponential', 'pareto')
+
+def arrival_times(rng, n, kind, rate):
+    """
+    Yields n non-decreasing integer arrival times.
+    - poisson: exponential inter-arrival gaps with the given rate
+    - bursty:  groups of simultaneous arrivals separated by long quiet gaps
+    - zero:    every process arrives at t=0
+    """
+    t = 0.0
+    if kind == 'zero':
+        for _ in range(n):
+            yield 0
+    elif kind == 'poisson':
+        for _ in range(n):
+            yield int(t)
+            t += rng.expovariate(rate)
+    elif kind == 'bursty':
+        produced = 0
+        while produced < n:
+            size = min(n - produced, rng.randint(1, 20))
+            for _ in range(size):
+                yield int(t)
+            produced += size
+            # Quiet period long enough for the burst to drain on average
+            t += rng.expovariate(rate / (size * 2))
+    else:
+        raise ValueError(f"unknown arrival process '{kind}'")
+
+def burst_time(rng, kind, mean, max_burst):
+    """Draws one burst (at least 1 time unit, at most max_burst)."""
+    if kind == 'uniform':
+        value = rng.randint(1, 2 * mean - 1)
+    elif kind == 'exponential':
+        value = rng.expovariate(1 / mean)
+    elif kind == 'pareto':
+        # Heavy tail with alpha = 1.5: the scale is chosen so the mean matches
+        alpha = 1.5
+        value = mean * (alpha - 1) / alpha * rng.paretovariate(alpha)
+    else:
+        raise ValueError(f"unknown burst distribution '{kind}'")
+    return max(1, min(max_burst, int(round(value))))
+
+def generate_processes(n, seed=0, arrival='poisson', burst='uniform', rate=0.2,
+                       mean_burst=5, max_burst=1000, priorities=5):
+    """
+    Returns a list of n synthetic Process objects sorted by arrival time.
+    PIDs are P1..Pn; priorities are drawn uniformly from 0..priorities-1.
+    The same seed always produces the same workload.
+    """
+    rng = random.Random(seed)
+    processes = []
+    for i, arrival_time in enumerate(arrival_times(rng, n, arrival, rate), 1):
+        processes.append(Process(f"P{i}", arrival_time,
+                                 burst_time(rng, burst, mean_burst, max_burst),
+                                 rng.randrange(priorities)))
+    return processes
+
+def write_processes(filename, processes):
+    """Writes processes in the input file format read by utils/parser.py."""
+    with open(filename, 'w') as f:
+        f.write("# pid arrival_time burst_time priority\n")
+        for p in processes:
+            f.write(f"{p.pid} {p.arrival_time} {p.burst_time} {p.priority}\n")
+
+def positive_int(value):
+    """argparse type for counts and times that must be at least 1, e.g. --priorities."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an integer, got '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
+
+def positive_float(value):
+    """argparse type for rates that must be above 0, e.g. --rate."""
+    try:
+        rate = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a number, got '{value}'")
+    if not 0 < rate < float('inf'): # Also rejects nan
+        raise argparse.ArgumentTypeError("must be a finite number greater than 0")
+    return rate
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic process workload")
+    parser.add_argument('--n', type=positive_int, required=True, help="Number of processes")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--arrival', choices=ARRIVAL_PROCESSES, default='poisson')
+    parser.add_argument('--rate', type=positive_float, default=0.2, help="Mean arrivals per time unit (default: 0.2)")
+    parser.add_argument('--burst', choices=BURST_DISTRIBUTIONS, default='uniform')
+    parser.add_argument('--mean-burst', type=positive_int, default=5)
+    parser.add_argument('--max-burst', type=positive_int, default=1000)
+    parser.add_argument('--priorities', type=positive_int, default=5, help="Number of distinct priority levels")
+    parser.add_argument('--output', type=str, required=True)
+    args = parser.parse_args()
+
+    processes = generate_processes(args.n, args.seed, args.arrival, args.burst, args.rate,
+                                   args.mean_burst, args.max_burst, args.priorities)
+    write_processes(args.output, processes)
+    print(f"Wrote {len(processes)} processes to '{args.output}'.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# utils/observer.py
+from utils.quantiles import TAIL_METRICS, make_quantiles, summarize
+
+class SchedulerObserver:
+    """
+    Event interface the solve_* functions call while they simulate.
+    Every hook is a no-op here, so an observer only overrides what it needs.
+    - on_dispatch: a process gains the CPU (a new Gantt segment starts)
+    - on_preempt:  the running process loses the CPU before finishing
+    - on_complete: the running process finishes (its metrics are final)
+    - on_idle:     the CPU has nothing to run between start and end
+    An observer may also carry a `counters` attribute (utils/profiler.py);
+    the engines then report every scheduling decision to it.
+    """
+    def on_dispatch(self, process, time):
+        pass
+
+    def on_preempt(self, process, time):
+        pass
+
+    def on_complete(self, process, time):
+        pass
+
+    def on_idle(self, start, end):
+        pass
+
+class MetricsSink(SchedulerObserver):
+    """
+    Accumulates every aggregate metric online, in the same pass as the
+    simulation: averages, context switches, busy/idle time, CPU utilization
+    and throughput. Nothing per process or per segment is stored.
+    With percentiles='sketch' (bounded memory) or 'exact', the turnaround,
+    waiting and response times also feed quantile estimators (utils/quantiles.py).
+    """
+    def __init__(self, percentiles=None):
+        self.completed = 0
+        self.total_turnaround = 0
+        self.total_waiting = 0
+        self.total_response = 0
+        self.context_switches = 0
+        self.busy_time = 0
+        self.idle_time = 0
+        self.end_time = 0
+        self._last_pid = None
+        self._dispatched_at = 0
+        self.tails = None
+        if percentiles:
+            self.tails = {metric: make_quantiles(percentiles) for metric in TAIL_METRICS}
+
+    def on_dispatch(self, process, time):
+        # Same rule as count_context_switches: a different PID gains the CPU
+        if self._last_pid is not None and process.pid != self._last_pid:
+            self.context_switches += 1
+        self._last_pid = process.pid
+        self._dispatched_at = time
+
+    def on_preempt(self, process, time):
+        self.busy_time += time - self._dispatched_at
+
+    def on_complete(self, process, time):
+        self.busy_time += time - self._dispatched_at
+        self.completed += 1
+        self.total_turnaround += process.turnaround_time
+        self.total_waiting += process.waiting_time
+        self.total_response += process.response_time
+        self.end_time = max(self.end_time, time)
+        if self.tails is not None:
+            self.tails['turnaround'].add(process.turnaround_time)
+            self.tails['waiting'].add(process.waiting_time)
+            self.tails['response'].add(process.response_time)
+
+    def on_idle(self, start, end):
+        self.idle_time += end - start
+
+    def averages(self):
+        """Returns (avg_turnaround, avg_waiting, avg_response) like calculate_metrics."""
+        if self.completed == 0: return 0, 0, 0
+        return (self.total_turnaround / self.completed,
+                self.total_waiting / self.completed,
+                self.total_response / self.completed)
+
+    def cpu_utilization(self):
+        """Busy fraction of the simulated time from t=0 to the last completion."""
+        return self.busy_time / self.end_time if self.end_time else 0.0
+
+    def tail_summary(self):
+        """{metric: (p50, p95, p99, max)} for turnaround, waiting and response."""
+        return {metric: summarize(estimator) for metric, estimator in self.tails.items()}
+
+    def throughput(self):
+        """Completed processes per time unit."""
+        return self.completed / self.end_time if self.end_time else 0.0
@@ -2,39 +2,101 @@
 import sys
 from utils.process import Process
 
+class ParseError(ValueError):
+    """A malformed input line, reported with its 1-based line number."""
+    def __init__(self, line_no, line, reason):
+        super().__init__(f"line {line_no}: {reason}: {line.strip()!r}")
+        self.line_no = line_no
+        self.line = line
+        self.reason = reason
+
+def parse_line(line):
+    """
+    Parses one input line into (pid, arrival, burst, priority).
+    Returns None for blank/comment lines and raises ValueError for bad fields.
+    """
+    # Rule: Ignore parts after '#' (comments)
+    clean_line = line.split('#', 1)[0]
+
+    # Rule: Fields are separated by whitespace
+    parts = clean_line.split()
+
+    # Rule: Skip empty lines
+    if not parts:
+        return None
+
+    if len(parts) < 4:
+        raise ValueError(f"expected 4 fields, found {len(parts)}")
+
+    # PID is a string, the metrics are integers
+    return parts[0], int(parts[1]), int(parts[2]), int(parts[3])
+
+def read_processes(filename):
+    """
+    Reads process data from a text file and returns a list of Process objects.
+    Raises FileNotFoundError, or ParseError for a line with bad fields
+    (lines with fewer than 4 fields have always been skipped instead).
+    """
+    processes = []
+    with open(filename, 'r') as f:
+        for line_no, line in enumerate(f, 1):
+            try:
+                fields = parse_line(line)
+            except ValueError as e:
+                # Short lines have always been skipped in this mode
+                if len(line.split('#', 1)[0].split()) < 4:
+                    continue
+                raise ParseError(line_no, line, str(e))
+
+            if fields is not None:
+                processes.append(Process(*fields))
+    return processes
+
 def parse_file(filename):
     """
     Reads process data from a text file and returns a list of Process objects.
     Follows project rules for ignoring comments and handling whitespace .
     """
-    processes = []
     try:
-        with open(filename, 'r') as f:
-            for line in f:
-                # Rule: Ignore parts after '#' (comments) 
-                clean_line = line.split('#')[0].strip()
-                
-                # Rule: Skip empty lines
-                if not clean_line:
-                    continue
-                
-                # Rule: Fields are separated by whitespace 
-                parts = clean_line.split()
-                
-                if len(parts) >= 4:
-                    pid = parts[0] # String 
-                    # Convert metrics to integers 
-                    arrival = int(parts[1])
-                    burst = int(parts[2])
-                    priority = int(parts[3])
-                    
-                    processes.append(Process(pid, arrival, burst, priority))
-                
+        return read_processes(filename)
+    except ParseError as e:
+        print(f"Error: Invalid data format in input file (line {e.line_no}: {e.reason}). Please check integers.")
+        sys.exit(1)
     except FileNotFoundError:
         print(f"Error: Input file '{filename}' not found.")
         sys.exit(1)
-    except ValueError:
-        print("Error: Invalid data format in input file. Please check integers.")
-        sys.exit(1)
 
-    return processes
\ No newline at end of file
+def iter_records(filename, errors=None):
+    """
+    Streams (pid, arrival, burst, priority) tuples from a text file one line at a time.
+    Malformed lines are skipped and reported as ParseError: appended to the
+    errors list when one is given, printed to stderr otherwise.
+    """
+    with open(filename, 'r') as f:
+        for line_no, line in enumerate(f, 1):
+            try:
+                fields = parse_line(line)
+            except ValueError as e:
+                error = ParseError(line_no, line, str(e))
+                if errors is None:
+                    print(f"Warning: skipping {error}", file=sys.stderr)
+                else:
+                    errors.append(error)
+                continue
+
+            if fields is not None:
+                yield fields
+
+def iter_chunks(filename, chunk_size=10000, errors=None):
+    """
+    Chunked parsing mode for very large traces: yields lists of at most
+    chunk_size Process objects, so memory stays bounded by the chunk size.
+    """
+    chunk = []
+    for fields in iter_records(filename, errors):
+        chunk.append(Process(*fields))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
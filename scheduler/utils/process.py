@@ -3,22 +3,46 @@
 class Process:
     """
     A class to represent a CPU process and its scheduling metrics.
+    Uses __slots__ so large workloads do not pay for a per-instance __dict__.
     """
+    __slots__ = ('pid', 'arrival_time', 'burst_time', 'priority',
+                 'remaining_time', 'start_time', 'completion_time',
+                 'waiting_time', 'turnaround_time', 'response_time')
+
     def __init__(self, pid, arrival_time, burst_time, priority):
-        # Static properties from input file 
+        # Static properties from input file
         self.pid = pid
         self.arrival_time = arrival_time
         self.burst_time = burst_time
         self.priority = priority
-        
+
         # Dynamic properties for simulation logic
-        self.remaining_time = burst_time  # Used for preemptive algorithms (SRTF, RR)
-        self.start_time = None            # To calculate Response Time 
-        self.completion_time = 0          # Time when execution finishes 
-        self.waiting_time = 0             # Total time spent in ready queue 
-        self.turnaround_time = 0          # Total time from arrival to completion 
-        self.response_time = 0            # Time from arrival to first CPU contact 
+        self.reset()
+
+    def reset(self):
+        """Clears the simulation results so the same record can be reused for another run."""
+        self.remaining_time = self.burst_time  # Used for preemptive algorithms (SRTF, RR)
+        self.start_time = None            # To calculate Response Time
+        self.completion_time = 0          # Time when execution finishes
+        self.waiting_time = 0             # Total time spent in ready queue
+        self.turnaround_time = 0          # Total time from arrival to completion
+        self.response_time = 0            # Time from arrival to first CPU contact
 
     def __repr__(self):
         """String representation for debugging and logging."""
-        return f"Process(PID={self.pid}, Arr={self.arrival_time}, Burst={self.burst_time}, Prio={self.priority})"
\ No newline at end of file
+        return f"Process(PID={self.pid}, Arr={self.arrival_time}, Burst={self.burst_time}, Prio={self.priority})"
+
+def fresh_run(processes):
+    """
+    Prepares a shared process list for another algorithm run without copying it.
+    The static input fields are never modified by the algorithms, so the same
+    records are reused: only their result fields are reset, and a new list
+    object protects the caller's order from algorithms that sort in place.
+    The records are the result buffer of every run: a run's per-process
+    results are only valid until the next fresh_run, so read (or copy) what
+    you need first. For separate result storage use a columnar Workload
+    (utils/workload.py), whose inputs are read-only arrays.
+    """
+    for p in processes:
+        p.reset()
+    return list(processes)
@@ -0,0 +1,187 @@
+# utils/quantiles.py
+import math
+import random
+
+# Percentiles reported next to the maximum in the tail-latency tables
+TAIL_QUANTILES = (0.5, 0.95, 0.99)
+TAIL_METRICS = ('turnaround', 'waiting', 'response')
+
+class ExactQuantiles:
+    """Keeps every value; the reference the sketch is checked against on small inputs."""
+    def __init__(self):
+        self.values = []
+        self._sorted = True
+
+    @property
+    def count(self):
+        return len(self.values)
+
+    @property
+    def max(self):
+        return max(self.values) if self.values else None
+
+    def add(self, value):
+        self.values.append(value)
+        self._sorted = False
+
+    def extend(self, values):
+        self.values.extend(values)
+        self._sorted = False
+
+    def merge(self, other):
+        self.extend(other.values)
+
+    def state(self):
+        return {'mode': 'exact', 'values': self.values}
+
+    @classmethod
+    def from_state(cls, state):
+        estimator = cls()
+        estimator.extend(state['values'])
+        return estimator
+
+    def quantile(self, q):
+        """Nearest-rank quantile: the smallest value with at least q of the data at or below it."""
+        if not self.values:
+            return None
+        if not self._sorted:
+            self.values.sort()
+            self._sorted = True
+        rank = max(1, math.ceil(q * len(self.values)))
+        return self.values[rank - 1]
+
+class KLLSketch:
+    """
+    KLL quantile sketch (Karnin, Lang, Liberty 2016).
+    Values enter level 0; when a level is full it is sorted and every other
+    item (random offset) moves up a level with twice the weight. Level
+    capacities shrink geometrically towards the bottom, so memory is about
+    O(k) regardless of the stream length, and the rank error is around 1.7/k
+    with high probability. Two sketches merge by concatenating their levels.
+    The minimum, maximum and count are exact.
+    """
+    def __init__(self, k=200, seed=0):
+        self.k = k
+        self.rng = random.Random(seed)
+        self.levels = [[]]
+        self.count = 0
+        self.size = 0
+        self.min = None
+        self.max = None
+        self._update_capacity()
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(2, math.ceil(self.k * (2 / 3) ** depth))
+
+    def _update_capacity(self):
+        self.max_size = sum(self._capacity(h) for h in range(len(self.levels)))
+
+    def add(self, value):
+        self.levels[0].append(value)
+        self.size += 1
+        self.count += 1
+        if self.max is None or value > self.max:
+            self.max = value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.size >= self.max_size:
+            self._compress()
+
+    def extend(self, values):
+        for value in values:
+            self.add(value)
+
+    def _compress(self):
+        # Compact the lowest level that is over capacity (one per call, like the paper's lazy variant)
+        for h, items in enumerate(self.levels):
+            if len(items) >= self._capacity(h):
+                if h + 1 == len(self.levels):
+                    self.levels.append([])
+                    self._update_capacity()
+                items.sort()
+                # With an odd count the smallest item stays at this level
+                keep = [items[0]] if len(items) % 2 else []
+                paired = items[len(keep):]
+                self.levels[h + 1].extend(paired[self.rng.random() < 0.5::2])
+                self.levels[h] = keep
+                self.size = sum(len(level) for level in self.levels)
+                return
+
+    def merge(self, other):
+        """Folds another sketch into this one (e.g. the sketches of parallel workers)."""
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+        self._update_capacity()
+        for h, items in enumerate(other.levels):
+            self.levels[h].extend(items)
+        self.size = sum(len(level) for level in self.levels)
+        self.count += other.count
+        if other.count:
+            self.max = other.max if self.max is None else max(self.max, other.max)
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        while self.size >= self.max_size:
+            self._compress()
+
+    def state(self):
+        """Plain-data state, including the random generator, so a restored sketch continues identically."""
+        version, internal, gauss = self.rng.getstate()
+        return {'mode': 'sketch', 'k': self.k, 'levels': self.levels, 'count': self.count,
+                'min': self.min, 'max': self.max, 'rng': [version, list(internal), gauss]}
+
+    @classmethod
+    def from_state(cls, state):
+        sketch = cls(state['k'])
+        version, internal, gauss = state['rng']
+        sketch.rng.setstate((version, tuple(internal), gauss))
+        sketch.levels = [list(items) for items in state['levels']]
+        sketch.count = state['count']
+        sketch.min = state['min']
+        sketch.max = state['max']
+        sketch.size = sum(len(items) for items in sketch.levels)
+        sketch._update_capacity()
+        return sketch
+
+    def quantile(self, q):
+        """Approximate nearest-rank quantile from the weighted items."""
+        if self.count == 0:
+            return None
+        if q >= 1:
+            return self.max
+        weighted = sorted((value, 1 << h) for h, items in enumerate(self.levels) for value in items)
+        total = sum(weight for _, weight in weighted)
+        target = q * total
+        seen = 0
+        for value, weight in weighted:
+            seen += weight
+            if seen >= target:
+                return value
+        return self.max
+
+def make_quantiles(mode):
+    """'exact' keeps every value, 'sketch' uses a bounded-memory KLL sketch."""
+    if mode == 'exact':
+        return ExactQuantiles()
+    if mode == 'sketch':
+        return KLLSketch()
+    raise ValueError(f"Unknown percentile mode: {mode}")
+
+def quantiles_from_state(state):
+    """Rebuilds an estimator from its state() (used by checkpoints)."""
+    if state['mode'] == 'exact':
+        return ExactQuantiles.from_state(state)
+    return KLLSketch.from_state(state)
+
+def summarize(estimator):
+    """(p50, p95, p99, max) of one metric."""
+    return tuple(estimator.quantile(q) for q in TAIL_QUANTILES) + (estimator.max,)
+
+def print_tail_table(title, summaries):
+    """
+    Prints p50/p95/p99/max per row, where summaries maps a row label
+    (a metric or an algorithm) to its (p50, p95, p99, max) tuple.
+    """
+    print(f"\n--- {title} ---")
+    print(f"{'':<15} {'p50':<10} {'p95':<10} {'p99':<10} {'Max':<10}")
+    for label, values in summaries.items():
+        print(f"{label:<15} " + " ".join(f"{v if v is not None else '-':<10}" for v in values))
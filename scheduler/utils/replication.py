@@ -0,0 +1,61 @@
+# utils/replication.py
+"""
+Helpers for Monte Carlo replications: workload builders and streaming statistics.
+The runner itself lives in compare.py (--replications), next to the test suite.
+"""
+import math
+import random
+from utils.process import Process
+from utils.generator import generate_processes
+
+# Two-sided 95% Student t critical values for 1..30 degrees of freedom;
+# above that the normal value 1.96 is close enough
+T_95 = [12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+        2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+        2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042]
+
+class RunningStats:
+    """
+    Welford's online mean and variance: constant memory no matter how many
+    values are added, and numerically stable (no sum of squares).
+    """
+    __slots__ = ('count', 'mean', 'm2')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def variance(self):
+        """Sample variance (n - 1 in the denominator)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def ci95(self):
+        """Half-width of the 95% confidence interval of the mean (inf with fewer than 2 values)."""
+        if self.count < 2:
+            return math.inf
+        df = self.count - 1
+        t = T_95[df - 1] if df <= len(T_95) else 1.96
+        return t * math.sqrt(self.variance() / self.count)
+
+def resample_processes(source, n, seed):
+    """
+    Bootstrap workload: draws n (arrival, burst, priority) records with
+    replacement from source and renames them P1..Pn in arrival order.
+    """
+    rng = random.Random(seed)
+    picks = sorted((rng.choice(source) for _ in range(n)), key=lambda p: p.arrival_time)
+    return [Process(f"P{i + 1}", p.arrival_time, p.burst_time, p.priority)
+            for i, p in enumerate(picks)]
+
+def build_replica(mode, n, seed, source=None):
+    """Workload for one replication: 'generate' draws a synthetic trace, 'resample' bootstraps source."""
+    if mode == 'resample':
+        return resample_processes(source, n, seed)
+    return generate_processes(n, seed=seed)
@@ -0,0 +1,235 @@
+# utils/result_cache.py
+"""
+Content-addressed store of finished simulations. Entries are plain binary
+files written with struct and array, so a cache hit costs no numpy import.
+"""
+import json
+import os
+import struct
+import sys
+from array import array
+from utils.observer import MetricsSink
+from utils.quantiles import TAIL_METRICS, make_quantiles
+from utils.timeline_store import TimelineStore
+
+# Bump whenever a solve_* function changes its output, so old entries stop matching
+ENGINE_VERSION = 1
+
+DEFAULT_CACHE_DIR = '.sim_cache'
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Below this many processes a hit saves only a few milliseconds over simulating,
+# not worth a file per run, so callers do not use the cache at all
+MIN_PROCESSES = 5000
+
+# File layout: header, the SINK_FIELDS totals, the per-process columns
+# (METRIC_COLUMNS, int64), then with a Gantt log its proc (int32), start and
+# end (int64) columns and the PID table (one UTF-8 PID per line).
+# magic, format version, process count, has Gantt log, segment count, PID count
+HEADER = struct.Struct('<8sIQBQQ')
+MAGIC = b'SIMCACHE'
+VERSION = 1
+ENTRY_SUFFIX = '.sim'
+METRIC_COLUMNS = ('order', 'start', 'completion', 'turnaround', 'waiting', 'response')
+
+# MetricsSink totals stored with every entry, so a hit can rebuild the summary
+SINK_FIELDS = ('completed', 'total_turnaround', 'total_waiting', 'total_response',
+               'context_switches', 'busy_time', 'idle_time', 'end_time')
+
+DIGEST_CHUNK = 65536
+
+def worth_caching(processes):
+    """False for workloads small enough that re-simulating beats a cache lookup."""
+    return len(processes) >= MIN_PROCESSES
+
+def _write_column(f, column):
+    # Entries are little-endian on every platform
+    if sys.byteorder == 'big':
+        column = array(column.typecode, column)
+        column.byteswap()
+    column.tofile(f)
+
+def _read_column(f, typecode, count):
+    column = array(typecode)
+    column.fromfile(f, count)
+    if sys.byteorder == 'big':
+        column.byteswap()
+    return column
+
+def workload_digest(processes):
+    """SHA-256 of the parsed workload (PID, arrival, burst, priority in input order)."""
+    import hashlib # Only once a workload is big enough to be cached
+    digest = hashlib.sha256()
+    for i in range(0, len(processes), DIGEST_CHUNK):
+        chunk = processes[i:i + DIGEST_CHUNK]
+        digest.update(''.join(f"{p.pid} {p.arrival_time} {p.burst_time} {p.priority}\n"
+                              for p in chunk).encode('utf-8'))
+    return digest.hexdigest()
+
+class CachedResult:
+    """One cache entry: per-process metrics, the sink totals and (optionally) the Gantt log."""
+    def __init__(self, columns, gantt=None):
+        self.columns = columns  # Name -> array, see METRIC_COLUMNS and SINK_FIELDS
+        self.gantt = gantt      # (pids, proc, start, end) or None
+
+    @property
+    def has_gantt(self):
+        return self.gantt is not None
+
+    def sink(self):
+        """Rebuilds the MetricsSink totals without touching any process."""
+        sink = MetricsSink()
+        for field, value in zip(SINK_FIELDS, self.columns['sink']):
+            setattr(sink, field, value)
+        return sink
+
+    def tails(self, mode):
+        """{metric: quantile estimator} rebuilt from the stored per-process metrics."""
+        tails = {metric: make_quantiles(mode) for metric in TAIL_METRICS}
+        for metric, estimator in tails.items():
+            estimator.extend(self.columns[metric].tolist())
+        return tails
+
+    def restore(self, processes):
+        """
+        Writes the cached metrics back onto `processes` (the same input list the
+        key was computed from) and returns (result_procs, gantt_log, sink) like a real run.
+        """
+        c = self.columns
+        result_procs = [processes[i] for i in c['order']]
+        for p, start, compl, turn, wait, resp in zip(result_procs, c['start'], c['completion'],
+                                                     c['turnaround'], c['waiting'], c['response']):
+            p.start_time = start if start >= 0 else None
+            p.completion_time = compl
+            p.turnaround_time = turn
+            p.waiting_time = wait
+            p.response_time = resp
+
+        # The same array-backed log a solver returns
+        gantt_log = TimelineStore.from_columns(*self.gantt) if self.gantt else None
+        return result_procs, gantt_log, self.sink()
+
+class ResultCache:
+    """
+    Content-addressed store of finished simulations, one file per entry.
+    The key covers the workload digest, the algorithm, its parameters and
+    ENGINE_VERSION. Entries are evicted least recently used first (a hit
+    refreshes the file's mtime) once the directory grows past max_bytes.
+    """
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def key(self, digest, algo, quantum=None, params=None):
+        import hashlib
+        spec = json.dumps([ENGINE_VERSION, digest, algo, quantum, params or {}], sort_keys=True)
+        return hashlib.sha256(spec.encode('utf-8')).hexdigest()
+
+    def run_key(self, digest, algo, options):
+        """
+        Key of a registry solver run. options maps every name in
+        solver_options(algo) to the value it ran with; scheduler.py and
+        compare.py both build their keys here, so each finds the other's
+        entries. Whole floats count as ints (--aging 0 is the default 0).
+        """
+        params = {name: int(value) if isinstance(value, float) and value.is_integer() else value
+                  for name, value in options.items()}
+        return self.key(digest, algo, params.pop('quantum', None), params)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ENTRY_SUFFIX)
+
+    def get(self, key, need_gantt=False):
+        """Returns the CachedResult for key, or None on a miss (or if it has no Gantt log and one is needed)."""
+        path = self._path(key)
+        try:
+            result = self._load(path, need_gantt)
+        except (OSError, EOFError, ValueError, struct.error):
+            return None
+        if result is None:
+            return None
+        try:
+            os.utime(path) # Mark as recently used
+        except OSError:
+            pass
+        return result
+
+    def _load(self, path, need_gantt):
+        with open(path, 'rb') as f:
+            magic, version, n, has_gantt, segments, pid_count = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                return None
+            if need_gantt and not has_gantt:
+                return None
+            columns = {'sink': _read_column(f, 'q', len(SINK_FIELDS))}
+            for name in METRIC_COLUMNS:
+                columns[name] = _read_column(f, 'q', n)
+            gantt = None
+            if has_gantt:
+                proc = _read_column(f, 'i', segments)
+                start = _read_column(f, 'q', segments)
+                end = _read_column(f, 'q', segments)
+                pids = f.read().decode('utf-8').split('\n')[:pid_count]
+                gantt = (pids, proc, start, end)
+        return CachedResult(columns, gantt)
+
+    def put(self, key, processes, result_procs, gantt_log, sink):
+        """Stores a finished run. processes is the input list, result_procs what the solver returned."""
+        position = {id(p): i for i, p in enumerate(processes)}
+        columns = [
+            array('q', [getattr(sink, field) for field in SINK_FIELDS]),
+            array('q', [position[id(p)] for p in result_procs]),
+            array('q', [p.start_time if p.start_time is not None else -1 for p in result_procs]),
+            array('q', [p.completion_time for p in result_procs]),
+            array('q', [p.turnaround_time for p in result_procs]),
+            array('q', [p.waiting_time for p in result_procs]),
+            array('q', [p.response_time for p in result_procs]),
+        ]
+        if gantt_log is not None and not isinstance(gantt_log, TimelineStore):
+            store = TimelineStore()
+            store.extend(gantt_log)
+            gantt_log = store
+        if gantt_log is not None:
+            pids, proc, start, end = gantt_log.columns()
+            columns += [proc, start, end]
+            header = HEADER.pack(MAGIC, VERSION, len(result_procs), 1, len(proc), len(pids))
+        else:
+            header = HEADER.pack(MAGIC, VERSION, len(result_procs), 0, 0, 0)
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(header)
+                for column in columns:
+                    _write_column(f, column)
+                if gantt_log is not None:
+                    f.write(''.join(pid + '\n' for pid in pids).encode('utf-8'))
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self.evict()
+
+    def evict(self):
+        """Deletes the least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(ENTRY_SUFFIX):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue # Removed by another process meanwhile
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                total += stat.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
@@ -1,4 +1,5 @@
 # utils/statistics.py
+from utils.quantiles import TAIL_METRICS, make_quantiles, summarize
 
 def calculate_metrics(processes):
     """
@@ -8,6 +9,10 @@ def calculate_metrics(processes):
     - Waiting = Turnaround - Burst 
     - Response = First Start - Arrival 
     """
+    # Columnar workloads (utils/workload.py) compute their averages with vectorized array operations
+    if hasattr(processes, 'average_metrics'):
+        return processes.average_metrics()
+
     n = len(processes)
     if n == 0: return 0, 0, 0
     
@@ -17,17 +22,38 @@ def calculate_metrics(processes):
     
     return avg_turnaround, avg_waiting, avg_response
 
+def calculate_percentiles(processes, mode='exact'):
+    """
+    Tail metrics of a finished run: {metric: (p50, p95, p99, max)} for
+    turnaround, waiting and response. mode='sketch' bounds the memory with
+    a KLL sketch instead of sorting every value.
+    """
+    tails = {metric: make_quantiles(mode) for metric in TAIL_METRICS}
+    for p in processes:
+        tails['turnaround'].add(p.turnaround_time)
+        tails['waiting'].add(p.waiting_time)
+        tails['response'].add(p.response_time)
+    return {metric: summarize(estimator) for metric, estimator in tails.items()}
+
 def count_context_switches(gantt_log):
     """
     Counts the total number of context switches.
     A switch is counted whenever a different process gains control of the CPU.
+    The log is only iterated (never indexed), so it can be a list, a
+    TimelineStore or a memory-mapped TimelineFile (utils/timeline_store.py).
     """
     if not gantt_log: return 0
-    
+
+    # Array-backed timelines compare their PID columns directly
+    if hasattr(gantt_log, 'context_switches'):
+        return gantt_log.context_switches()
+
     switches = 0
-    for i in range(1, len(gantt_log)):
+    previous = None
+    for pid, _, _ in gantt_log:
         # If the PID of current segment is different from the previous one
-        if gantt_log[i][0] != gantt_log[i-1][0]:
+        if previous is not None and pid != previous:
             switches += 1
-            
+        previous = pid
+
     return switches
\ No newline at end of file
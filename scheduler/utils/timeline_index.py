@@ -0,0 +1,148 @@
+# utils/timeline_index.py
+from array import array
+from bisect import bisect_left, bisect_right
+from utils.gantt import coalesce_segments
+from utils.timeline_store import READ_CHUNK
+
+def index_timeline(gantt_log):
+    """Index for any Gantt log; memory-mapped timeline files are queried in place."""
+    if hasattr(gantt_log, 'records'):
+        return MappedTimelineIndex(gantt_log)
+    return TimelineIndex(gantt_log)
+
+class TimelineIndex:
+    """
+    Read-only index over a Gantt log, built once after a run.
+    Segments are stored in sorted parallel arrays, so point queries are a
+    binary search (O(log n)) and window aggregates use prefix sums.
+    """
+    def __init__(self, gantt_log):
+        self.pids = []
+        self.starts = array('q')
+        self.ends = array('q')
+
+        # Prefix sums: busy[i] = CPU time used by segments[:i],
+        # switches[i] = context switches at the start of segments[:i]
+        self.busy = array('q', [0])
+        self.switches = array('q', [0])
+
+        for pid, start, end in coalesce_segments(gantt_log):
+            switched = 1 if self.pids and self.pids[-1] != pid else 0
+            self.pids.append(pid)
+            self.starts.append(start)
+            self.ends.append(end)
+            self.busy.append(self.busy[-1] + end - start)
+            self.switches.append(self.switches[-1] + switched)
+
+        self._by_pid = None  # pid -> segment indices, built on first use
+
+    def __len__(self):
+        return len(self.pids)
+
+    def running_at(self, t):
+        """Returns the PID holding the CPU at time t, or None if the CPU was idle."""
+        i = bisect_right(self.starts, t) - 1
+        if i >= 0 and t < self.ends[i]:
+            return self.pids[i]
+        return None
+
+    def busy_time(self, t0, t1):
+        """CPU time used inside the window [t0, t1)."""
+        first = bisect_right(self.ends, t0)       # First segment ending after t0
+        last = bisect_left(self.starts, t1) - 1   # Last segment starting before t1
+        if first > last:
+            return 0
+        total = self.busy[last + 1] - self.busy[first]
+        # Trim the parts of the edge segments that stick out of the window
+        total -= max(0, t0 - self.starts[first])
+        total -= max(0, self.ends[last] - t1)
+        return total
+
+    def utilization(self, t0, t1):
+        """Fraction of [t0, t1) during which the CPU was busy."""
+        return self.busy_time(t0, t1) / (t1 - t0) if t1 > t0 else 0.0
+
+    def context_switches(self, t0, t1):
+        """Number of context switches happening inside [t0, t1)."""
+        a = bisect_left(self.starts, t0)
+        b = bisect_left(self.starts, t1)
+        return self.switches[b] - self.switches[a]
+
+    def switch_rate(self, t0, t1):
+        """Context switches per time unit inside [t0, t1)."""
+        return self.context_switches(t0, t1) / (t1 - t0) if t1 > t0 else 0.0
+
+    def intervals_for(self, pid):
+        """Returns every (start, end) interval during which pid was running."""
+        if self._by_pid is None:
+            self._by_pid = {}
+            for i, p in enumerate(self.pids):
+                self._by_pid.setdefault(p, []).append(i)
+        return [(self.starts[i], self.ends[i]) for i in self._by_pid.get(pid, [])]
+
+class MappedTimelineIndex(TimelineIndex):
+    """
+    TimelineIndex over a memory-mapped TimelineFile, for timelines too large
+    to copy into memory. Binary searches run on the mapped start/end columns
+    with bisect, which only reads the O(log n) records it probes
+    (np.searchsorted would first copy the strided column). There are no prefix
+    sums: window aggregates sum the records inside the window chunk by chunk,
+    so a query costs O(log n + segments in the window).
+    Segments are used as stored (not coalesced); the answers are the same.
+    """
+    def __init__(self, timeline):
+        records = timeline.records
+        self.pids = timeline.pids  # Index -> PID
+        self.proc = records['proc']
+        self.starts = records['start']
+        self.ends = records['end']
+
+    def __len__(self):
+        return len(self.proc)
+
+    def running_at(self, t):
+        i = bisect_right(self.starts, t) - 1
+        if i >= 0 and t < self.ends[i]:
+            return self.pids[self.proc[i]]
+        return None
+
+    def busy_time(self, t0, t1):
+        first = bisect_right(self.ends, t0)
+        last = bisect_left(self.starts, t1) - 1
+        if first > last:
+            return 0
+        total = 0
+        for i in range(first, last + 1, READ_CHUNK):
+            j = min(i + READ_CHUNK, last + 1)
+            total += int(self.ends[i:j].sum()) - int(self.starts[i:j].sum())
+        total -= max(0, t0 - int(self.starts[first]))
+        total -= max(0, int(self.ends[last]) - t1)
+        return total
+
+    def context_switches(self, t0, t1):
+        # Segment i is a switch when its PID differs from segment i - 1
+        a = max(bisect_left(self.starts, t0), 1)
+        b = bisect_left(self.starts, t1)
+        switches = 0
+        for i in range(a, b, READ_CHUNK):
+            j = min(i + READ_CHUNK, b)
+            switches += int((self.proc[i:j] != self.proc[i - 1:j - 1]).sum())
+        return switches
+
+    def intervals_for(self, pid):
+        import numpy as np
+        if pid not in self.pids:
+            return []
+        idx = self.pids.index(pid)
+        intervals = []
+        last = -2  # Record index of the previous interval's last segment
+        for i in range(0, len(self.proc), READ_CHUNK):
+            for k in np.flatnonzero(self.proc[i:i + READ_CHUNK] == idx).tolist():
+                start, end = int(self.starts[i + k]), int(self.ends[i + k])
+                # Back-to-back records of the same PID form one interval
+                if i + k == last + 1 and intervals[-1][1] == start:
+                    intervals[-1] = (intervals[-1][0], end)
+                else:
+                    intervals.append((start, end))
+                last = i + k
+        return intervals
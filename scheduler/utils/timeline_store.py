@@ -0,0 +1,298 @@
+# utils/timeline_store.py
+"""
+Compact Gantt logs. A TimelineStore keeps every segment as a reference to
+its PID plus start/end times in typed arrays (24 bytes per segment instead of
+a tuple of three objects), and can spill finished segments to a binary file
+as it goes. A TimelineFile memory-maps such a file, so multi-million-segment
+timelines can be rendered and analysed without loading them.
+Both behave like a read-only sequence of (pid, start, end) tuples, so the
+Gantt renderer, the timeline index and the statistics accept them unchanged.
+"""
+import operator
+import struct
+import sys
+from array import array
+from itertools import islice, repeat
+from bisect import bisect_right
+
+# File layout: header, fixed-width little-endian records, then the PID table
+# (one UTF-8 PID per line, in index order).
+# magic, format version, segment count, PID count
+HEADER = struct.Struct('<8sIQQ')
+MAGIC = b'GANTTBIN'
+VERSION = 1
+RECORD_FORMAT = [('proc', '<i4'), ('start', '<i8'), ('end', '<i8')]
+
+CHUNK_SEGMENTS = 1 << 20  # Segments kept in memory before a spill
+PACK_SEGMENTS = 8192      # Tail segments collected as tuples before they are packed into the arrays
+READ_CHUNK = 65536        # Segments decoded at a time when iterating a file
+
+def new_timeline(record_gantt):
+    """
+    Gantt log for a solve_* function: None when record_gantt is false, the
+    store itself when a TimelineStore is passed (e.g. one that spills to
+    disk), otherwise a new in-memory TimelineStore.
+    """
+    # Checked first: an empty store is falsy
+    if isinstance(record_gantt, TimelineStore):
+        return record_gantt
+    return TimelineStore() if record_gantt else None
+
+def _record_dtype():
+    import numpy as np
+    return np.dtype(RECORD_FORMAT)
+
+class PidTable(dict):
+    """PID -> index map that interns unknown PIDs on lookup (one C-level dict hit otherwise)."""
+    def __init__(self, pids):
+        super().__init__()
+        self.pids = pids
+
+    def __missing__(self, pid):
+        idx = self[pid] = len(self.pids)
+        self.pids.append(pid)
+        return idx
+
+class TimelineStore:
+    """
+    Array-backed Gantt log the engines append to directly.
+    The hot path is a plain list: engines append (pid, start, end) tuples to
+    `tail` and call pack() once it holds PACK_SEGMENTS of them, which moves
+    all but the last into the columns (the last stays so a merging engine can
+    still extend it). Packed segments keep a reference to their PID string
+    plus start/end in typed arrays; PIDs are only interned into indices when
+    the segments are written to a file or exported with columns().
+    With spill_path, all but the last segment are written to that file
+    whenever chunk_size segments are packed; call finish() after the run
+    to complete the file and get a TimelineFile over it.
+    """
+    def __init__(self, spill_path=None, chunk_size=CHUNK_SEGMENTS):
+        self.tail = []                   # Newest segments as (pid, start, end) tuples
+        self.names = []                  # PID of every packed segment
+        self.start = array('q')
+        self.end = array('q')
+        self.pids = []                   # Index -> PID, filled by _intern
+        self._index = PidTable(self.pids) # PID -> index
+        self.spill_path = spill_path
+        self.chunk_size = chunk_size
+        # Length at which pack() spills; never reached without a spill file
+        self._spill_at = chunk_size if spill_path is not None else sys.maxsize
+        self.spilled = 0
+        self._file = None
+
+    @classmethod
+    def from_columns(cls, pids, proc, start, end):
+        """Builds an in-memory store from a PID table and index/start/end arrays (typecodes 'i', 'q', 'q')."""
+        store = cls()
+        store.names = [pids[i] for i in proc]
+        store.start.extend(start)
+        store.end.extend(end)
+        return store
+
+    def add(self, pid, start, end):
+        tail = self.tail
+        tail.append((pid, start, end))
+        if len(tail) >= PACK_SEGMENTS:
+            self.pack()
+
+    def pack(self, keep=1):
+        """Moves all but the last `keep` tail segments into the columns."""
+        tail = self.tail
+        n = len(tail) - keep
+        if n <= 0:
+            return
+        chunk = tail[:n]
+        del tail[:n]
+        self.names.extend([seg[0] for seg in chunk])
+        self.start.extend(array('q', [seg[1] for seg in chunk]))
+        self.end.extend(array('q', [seg[2] for seg in chunk]))
+        if len(self.names) >= self._spill_at:
+            self._spill()
+
+    def add_merged(self, pid, start, end):
+        """Like add, but extends the last segment if the same process simply continues."""
+        tail = self.tail
+        if tail:
+            last = tail[-1]
+            if last[0] == pid and last[2] == start:
+                tail[-1] = (pid, last[1], end)
+                return
+        elif self.names and self.end[-1] == start and self.names[-1] == pid:
+            self.end[-1] = end
+            return
+        self.add(pid, start, end)
+
+    def add_slices(self, pid, start, count, length):
+        """Adds count back-to-back slices of the given length (Round Robin fast-forward)."""
+        self.pack(keep=0) # Keeps the segments in order
+        self.names.extend(repeat(pid, count))
+        self.start.extend(range(start, start + count * length, length))
+        self.end.extend(range(start + length, start + (count + 1) * length, length))
+        if len(self.names) >= self._spill_at:
+            self._spill()
+
+    def append(self, segment):
+        """List-style append of a (pid, start, end) tuple."""
+        self.add(*segment)
+
+    def extend(self, segments):
+        for pid, start, end in segments:
+            self.add(pid, start, end)
+
+    def _intern(self, names):
+        """PID index array for names, adding unseen PIDs to the table in order of first use."""
+        return array('i', map(self._index.__getitem__, names))
+
+    def _spill(self, keep=1):
+        # The last segment stays in memory so add_merged can still extend it
+        n = len(self.names) - keep
+        if n <= 0:
+            return
+        if self._file is None:
+            self._file = open(self.spill_path, 'wb')
+            self._file.write(HEADER.pack(MAGIC, VERSION, 0, 0))
+        import numpy as np
+        records = np.empty(n, dtype=_record_dtype())
+        records['proc'] = np.frombuffer(self._intern(self.names[:n]), dtype=np.int32)
+        records['start'] = np.frombuffer(self.start, dtype=np.int64, count=n)
+        records['end'] = np.frombuffer(self.end, dtype=np.int64, count=n)
+        self._file.write(records.tobytes())
+        self.spilled += n
+        del self.names[:n], self.start[:n], self.end[:n]
+
+    def save(self, path):
+        """Writes the whole (in-memory) timeline to path and returns a TimelineFile over it."""
+        if self.spilled:
+            raise ValueError("a spilling timeline is completed with finish()")
+        self.spill_path = path
+        self._spill_at = self.chunk_size
+        return self.finish()
+
+    def finish(self):
+        """Writes the remaining segments and the PID table, and returns a TimelineFile reader."""
+        if self.spill_path is None:
+            raise ValueError("this timeline has no spill file")
+        if self._file is None:
+            self._file = open(self.spill_path, 'wb')
+            self._file.write(HEADER.pack(MAGIC, VERSION, 0, 0))
+        self.pack(keep=0)
+        self._spill(keep=0)
+        self._file.write(''.join(pid + '\n' for pid in self.pids).encode('utf-8'))
+        # Patch the counts now that they are known
+        self._file.seek(0)
+        self._file.write(HEADER.pack(MAGIC, VERSION, self.spilled, len(self.pids)))
+        self._file.close()
+        self._file = None
+        return TimelineFile(self.spill_path)
+
+    def _check_in_memory(self):
+        # Readers only look at the columns, so the tail is packed first
+        if self.spilled:
+            raise ValueError("part of this timeline is on disk; read it through finish()")
+        self.pack(keep=0)
+
+    def columns(self):
+        """(pids, proc, start, end): a PID table and the index/start/end arrays, see from_columns."""
+        self._check_in_memory()
+        return self.pids, self._intern(self.names), self.start, self.end
+
+    def __len__(self):
+        return self.spilled + len(self.names) + len(self.tail)
+
+    def __iter__(self):
+        self._check_in_memory()
+        return zip(self.names, self.start, self.end)
+
+    def __getitem__(self, i):
+        self._check_in_memory()
+        return self.names[i], self.start[i], self.end[i]
+
+    def __eq__(self, other):
+        try:
+            return len(self) == len(other) and all(a == tuple(b) for a, b in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"TimelineStore({len(self)} segments)"
+
+    def context_switches(self):
+        """Times a different PID gains the CPU (see count_context_switches)."""
+        self._check_in_memory()
+        return sum(map(operator.ne, self.names, islice(self.names, 1, None)))
+
+    def end_time(self):
+        if self.tail:
+            return self.tail[-1][2]
+        return self.end[-1] if self.end else 0
+
+class TimelineFile:
+    """
+    Read-only, memory-mapped view of a timeline file written by TimelineStore.
+    Nothing but the header and the PID table is read up front; iterating
+    decodes READ_CHUNK records at a time, so memory stays flat for any size.
+    """
+    def __init__(self, path):
+        import numpy as np
+        self.path = path
+        with open(path, 'rb') as f:
+            raw = f.read(HEADER.size)
+            if len(raw) != HEADER.size:
+                raise ValueError(f"'{path}' is not a timeline file")
+            magic, version, count, pid_count = HEADER.unpack(raw)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"'{path}' is not a timeline file")
+            f.seek(HEADER.size + count * _record_dtype().itemsize)
+            self.pids = f.read().decode('utf-8').split('\n')[:pid_count]
+        if count:
+            self.records = np.memmap(path, dtype=_record_dtype(), mode='r', offset=HEADER.size, shape=(count,))
+        else:
+            self.records = np.empty(0, dtype=_record_dtype())
+
+    def __len__(self):
+        return len(self.records)
+
+    def _iter_range(self, first, last):
+        pids = self.pids
+        for i in range(first, last, READ_CHUNK):
+            chunk = self.records[i:min(i + READ_CHUNK, last)]
+            for idx, start, end in zip(chunk['proc'].tolist(), chunk['start'].tolist(), chunk['end'].tolist()):
+                yield pids[idx], start, end
+
+    def __iter__(self):
+        return self._iter_range(0, len(self.records))
+
+    def __getitem__(self, i):
+        idx, start, end = self.records[i].tolist()
+        return self.pids[idx], start, end
+
+    def iter_window(self, window):
+        """
+        Yields the segments overlapping window = (start, end), cut to it.
+        Segment ends never decrease, so the first one is found by binary search.
+        """
+        w_start, w_end = window
+        # bisect probes the mapped column in place; np.searchsorted would copy it first
+        first = bisect_right(self.records['end'], w_start)
+        for pid, start, end in self._iter_range(first, len(self.records)):
+            if start >= w_end:
+                break
+            yield pid, max(start, w_start), min(end, w_end)
+
+    def context_switches(self):
+        """Times a different PID gains the CPU, counted chunk by chunk."""
+        import numpy as np
+        switches = 0
+        previous = None
+        for i in range(0, len(self.records), READ_CHUNK):
+            proc = np.asarray(self.records['proc'][i:i + READ_CHUNK])
+            switches += int(np.count_nonzero(proc[1:] != proc[:-1]))
+            if previous is not None and proc[0] != previous:
+                switches += 1
+            previous = proc[-1]
+        return switches
+
+    def end_time(self):
+        return int(self.records['end'][-1]) if len(self.records) else 0
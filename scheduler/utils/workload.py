@@ -0,0 +1,176 @@
+# utils/workload.py
+from array import array
+import numpy as np
+from utils.process import Process
+
+def _column_attribute(view):
+    """Property that reads and writes one row of a column through its memoryview."""
+    def get(row):
+        return view[row]
+    def set(row, value):
+        view[row] = value
+    return property(get, set)
+
+class ProcessRow(int):
+    """
+    Process-like view of one row of a Workload. The solve_* functions read and
+    write its attributes as usual, but every value lives in the workload's
+    columns: nothing is stored per process, and a row object only exists
+    while a solver holds on to it. The view is just its row number (an int
+    subclass, so creating one is cheap); Workload.rows() makes a subclass
+    whose properties are bound to that workload's columns.
+    """
+    __slots__ = ()
+
+    def __repr__(self):
+        return f"Process(PID={self.pid}, Arr={self.arrival_time}, Burst={self.burst_time}, Prio={self.priority})"
+
+def _row_class(pids, views):
+    """Builds the ProcessRow subclass for one set of column memoryviews."""
+    start_view = views.pop('start_time')
+
+    # The start_time column uses -1 for "not started yet"
+    def get_start(row):
+        value = start_view[row]
+        return None if value == -1 else value
+    def set_start(row, value):
+        start_view[row] = -1 if value is None else value
+
+    namespace = {name: _column_attribute(view) for name, view in views.items()}
+    namespace['pid'] = property(pids.item)
+    namespace['start_time'] = property(get_start, set_start)
+    namespace['__slots__'] = ()
+    return type('ProcessRow', (ProcessRow,), namespace)
+
+class WorkloadRows:
+    """
+    The sequence a solver gets from Workload.rows(): indexing and iteration
+    yield ProcessRow views, and sort() (FCFS and RR sort their input) only
+    rearranges an array of row numbers, never the columns themselves.
+    """
+    def __init__(self, row_class, n):
+        self._row_class = row_class
+        self._rows = range(n)
+        self._order = None # Row number at each position, None = column order
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __getitem__(self, i):
+        # Indexing the range checks the bounds and handles negative indices
+        return self._row_class(self._rows[i] if self._order is None else self._order[i])
+
+    def __iter__(self):
+        return map(self._row_class, self._rows if self._order is None else self._order)
+
+    def sort(self, key, reverse=False):
+        """In-place stable sort by key(row), like list.sort."""
+        rows = self._rows if self._order is None else self._order
+        row_class = self._row_class
+        self._order = array('q', sorted(rows, key=lambda row: key(row_class(row)), reverse=reverse))
+
+class Workload:
+    """
+    Columnar (structure-of-arrays) representation of a process set.
+    Inputs and results live in contiguous typed NumPy arrays instead of one
+    Python object per process, which keeps very large traces compact and lets
+    the metrics be computed with vectorized array operations.
+    """
+    def __init__(self, pids, arrival_times, burst_times, priorities):
+        # Static columns from the input file
+        self.pid = np.asarray(pids, dtype=str)
+        self.arrival_time = np.asarray(arrival_times, dtype=np.int64)
+        self.burst_time = np.asarray(burst_times, dtype=np.int64)
+        self.priority = np.asarray(priorities, dtype=np.int64)
+
+        # Result columns, filled in after a simulation run (-1 = not started)
+        n = len(self.pid)
+        self.start_time = np.full(n, -1, dtype=np.int64)
+        self.completion_time = np.zeros(n, dtype=np.int64)
+        self.turnaround_time = np.zeros(n, dtype=np.int64)
+        self.waiting_time = np.zeros(n, dtype=np.int64)
+        self.response_time = np.zeros(n, dtype=np.int64)
+        self.remaining_time = np.zeros(n, dtype=np.int64) # Scratch column for the preemptive solvers
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __repr__(self):
+        return f"Workload(n={len(self)})"
+
+    @classmethod
+    def from_processes(cls, processes):
+        """Builds a columnar workload from a list of Process objects."""
+        return cls([p.pid for p in processes],
+                   [p.arrival_time for p in processes],
+                   [p.burst_time for p in processes],
+                   [p.priority for p in processes])
+
+    def to_processes(self):
+        """Materializes fresh Process objects (in column order) for the solve_* functions."""
+        return [Process(pid, arrival, burst, priority)
+                for pid, arrival, burst, priority in zip(self.pid.tolist(), self.arrival_time.tolist(),
+                                                         self.burst_time.tolist(), self.priority.tolist())]
+
+    def store_results(self, processes):
+        """
+        Copies start/completion times back from Process objects that are in
+        column order, then derives the remaining metrics column-wise.
+        """
+        self.start_time[:] = [-1 if p.start_time is None else p.start_time for p in processes]
+        self.completion_time[:] = [p.completion_time for p in processes]
+        self.compute_metrics()
+
+    def rows(self):
+        """
+        Clears the result columns and returns them, with the inputs, as a
+        sequence of ProcessRow views in column order: what a solve_* function
+        gets instead of a list of Process objects.
+        """
+        self.start_time.fill(-1)
+        for column in (self.completion_time, self.turnaround_time, self.waiting_time, self.response_time):
+            column.fill(0)
+        self.remaining_time[:] = self.burst_time
+        # memoryview items are plain Python ints and writes land in the arrays;
+        # the input columns are read-only
+        views = {name: memoryview(np.ascontiguousarray(getattr(self, name))).toreadonly()
+                 for name in ('arrival_time', 'burst_time', 'priority')}
+        views.update((name, memoryview(getattr(self, name)))
+                     for name in ('remaining_time', 'start_time', 'completion_time',
+                                  'turnaround_time', 'waiting_time', 'response_time'))
+        return WorkloadRows(_row_class(self.pid, views), len(self))
+
+    def run(self, solver, *args, **kwargs):
+        """
+        Adapter that runs an existing solve_* function directly on the columns:
+        the solver reads arrival/burst/priority from the arrays, keeps its
+        remaining times in a scratch column and writes every result straight
+        into the result columns, without building Process objects.
+        Returns the Gantt log.
+        """
+        _, gantt_log = solver(self.rows(), *args, **kwargs)
+        return gantt_log
+
+    def compute_metrics(self):
+        """
+        Vectorized version of the project formulas:
+        - Turnaround = Completion - Arrival
+        - Waiting = Turnaround - Burst
+        - Response = First Start - Arrival
+        """
+        np.subtract(self.completion_time, self.arrival_time, out=self.turnaround_time)
+        np.subtract(self.turnaround_time, self.burst_time, out=self.waiting_time)
+        np.subtract(self.start_time, self.arrival_time, out=self.response_time)
+
+    def average_metrics(self):
+        """Returns (avg_turnaround, avg_waiting, avg_response) like calculate_metrics."""
+        if len(self) == 0: return 0, 0, 0
+        return (float(self.turnaround_time.mean()),
+                float(self.waiting_time.mean()),
+                float(self.response_time.mean()))
+
+    def context_switches(self, gantt_log):
+        """Counts PID changes between consecutive Gantt segments with one array comparison."""
+        if not gantt_log: return 0
+        pids = np.array([segment[0] for segment in gantt_log], dtype=str)
+        return int(np.count_nonzero(pids[1:] != pids[:-1]))